@@ -4,12 +4,12 @@ Background Email Scheduler - Send emails when user is offline
 
 import threading
 import time
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import uuid
 from email_sender import email_sender
+from shared.json_io import read_json, write_json
 
 class EmailScheduler:
     def __init__(self):
@@ -22,16 +22,14 @@ class EmailScheduler:
         """Load scheduled emails from file"""
         if os.path.exists(self.scheduled_emails_file):
             try:
-                with open(self.scheduled_emails_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return read_json(self.scheduled_emails_file, [])
             except:
                 return []
         return []
     
     def save_scheduled_emails(self):
         """Save scheduled emails to file"""
-        with open(self.scheduled_emails_file, 'w', encoding='utf-8') as f:
-            json.dump(self.scheduled_emails, f, indent=2, ensure_ascii=False)
+        write_json(self.scheduled_emails_file, self.scheduled_emails, pretty=True)
     
     def schedule_campaign(self, campaign_name: str, recipients: List[Dict], 
                          subject: str, body: str, send_time: datetime, 
@@ -8,7 +8,6 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-import json
 import os
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -16,6 +15,7 @@ import uuid
 import time
 import threading
 from dotenv import load_dotenv
+from shared.json_io import read_json, write_json
 
 load_dotenv()
 
@@ -35,16 +35,14 @@ class EmailSender:
         """Load email tracking logs"""
         if os.path.exists(self.tracking_file):
             try:
-                with open(self.tracking_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return read_json(self.tracking_file, [])
             except:
                 return []
         return []
     
     def save_email_logs(self):
         """Save email tracking logs"""
-        with open(self.tracking_file, 'w', encoding='utf-8') as f:
-            json.dump(self.email_logs, f, indent=2, ensure_ascii=False)
+        write_json(self.tracking_file, self.email_logs, pretty=True)
     
     def send_email(self, recipient_email: str, recipient_name: str, subject: str, 
                    body: str, campaign_id: str = None) -> Dict[str, Any]:
@@ -4,11 +4,11 @@ Stores and manages leads with advanced features
 """
 
 import pandas as pd
-import json
 import os
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import uuid
+from shared.json_io import read_json, write_json
 
 class LeadDatabase:
     def __init__(self, db_file: str = "leads_database.json"):
@@ -19,16 +19,14 @@ class LeadDatabase:
         """Load leads from database file"""
         if os.path.exists(self.db_file):
             try:
-                with open(self.db_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return read_json(self.db_file, [])
             except:
                 return []
         return []
     
     def save_leads(self):
         """Save leads to database file"""
-        with open(self.db_file, 'w', encoding='utf-8') as f:
-            json.dump(self.leads, f, indent=2, ensure_ascii=False)
+        write_json(self.db_file, self.leads, pretty=True)
     
     def add_lead(self, lead_data: Dict) -> str:
         """Add a new lead to database"""
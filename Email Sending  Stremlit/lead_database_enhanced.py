@@ -11,7 +11,13 @@ from datetime import datetime
 import logging
 from dataclasses import dataclass
 
+from shared.normalization import get_normalizer
+
 logger = logging.getLogger(__name__)
+normalizer = get_normalizer()
+
+# Stored in PRAGMA user_version; bump when _generate_hash changes so stored hashes are recomputed
+HASH_VERSION = 1
 
 @dataclass
 class LeadRecord:
@@ -66,13 +72,6 @@ class LeadDatabase:
                     )
                 """)
                 
-                # Add unique constraints after table creation
-                try:
-                    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_name_address ON leads(name_hash, address_hash)")
-                    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_email_phone ON leads(email_hash, phone_hash)")
-                except sqlite3.OperationalError as e:
-                    logger.warning(f"Could not create unique constraints: {e}")
-                
                 # Create deduplication log table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS deduplication_log (
@@ -86,6 +85,16 @@ class LeadDatabase:
                     )
                 """)
                 
+                # Recompute hashes written by an older _generate_hash
+                self._migrate_hashes(cursor)
+                
+                # Add unique constraints after table creation
+                try:
+                    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_name_address ON leads(name_hash, address_hash)")
+                    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_email_phone ON leads(email_hash, phone_hash)")
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"Could not create unique constraints: {e}")
+                
                 conn.commit()
                 
                 # Create indexes for better performance (after table creation)
@@ -108,11 +117,71 @@ class LeadDatabase:
             logger.error(f"Error initializing database: {e}")
             raise
     
-    def _generate_hash(self, text: str) -> str:
-        """Generate hash for text (used for deduplication)"""
+    def _migrate_hashes(self, cursor):
+        """Recompute name, address and phone hashes of a database with an older HASH_VERSION
+        
+        Rows that become duplicates under the new hashes are removed (keeping the
+        oldest, as cleanup_duplicates does) so the unique indexes can be rebuilt.
+        """
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= HASH_VERSION:
+            return
+        
+        cursor.execute("DROP INDEX IF EXISTS idx_unique_name_address")
+        cursor.execute("DROP INDEX IF EXISTS idx_unique_email_phone")
+        
+        rows = cursor.execute("SELECT id, name, address, phone FROM leads").fetchall()
+        cursor.executemany(
+            "UPDATE leads SET name_hash = ?, address_hash = ?, phone_hash = ? WHERE id = ?",
+            [
+                (self._generate_hash(name, "name"), self._generate_hash(address, "address"),
+                 self._generate_hash(phone, "phone"), lead_id)
+                for lead_id, name, address, phone in rows
+            ]
+        )
+        
+        cursor.execute("""
+            DELETE FROM leads WHERE id NOT IN (
+                SELECT MIN(id) FROM leads GROUP BY name_hash, address_hash
+            )
+        """)
+        removed = cursor.rowcount
+        cursor.execute("""
+            DELETE FROM leads WHERE id NOT IN (
+                SELECT MIN(id) FROM leads GROUP BY email_hash, phone_hash
+            )
+        """)
+        removed += cursor.rowcount
+        
+        if rows:
+            cursor.execute("""
+                INSERT INTO deduplication_log (
+                    operation_type, total_leads, duplicates_found, 
+                    duplicates_removed, final_count
+                ) VALUES (?, ?, ?, ?, ?)
+            """, ('rehash_migration', len(rows), removed, removed, len(rows) - removed))
+            logger.info(f"Recomputed hashes of {len(rows)} leads, removed {removed} duplicates")
+        
+        cursor.execute(f"PRAGMA user_version = {HASH_VERSION}")
+    
+    def _generate_hash(self, text: str, field: str = "") -> str:
+        """Generate hash for text (used for deduplication)
+        
+        name, address and phone fields are hashed in their canonical form
+        (see shared/normalization.py) so formatting differences don't hide duplicates.
+        """
+        if not text:
+            return ""
+        if field == "name":
+            text = normalizer.name(text)
+        elif field == "address":
+            text = normalizer.address(text)
+        elif field == "phone":
+            text = normalizer.phone(text)
+        text = text.lower().strip()
         if not text:
             return ""
-        return hashlib.md5(text.lower().strip().encode()).hexdigest()
+        return hashlib.md5(text.encode()).hexdigest()
     
     def _prepare_lead_data(self, lead_data: Dict) -> LeadRecord:
         """Prepare lead data for database insertion"""
@@ -157,10 +226,10 @@ class LeadDatabase:
                         lead = self._prepare_lead_data(lead_data)
                         
                         # Generate hashes for deduplication
-                        name_hash = self._generate_hash(lead.name)
-                        address_hash = self._generate_hash(lead.address)
+                        name_hash = self._generate_hash(lead.name, "name")
+                        address_hash = self._generate_hash(lead.address, "address")
                         email_hash = self._generate_hash(lead.email)
-                        phone_hash = self._generate_hash(lead.phone)
+                        phone_hash = self._generate_hash(lead.phone, "phone")
                         
                         # Check for duplicates
                         is_duplicate = self._check_duplicate(
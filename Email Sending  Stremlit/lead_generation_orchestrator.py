@@ -12,7 +12,7 @@ import logging
 from tqdm import tqdm
 
 from scrapers import GoogleMapsScraper
-from lead_database_enhanced import LeadDatabase
+from lead_database_enhanced import LeadDatabase, normalizer
 
 logger = logging.getLogger(__name__)
 
@@ -207,21 +207,26 @@ class LeadGenerationOrchestrator:
             # Create unique identifier based on multiple fields
             identifier_parts = []
             
+            # Canonical forms, so "Main St" / "Main Street" or two phone formats match
+            name = normalizer.name(lead.name)
+            address = normalizer.address(lead.address)
+            phone = normalizer.phone(lead.phone or '')
+            
             # Use name + address as primary identifier
-            if lead.name and lead.address:
-                identifier_parts.append(f"{lead.name.lower().strip()}|{lead.address.lower().strip()}")
+            if name and address:
+                identifier_parts.append(f"{name}|{address}")
             
             # Use email + phone as secondary identifier
-            if lead.email and lead.phone:
-                identifier_parts.append(f"{lead.email.lower().strip()}|{lead.phone.strip()}")
+            if lead.email and phone:
+                identifier_parts.append(f"{lead.email.lower().strip()}|{phone}")
             
             # Use email only if available
             elif lead.email:
                 identifier_parts.append(f"email|{lead.email.lower().strip()}")
             
             # Use phone only if available
-            elif lead.phone:
-                identifier_parts.append(f"phone|{lead.phone.strip()}")
+            elif phone:
+                identifier_parts.append(f"phone|{phone}")
             
             # Check if this lead is unique
             is_unique = True
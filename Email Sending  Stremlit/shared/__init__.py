@@ -0,0 +1,13 @@
+"""
+Modules shared with the lead scraper at the repository root.
+
+The email app is also deployed on its own (see DEPLOYMENT.md), without the
+rest of the repository, so it carries copies of the root modules it uses:
+
+    json_io.py         ../json_io.py
+    normalization.py   ../normalization.py
+
+The copies are byte-identical to the originals. Edit the root module, then
+run `python shared/sync.py` from this app's directory to refresh them;
+`python shared/sync.py --check` fails if any copy is out of date.
+"""
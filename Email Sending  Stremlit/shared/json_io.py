@@ -0,0 +1,217 @@
+"""
+Shared JSON serialization.
+
+Uses orjson when it is installed and the standard library json module
+otherwise; both produce the same documents (NaN and infinities, which JSON
+cannot represent, are written as null by either). Output is compact by default,
+which is what exports, logs and stores that programs read want; pass
+pretty=True for files people read (indented by 2 spaces).
+
+    dumps / loads          bytes <-> objects
+    write_json / read_json whole files (written atomically)
+    ArrayWriter            a JSON array written one item at a time
+
+Values JSON has no type for (datetimes, Decimals, ...) are written as
+str(value), and non-string keys as strings, as json.dumps(default=str)
+did before.
+"""
+
+import io
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, TextIO, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    # Datetimes go through default=str like with the json module (orjson would write isoformat)
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY
+
+# Built once: json.dumps() with arguments creates an encoder per call
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, allow_nan=False, default=str)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, allow_nan=False, default=str)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON.
+    
+    Args:
+        obj: Object to serialize
+        pretty: Indent by 2 spaces instead of writing compact JSON
+    
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0))
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the json module handles them
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    try:
+        return encoder.encode(obj).encode('utf-8')
+    except ValueError as e:
+        if 'Out of range float' not in str(e):
+            raise
+        # NaN or infinity somewhere: write null like orjson
+        return encoder.encode(_finite(obj)).encode('utf-8')
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of obj with NaN and infinities replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path, obj: Any, pretty: bool = False):
+    """
+    Write an object to a JSON file.
+    
+    The document goes to a temporary file that then replaces path, so
+    readers never see a half-written file.
+    
+    Args:
+        path: File path
+        obj: Object to serialize
+        pretty: Indent by 2 spaces instead of writing compact JSON
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(obj, pretty))
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def read_json(path, default: Any = None) -> Any:
+    """
+    Read a JSON file.
+    
+    Args:
+        path: File path
+        default: Returned if the file does not exist
+    
+    Returns:
+        Parsed document, or default
+    """
+    try:
+        with open(path, 'rb') as f:
+            return loads(f.read())
+    except FileNotFoundError:
+        return default
+
+
+class ArrayWriter:
+    """
+    Writes a JSON array item by item, without holding the whole document.
+    
+    The file can be binary or text (e.g. from compressed_files.open_text()).
+    With pretty=True the output equals json.dump(items, f, indent=2).
+    """
+    
+    def __init__(self, f: Union[BinaryIO, TextIO], pretty: bool = False):
+        """
+        Start the array.
+        
+        Args:
+            f: Open file to write to (left open by close())
+            pretty: Indent by 2 spaces instead of writing compact JSON
+        """
+        self.pretty = pretty
+        self.count = 0
+        if isinstance(f, io.TextIOBase):
+            self._write = lambda data: f.write(data.decode('utf-8'))
+        else:
+            self._write = f.write
+        self._closed = False
+        self._write(b'[')
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def write(self, item: Any):
+        """Append one item."""
+        self.write_many((item,))
+    
+    def write_many(self, items: Iterable[Any], chunk_size: int = 1000) -> int:
+        """
+        Append every item of an iterable, serializing chunk_size items per write.
+        
+        Args:
+            items: Items (any iterator; consumed lazily)
+            chunk_size: Items joined into one write
+        
+        Returns:
+            Number of items written
+        """
+        written = 0
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                written += self._write_chunk(chunk)
+                chunk = []
+        if chunk:
+            written += self._write_chunk(chunk)
+        return written
+    
+    def close(self):
+        """End the array (the file itself stays open)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.pretty and self.count:
+            self._write(b'\n]')
+        else:
+            self._write(b']')
+    
+    def _write_chunk(self, chunk: list) -> int:
+        # The chunk is serialized as one array whose brackets are dropped
+        # (pretty: "[\n  a,\n  b\n]" -> "\n  a,\n  b")
+        data = dumps(chunk, self.pretty)
+        data = data[1:-2] if self.pretty else data[1:-1]
+        self._write(b',' + data if self.count else data)
+        self.count += len(chunk)
+        return len(chunk)
+
+
+def write_array(f: Union[BinaryIO, TextIO], items: Iterable[Any], pretty: bool = False) -> int:
+    """
+    Write an iterable as a JSON array.
+    
+    Args:
+        f: Open binary or text file
+        items: Items (any iterator; consumed lazily)
+        pretty: Indent by 2 spaces instead of writing compact JSON
+    
+    Returns:
+        Number of items written
+    """
+    with ArrayWriter(f, pretty) as writer:
+        return writer.write_many(items)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Refresh the copies in shared/ from the repository root.
+
+Usage:
+    python shared/sync.py           copy every shared module
+    python shared/sync.py --check   exit 1 if a copy differs from its original
+"""
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+SHARED_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SHARED_DIR.parent.parent
+
+MODULES = ['json_io.py', 'normalization.py']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='Only report copies that are out of date')
+    args = parser.parse_args()
+    
+    stale = []
+    for name in MODULES:
+        original, copy = ROOT_DIR / name, SHARED_DIR / name
+        if not original.exists():
+            sys.exit(f"{original} not found; run this from a full checkout of the repository")
+        if copy.exists() and copy.read_bytes() == original.read_bytes():
+            continue
+        stale.append(name)
+        if not args.check:
+            shutil.copyfile(original, copy)
+            print(f"Updated shared/{name}")
+    
+    if args.check and stale:
+        sys.exit(f"Out of date: {', '.join(stale)} (run python shared/sync.py)")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from datetime import datetime
 import random
 
+from maps_payload import extract_business_entities
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -106,12 +108,20 @@ class AdvancedGoogleMapsScraper:
         # Look for business data in the HTML
         # Google Maps embeds JSON data in the page
         try:
-            # Find the data section
-            data_match = re.search(r'window\.APP_INITIALIZATION_STATE.*?(\[.*?\]);', html_content, re.DOTALL)
-            if data_match:
-                data_json = json.loads(data_match.group(1))
-                # Parse the business data from the JSON structure
-                leads = self._parse_business_data(data_json, search_url)
+            # Decode only the business objects when the payload can be sliced
+            entities = extract_business_entities(html_content)
+            if entities is not None:
+                for biz_data in entities:
+                    lead = self._create_lead_from_data(biz_data, search_url)
+                    if lead:
+                        leads.append(lead)
+            else:
+                # Find the data section
+                data_match = re.search(r'window\.APP_INITIALIZATION_STATE.*?(\[.*?\]);', html_content, re.DOTALL)
+                if data_match:
+                    data_json = json.loads(data_match.group(1))
+                    # Parse the business data from the JSON structure
+                    leads = self._parse_business_data(data_json, search_url)
         except Exception as e:
             logger.warning(f"Could not parse JSON data: {e}")
         
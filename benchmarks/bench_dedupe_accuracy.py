@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark: speed, memory and accuracy of each deduplication strategy.
+
+Generates dirty leads with known duplicates (see synthetic_leads.py) and
+groups them with every strategy:
+
+    exhaustive  every lead against every cluster (no blocking)
+    blocking    phone / name / address / grid-cell blocking (the default)
+    minhash     MinHash LSH candidates instead of token blocking
+    parallel    parallel_dedupe.dedupe_file() over a JSONL copy
+
+For each size and strategy it reports leads/second, peak traced memory
+(measured in a second, untimed run with tracemalloc) and pairwise
+precision, recall and F1 against the generated entity_ids.
+
+Usage:
+    python benchmarks/bench_dedupe_accuracy.py
+    python benchmarks/bench_dedupe_accuracy.py --sizes 2000 20000 --strategies blocking minhash --noise 2
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from dedupe import Deduplicator  # noqa: E402
+from parallel_dedupe import dedupe_file  # noqa: E402
+from synthetic_leads import Noise, generate_leads  # noqa: E402
+
+STRATEGIES = {
+    'exhaustive': {'blocking': False},
+    'blocking': {},
+    'minhash': {'minhash': True},
+    'parallel': {},
+}
+
+
+def make_config(overrides: Dict):
+    return SimpleNamespace(deduplication={
+        'fuzzy_threshold': 0.85,
+        'prefer_place_id': True,
+        'blocking': True,
+        'similarity_backend': 'auto',
+        **overrides,
+    })
+
+
+def cluster_labels(strategy: str, leads: List[Dict], workers: int) -> List[int]:
+    """Group the leads with one strategy and return a cluster label per lead."""
+    config = make_config(STRATEGIES[strategy])
+    
+    if strategy != 'parallel':
+        labels = [0] * len(leads)
+        for label, members in enumerate(Deduplicator(config).groups(leads)):
+            for member in members:
+                labels[member] = label
+        return labels
+    
+    with tempfile.TemporaryDirectory(prefix='bench-accuracy-') as directory:
+        source = Path(directory) / 'leads.jsonl'
+        output = Path(directory) / 'clusters.jsonl'
+        with open(source, 'w', encoding='utf-8') as f:
+            for lead in leads:
+                f.write(json.dumps(lead) + '\n')
+        dedupe_file(str(source), str(output), config, workers=workers, keep_all=True)
+        with open(output, encoding='utf-8') as f:
+            return [json.loads(line)['cluster_id'] for line in f]
+
+
+def pair_scores(predicted: List[int], truth: List[int]) -> Tuple[float, float]:
+    """Pairwise precision and recall of predicted clusters against true entities."""
+    def pairs(sizes):
+        return sum(size * (size - 1) // 2 for size in sizes)
+    
+    found = pairs(Counter(predicted).values())
+    expected = pairs(Counter(truth).values())
+    correct = pairs(Counter(zip(predicted, truth)).values())
+    return (correct / found if found else 1.0), (correct / expected if expected else 1.0)
+
+
+def peak_memory_mb(strategy: str, leads: List[Dict]) -> float:
+    """Peak memory traced by tracemalloc while one strategy runs in this process."""
+    tracemalloc.start()
+    try:
+        cluster_labels(strategy, leads, workers=1)
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--strategies', nargs='+', choices=list(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument('--duplicate-rate', type=float, default=0.3)
+    parser.add_argument('--noise', type=float, default=1.0, help='Scale every noise probability')
+    parser.add_argument('--exhaustive-limit', type=int, default=10000,
+                        help='Skip the exhaustive strategy above this many leads')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Workers for parallel')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc run')
+    args = parser.parse_args()
+    
+    print(f"{'leads':>8} {'strategy':<11} {'clusters':>9} {'seconds':>8} {'leads/s':>9} "
+          f"{'peak MB':>8} {'precision':>10} {'recall':>7} {'F1':>6}")
+    for size in args.sizes:
+        leads = generate_leads(size, args.duplicate_rate, Noise.scaled(args.noise))
+        truth = [lead['entity_id'] for lead in leads]
+        
+        for strategy in args.strategies:
+            if strategy == 'exhaustive' and size > args.exhaustive_limit:
+                continue
+            
+            start = time.perf_counter()
+            labels = cluster_labels(strategy, leads, args.workers)
+            seconds = time.perf_counter() - start
+            
+            precision, recall = pair_scores(labels, truth)
+            f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+            memory = 'n/a' if args.no_memory else f"{peak_memory_mb(strategy, leads):.1f}"
+            print(
+                f"{size:>8} {strategy:<11} {len(set(labels)):>9} {seconds:>8.2f} {size / seconds:>9,.0f} "
+                f"{memory:>8} {precision:>10.3f} {recall:>7.3f} {f1:>6.3f}"
+            )
+        print(f"{size:>8} {'truth':<11} {len(set(truth)):>9}")
+
+
+if __name__ == '__main__':
+    main()
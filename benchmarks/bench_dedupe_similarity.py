@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Deduplicator fuzzy matching with each similarity backend.
+
+Generates synthetic dirty leads (see synthetic_leads.py) and deduplicates
+them with the difflib, NumPy and rapidfuzz backends, reporting leads/second
+and whether each backend kept exactly the same leads as difflib.
+
+Usage:
+    python benchmarks/bench_dedupe_similarity.py
+    python benchmarks/bench_dedupe_similarity.py --sizes 1000 10000 --backends numpy rapidfuzz
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from dedupe import Deduplicator  # noqa: E402
+from similarity import BACKENDS, NUMPY_AVAILABLE, RAPIDFUZZ_AVAILABLE  # noqa: E402
+from synthetic_leads import generate_leads  # noqa: E402
+
+def make_config(backend: str):
+    return SimpleNamespace(deduplication={
+        'fuzzy_threshold': 0.85,
+        'prefer_place_id': True,
+        'blocking': True,
+        'similarity_backend': backend,
+    })
+
+
+def main():
+    available = ['difflib'] + (['numpy'] if NUMPY_AVAILABLE else []) + (['rapidfuzz'] if RAPIDFUZZ_AVAILABLE else [])
+    
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS), default=available)
+    parser.add_argument('--duplicate-rate', type=float, default=0.3)
+    args = parser.parse_args()
+    
+    print(f"{'leads':>8} {'backend':<10} {'unique':>8} {'seconds':>9} {'leads/s':>10} {'same as difflib':>16}")
+    for size in args.sizes:
+        leads = generate_leads(size, args.duplicate_rate)
+        reference = None
+        
+        for backend in args.backends:
+            deduplicator = Deduplicator(make_config(backend))
+            start = time.perf_counter()
+            unique = deduplicator.deduplicate(leads)
+            seconds = time.perf_counter() - start
+            
+            kept = [id(lead) for lead in unique]
+            if backend == 'difflib':
+                reference = kept
+            same = 'n/a' if reference is None else ('yes' if kept == reference else 'NO')
+            print(f"{size:>8} {backend:<10} {len(unique):>8} {seconds:>9.2f} {size / seconds:>10,.0f} {same:>16}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DataExporter.export_report() over several formats.
+
+Exports synthetic leads (see synthetic_leads.py) to every requested format
+once with the formats written one after another and once with one thread
+per format (export.parallel_formats), and prints the time spent
+normalizing the leads into the shared LeadTable, each format's time and
+the total.
+
+Usage:
+    python benchmarks/bench_export_formats.py
+    python benchmarks/bench_export_formats.py --rows 20000 --formats csv json sqlite
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from exporter import PYARROW_AVAILABLE, DataExporter  # noqa: E402
+from synthetic_leads import generate_leads  # noqa: E402
+
+
+def main():
+    formats = ['csv', 'json', 'sqlite', 'excel'] + (['parquet'] if PYARROW_AVAILABLE else [])
+    
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--formats', nargs='+', default=formats)
+    args = parser.parse_args()
+    
+    leads = generate_leads(args.rows)
+    for index, lead in enumerate(leads):
+        lead.update(rating=round(3 + index % 20 / 10, 1), reviews=index % 500, category='Cafe',
+                    website=f"https://example.com/{index}", labels=['new'])
+    
+    print(f"{'mode':<11} {'normalize':>10} " + ' '.join(f"{fmt:>8}" for fmt in args.formats) + f" {'total':>8}")
+    for parallel in (False, True):
+        config = SimpleNamespace(export={'parallel_formats': parallel}, deduplication={})
+        with tempfile.TemporaryDirectory(prefix='bench-export-') as directory:
+            report = DataExporter(config, output_dir=directory).export_report(leads, args.formats, 'leads')
+        print(
+            f"{'threads' if parallel else 'sequential':<11} {report.prepare:>9.2f}s "
+            + ' '.join(f"{report.timings.get(fmt, 0):>7.2f}s" for fmt in args.formats)
+            + f" {report.elapsed:>7.2f}s"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON files written with json_io vs json.dump(indent=2).
+
+Writes and reads back the JSON files the app keeps, with synthetic
+records of each file's shape:
+
+    leads export     DataExporter._export_json() (json_io.write_array)
+    email log        email_sender.save_email_logs() (email_tracking.json)
+    scheduled        email_scheduler.save_scheduled_emails() (scheduled_emails.json)
+    lead database    lead_database.save_leads() (leads_database.json)
+
+Each file is written three ways: the previous json.dump(indent=2), and
+json_io compact and pretty. json_io uses orjson when it is installed;
+run once with and once without it to compare both backends.
+
+Usage:
+    python benchmarks/bench_json_io.py
+    python benchmarks/bench_json_io.py --rows 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from json_io import ORJSON_AVAILABLE, read_json, write_array, write_json  # noqa: E402
+from synthetic_leads import generate_leads  # noqa: E402
+
+
+def email_logs(count: int):
+    now = datetime.now().isoformat()
+    return [{
+        'id': str(uuid.uuid4()), 'campaign_id': f"campaign-{index % 50}",
+        'recipient_email': f"owner{index}@example.com", 'recipient_name': f"Owner {index}",
+        'subject': 'Quick question about your listing', 'body': 'Hi there,\n\nWe help local businesses. ' * 4,
+        'sender_email': 'sales@example.com', 'sender_name': 'LeadAI Pro', 'status': 'sent',
+        'sent_at': now, 'delivered_at': None, 'opened_at': None, 'clicked_at': None, 'replied_at': None,
+        'bounced_at': None, 'error_message': None, 'created_at': now, 'updated_at': now,
+    } for index in range(count)]
+
+
+def scheduled_emails(count: int):
+    now = datetime.now().isoformat()
+    return [{
+        'id': str(uuid.uuid4()), 'campaign_name': f"Campaign {index}",
+        'recipients': [{'email': f"owner{index}-{n}@example.com", 'name': f"Owner {n}"} for n in range(3)],
+        'subject': 'Quick question about your listing', 'body': 'Hi there,\n\nWe help local businesses. ' * 4,
+        'send_time': now, 'delay_seconds': 20, 'status': 'scheduled', 'created_at': now, 'total_emails': 3,
+    } for index in range(count)]
+
+
+def lead_database(count: int):
+    now = datetime.now().isoformat()
+    return [{
+        'id': str(uuid.uuid4()), 'name': f"Owner {index}", 'email': f"owner{index}@example.com",
+        'company': f"Business {index}", 'phone': f"+1 555 {index:07d}", 'title': 'Owner', 'industry': 'Food',
+        'source': 'maps', 'category': 'General', 'score': index % 100, 'status': 'New', 'tags': ['cafe', 'nyc'],
+        'notes': '', 'created_at': now, 'updated_at': now, 'last_contact': None, 'email_sent': 0,
+        'email_opened': 0, 'email_clicked': 0, 'converted': False,
+    } for index in range(count)]
+
+
+def dump_indented(path: Path, records):
+    """The previous writer of every file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+
+
+def load_stdlib(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_stream(path: Path, records, pretty: bool = False):
+    with open(path, 'wb') as f:
+        write_array(f, records, pretty)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+    
+    datasets = {
+        'leads export': generate_leads(args.rows),
+        'email log': email_logs(args.rows),
+        'scheduled': scheduled_emails(args.rows),
+        'lead database': lead_database(args.rows),
+    }
+    
+    print(f"json_io backend: {'orjson' if ORJSON_AVAILABLE else 'json module'}, {args.rows:,} records per file")
+    print(f"{'file':<14} {'writer':<16} {'write':>8} {'read':>8} {'MB':>8}")
+    with tempfile.TemporaryDirectory(prefix='bench-json-') as directory:
+        for name, records in datasets.items():
+            path = Path(directory) / 'records.json'
+            if name == 'leads export':
+                writers = (('json indent=2', dump_indented), ('json_io compact', write_stream),
+                           ('json_io pretty', lambda p, r: write_stream(p, r, True)))
+            else:
+                writers = (('json indent=2', dump_indented), ('json_io compact', write_json),
+                           ('json_io pretty', lambda p, r: write_json(p, r, True)))
+            
+            for writer_name, write in writers:
+                start = time.perf_counter()
+                write(path, records)
+                written = time.perf_counter() - start
+                
+                start = time.perf_counter()
+                loaded = load_stdlib(path) if writer_name == 'json indent=2' else read_json(path)
+                read = time.perf_counter() - start
+                assert len(loaded) == len(records)
+                
+                print(f"{name:<14} {writer_name:<16} {written:>7.2f}s {read:>7.2f}s "
+                      f"{os.path.getsize(path) / 1e6:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: searching a SQLite export with LIKE vs the FTS5 index.
+
+Exports synthetic leads (see synthetic_leads.py) once without and once
+with export.sqlite_fts, then runs the same searches as
+
+    LIKE    every word must appear in name, category, address or website
+            (WHERE (name LIKE '%w%' OR ...) AND ..., LIMIT 20)
+    FTS5    LeadSearch.search(): every word must match, ranked by BM25
+
+and prints the export times and each search's time and result count.
+
+Usage:
+    python benchmarks/bench_lead_search.py
+    python benchmarks/bench_lead_search.py --rows 1000000
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from exporter import DataExporter  # noqa: E402
+from lead_search import FTS_COLUMNS, WORD, LeadSearch  # noqa: E402
+from lead_table import LeadTable  # noqa: E402
+from synthetic_leads import KINDS, generate_leads  # noqa: E402
+
+QUERIES = ['sushi', 'golden pizza', 'khan dental lahore', 'harbor coffee house new york', 'zzz']
+
+
+def like_search(conn: sqlite3.Connection, text: str, limit: int = 20) -> list:
+    """What users ran before: a LIKE scan over the searched columns."""
+    words = WORD.findall(text)
+    where = ' AND '.join('(' + ' OR '.join(f"{column} LIKE ?" for column in FTS_COLUMNS) + ')' for _ in words)
+    params = [f"%{word}%" for word in words for _ in FTS_COLUMNS]
+    return conn.execute(f'SELECT name, address FROM leads WHERE {where} LIMIT ?', params + [limit]).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per search (the best is shown)')
+    args = parser.parse_args()
+    
+    leads = generate_leads(args.rows)
+    for index, lead in enumerate(leads):
+        lead.update(category=next((kind for kind in KINDS if kind.lower() in lead['name'].lower()), 'Other'),
+                    website=f"https://example.com/{index}")
+    table = LeadTable(leads)
+    
+    with tempfile.TemporaryDirectory(prefix='bench-search-') as directory:
+        paths = {}
+        for fts in (False, True):
+            config = SimpleNamespace(export={'sqlite_table_name': 'leads', 'sqlite_fts': fts}, deduplication={})
+            start = time.perf_counter()
+            paths[fts] = DataExporter(config, output_dir=directory)._export_sqlite(table, f"fts_{fts}")
+            print(f"export {'with' if fts else 'without'} FTS5: {time.perf_counter() - start:.2f}s")
+        
+        conn = sqlite3.connect(paths[False])
+        search = LeadSearch(paths[True])
+        print(f"\n{'search':<30} {'LIKE':>10} {'rows':>5} {'FTS5':>10} {'rows':>5}")
+        # Plus the house number and street of one lead
+        for text in QUERIES + [' '.join(leads[len(leads) // 2]['address'].split()[:2])]:
+            timings = {}
+            for name, run in (('like', lambda: like_search(conn, text)), ('fts', lambda: search.search(text))):
+                best = float('inf')
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    results = run()
+                    best = min(best, time.perf_counter() - start)
+                timings[name] = (best, len(results))
+            print(f"{text:<30} {timings['like'][0] * 1000:>8.1f}ms {timings['like'][1]:>5} "
+                  f"{timings['fts'][0] * 1000:>8.1f}ms {timings['fts'][1]:>5}")
+        search.close()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: targeted APP_INITIALIZATION_STATE extraction vs the recursive walk.
+
+Measures parse time and peak memory (tracemalloc) of
+``maps_payload.extract_business_entities`` against decoding the full payload
+and walking it with ``AdvancedGoogleMapsScraper._find_business_entities``.
+
+Usage:
+    python benchmarks/bench_maps_payload.py saved_page1.html saved_page2.html
+    python benchmarks/bench_maps_payload.py --synthetic-mb 8
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from maps_payload import extract_business_entities  # noqa: E402
+
+
+def synthetic_page(target_mb: float, businesses: int = 200, seed: int = 7) -> str:
+    """Build a search page with a payload of roughly target_mb megabytes."""
+    rng = random.Random(seed)
+    
+    def filler(depth=0):
+        if depth > 3 or rng.random() < 0.3:
+            return rng.choice([rng.random(), rng.randint(0, 10**6), 'x' * rng.randint(1, 40), None])
+        return [filler(depth + 1) for _ in range(rng.randint(1, 6))]
+    
+    chunks = []
+    size = 0
+    target = int(target_mb * 1024 * 1024)
+    while size < target:
+        chunk = json.dumps([filler() for _ in range(50)])
+        chunks.append(chunk)
+        size += len(chunk)
+    
+    for i in range(businesses):
+        business = json.dumps([None, [{
+            'title': f'Business {i}',
+            'address': f'{i} Main St',
+            'phone': f'+1 555 {i:04d}',
+            'rating': round(rng.uniform(1, 5), 1),
+            'meta': {'tags': ['a', 'b'], 'hours': [[9, 17]] * 7}
+        }], 0])
+        chunks.insert(rng.randint(0, len(chunks)), business)
+    
+    payload = '[' + ','.join(chunks) + ']'
+    return f'<html><script>window.APP_INITIALIZATION_STATE={payload};</script></html>'
+
+
+def recursive_walk(html: str):
+    """The original path: regex, full json.loads, then the recursive walk."""
+    from advanced_google_maps_scraper import AdvancedGoogleMapsScraper
+    
+    scraper = AdvancedGoogleMapsScraper.__new__(AdvancedGoogleMapsScraper)
+    data_match = re.search(r'window\.APP_INITIALIZATION_STATE.*?(\[.*?\]);', html, re.DOTALL)
+    data_json = json.loads(data_match.group(1))
+    
+    entities = []
+    for item in data_json:
+        if isinstance(item, list) and len(item) > 2:
+            entities.extend(scraper._find_business_entities(item))
+    return entities
+
+
+def measure(func, html, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(html)
+        best = min(best, time.perf_counter() - start)
+    
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pages', nargs='*', help='Saved Google Maps search page HTML files')
+    parser.add_argument('--synthetic-mb', type=float, default=4.0,
+                        help='Size of the synthetic payload when no pages are given (default: 4)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    if args.pages:
+        samples = [(p, Path(p).read_text(encoding='utf-8', errors='replace')) for p in args.pages]
+    else:
+        samples = [(f'synthetic {args.synthetic_mb}MB', synthetic_page(args.synthetic_mb))]
+    
+    print(f"{'page':<28} {'method':<10} {'entities':>8} {'ms':>9} {'peak MB':>9}")
+    for label, html in samples:
+        for method, func in (('walk', recursive_walk), ('targeted', extract_business_entities)):
+            entities, seconds, peak = measure(func, html, args.repeat)
+            count = len(entities) if entities is not None else 'n/a'
+            print(f"{label[:28]:<28} {method:<10} {count:>8} {seconds * 1000:>9.1f} {peak / 1e6:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parallel_dedupe.dedupe_file() on a large synthetic CSV.
+
+Writes a CSV of synthetic dirty leads (see synthetic_leads.py),
+deduplicates it with each worker count and reports rows/second, the speedup
+over one worker and whether every run wrote the same output.
+
+Usage:
+    python benchmarks/bench_parallel_dedupe.py
+    python benchmarks/bench_parallel_dedupe.py --rows 200000 --workers 1 2 4
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_dedupe_similarity import make_config  # noqa: E402
+from parallel_dedupe import dedupe_file  # noqa: E402
+from synthetic_leads import iter_leads  # noqa: E402
+
+COLUMNS = ['entity_id', 'name', 'address', 'phone', 'latitude', 'longitude', 'place_id', 'source']
+
+
+def write_leads(path: Path, rows: int, duplicate_rate: float):
+    """Stream rows synthetic leads to a CSV file."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(iter_leads(rows, duplicate_rate))
+
+
+def digest(path: Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1))))
+    parser.add_argument('--duplicate-rate', type=float, default=0.3)
+    parser.add_argument('--backend', default='auto')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory(prefix='bench-dedupe-') as directory:
+        source = Path(directory) / 'leads.csv'
+        start = time.perf_counter()
+        write_leads(source, args.rows, args.duplicate_rate)
+        print(f"Wrote {args.rows:,} rows in {time.perf_counter() - start:.1f}s ({cpus} CPUs)")
+        
+        print(f"{'workers':>8} {'clusters':>10} {'seconds':>9} {'rows/s':>10} {'speedup':>8} {'same output':>12}")
+        baseline = reference = None
+        for workers in args.workers:
+            output = Path(directory) / f"unique-{workers}.csv"
+            stats = dedupe_file(str(source), str(output), make_config(args.backend), workers=workers)
+            
+            baseline = baseline or stats.elapsed
+            reference = reference or digest(output)
+            same = 'yes' if digest(output) == reference else 'NO'
+            print(
+                f"{workers:>8} {stats.clusters:>10,} {stats.elapsed:>9.1f} {args.rows / stats.elapsed:>10,.0f} "
+                f"{baseline / stats.elapsed:>7.2f}x {same:>12}"
+            )
+
+
+if __name__ == '__main__':
+    main()
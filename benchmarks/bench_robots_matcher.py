@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: compiled robots.txt matcher vs RobotFileParser.can_fetch.
+
+Checks many URLs on one site against a robots.txt with a large rule set and
+reports checks/second for both implementations, plus how many answers differ
+(there should be none: the synthetic rules overlap, and the first matching
+rule must win as in RobotFileParser; only * and $ wildcards, which urllib
+does not support, can differ).
+
+Usage:
+    python benchmarks/bench_robots_matcher.py --rules 500 --urls 20000
+    python benchmarks/bench_robots_matcher.py --robots saved_robots.txt
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from urllib.robotparser import RobotFileParser
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from robots_matcher import CompiledRobots  # noqa: E402
+
+
+def synthetic_robots(rule_count: int, seed: int = 3):
+    rng = random.Random(seed)
+    lines = ['User-agent: *', 'Crawl-delay: 2']
+    for i in range(rule_count):
+        directive = 'Allow' if rng.random() < 0.2 else 'Disallow'
+        lines.append(f"{directive}: /section{i}/{rng.choice(['private', 'tmp', 'cart', 'search'])}")
+        if i % 10 == 0:
+            # Overlapping rules: a broad rule before a narrower one it shadows
+            lines.append(f"Disallow: /section{i + 1}")
+            lines.append(f"Allow: /section{i + 1}/public")
+    return lines
+
+
+def synthetic_urls(count: int, rule_count: int, seed: int = 5):
+    rng = random.Random(seed)
+    return [
+        f"https://example.com/section{rng.randrange(rule_count * 2)}/"
+        f"{rng.choice(['private', 'public', 'cart', 'about'])}/page{i}"
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--robots', help='robots.txt file to use instead of a synthetic one')
+    parser.add_argument('--rules', type=int, default=500)
+    parser.add_argument('--urls', type=int, default=20000)
+    parser.add_argument('--user-agent', default='*')
+    args = parser.parse_args()
+    
+    if args.robots:
+        lines = Path(args.robots).read_text(encoding='utf-8', errors='replace').splitlines()
+    else:
+        lines = synthetic_robots(args.rules)
+    urls = synthetic_urls(args.urls, max(args.rules, 1))
+    
+    reference = RobotFileParser()
+    reference.parse(lines)
+    
+    start = time.perf_counter()
+    compiled = CompiledRobots.parse(lines)
+    compile_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    expected = [reference.can_fetch(args.user_agent, url) for url in urls]
+    reference_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    actual = [compiled.can_fetch(args.user_agent, url) for url in urls]
+    compiled_seconds = time.perf_counter() - start
+    
+    differing = sum(1 for a, b in zip(expected, actual) if a != b)
+    
+    print(f"rules: {len(lines)}  urls: {len(urls)}  compile: {compile_seconds * 1000:.1f} ms")
+    print(f"RobotFileParser  {len(urls) / reference_seconds:>12,.0f} checks/s")
+    print(f"CompiledRobots   {len(urls) / compiled_seconds:>12,.0f} checks/s")
+    print(f"speedup          {reference_seconds / compiled_seconds:>12.1f}x")
+    print(f"differing answers: {differing}  crawl-delay: {compiled.crawl_delay(args.user_agent)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SQLite export of synthetic leads, row-at-a-time vs bulk upsert.
+
+    row-by-row  the previous exporter: one INSERT OR REPLACE per lead with
+                the default rollback journal and place_id as primary key
+    bulk        DataExporter._export_sqlite(): one executemany upsert in a
+                single WAL transaction, keyed on place_id or name+address
+
+Each strategy imports the leads into a fresh file, then imports them a
+second time into the same file to show how re-exports merge. Leads from
+directories and later scrapes often have no place_id; the row count shows
+how many of those the old primary key let through as duplicates.
+
+Usage:
+    python benchmarks/bench_sqlite_export.py
+    python benchmarks/bench_sqlite_export.py --rows 20000
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from exporter import SQLITE_COLUMNS, DataExporter  # noqa: E402
+from lead_table import LeadTable  # noqa: E402
+from synthetic_leads import generate_leads  # noqa: E402
+
+
+def row_by_row(path: Path, leads: List[Dict]):
+    """The exporter before the bulk upsert."""
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS leads ({", ".join(f"{column} TEXT" for column in SQLITE_COLUMNS)}, '
+        f'PRIMARY KEY (place_id))'
+    )
+    for lead in leads:
+        try:
+            cursor.execute(
+                f'INSERT OR REPLACE INTO leads ({", ".join(SQLITE_COLUMNS)}) '
+                f'VALUES ({", ".join("?" * len(SQLITE_COLUMNS))})',
+                tuple(lead.get(column) for column in SQLITE_COLUMNS)
+            )
+        except sqlite3.Error:
+            continue
+    conn.commit()
+    conn.close()
+
+
+def bulk(path: Path, leads: List[Dict]):
+    config = SimpleNamespace(export={'sqlite_table_name': 'leads'}, deduplication={})
+    DataExporter(config, output_dir=str(path.parent))._export_sqlite(LeadTable(leads), path.stem)
+
+
+def count_rows(path: Path) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute('SELECT COUNT(*) FROM leads').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--duplicate-rate', type=float, default=0.3)
+    args = parser.parse_args()
+    
+    leads = generate_leads(args.rows, args.duplicate_rate)
+    for lead in leads:
+        lead['place_id'] = lead['place_id'] or None
+    
+    print(f"{'strategy':<11} {'import':<8} {'seconds':>8} {'rows/s':>10} {'rows in table':>14}")
+    with tempfile.TemporaryDirectory(prefix='bench-sqlite-') as directory:
+        for name, export in (('row-by-row', row_by_row), ('bulk', bulk)):
+            path = Path(directory) / f"{name}.db"
+            for run in ('fresh', 'again'):
+                start = time.perf_counter()
+                export(path, leads)
+                seconds = time.perf_counter() - start
+                print(f"{name:<11} {run:<8} {seconds:>8.2f} {len(leads) / seconds:>10,.0f} {count_rows(path):>14,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Yellow Pages Selenium engine vs HTTP engine.
+
+Runs the same live search through both engines and reports leads/minute.
+
+Usage:
+    python benchmarks/bench_yellow_pages_engines.py --query "plumbers" --location "Austin, TX" --max 60
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config  # noqa: E402
+
+
+def run_selenium(config, query, location, max_results):
+    from yellow_pages_scraper import YellowPagesScraper
+    
+    scraper = YellowPagesScraper(config, headless=True)
+    try:
+        return scraper.scrape_yellow_pages(query, location, max_results)
+    finally:
+        scraper.close()
+
+
+def run_http(config, query, location, max_results):
+    from yellow_pages_http_scraper import YellowPagesHttpScraper
+    
+    scraper = YellowPagesHttpScraper(config)
+    try:
+        return scraper.scrape_yellow_pages(query, location, max_results)
+    finally:
+        scraper.close()
+
+
+ENGINES = {
+    'selenium': run_selenium,
+    'http': run_http,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--query', default='plumbers')
+    parser.add_argument('--location', default='Austin, TX')
+    parser.add_argument('--max', type=int, default=60)
+    parser.add_argument('--engines', nargs='+', choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument('--config', default='config.yaml')
+    args = parser.parse_args()
+    
+    config = Config(args.config)
+    
+    print(f"{'engine':<10} {'leads':>6} {'seconds':>9} {'leads/min':>10}")
+    for engine in args.engines:
+        start = time.perf_counter()
+        try:
+            leads = ENGINES[engine](config, args.query, args.location, args.max)
+        except Exception as e:
+            print(f"{engine:<10} failed: {e}")
+            continue
+        elapsed = time.perf_counter() - start
+        rate = len(leads) / elapsed * 60 if elapsed else 0.0
+        print(f"{engine:<10} {len(leads):>6} {elapsed:>9.1f} {rate:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,237 @@
+"""
+Synthetic dirty business leads with known duplicates.
+
+Every generated lead carries the entity_id of the business it describes.
+A share of the leads (duplicate_rate) re-list an earlier business the way
+a second source or a later scrape would: with typos in the name, the phone
+number in another format, street types abbreviated or expanded, units
+dropped, coordinates jittered by a few metres and fields missing. The
+entity_ids give the ground truth that precision and recall are measured
+against.
+
+Generation is streamed by iter_leads(); only a compact tuple per business
+is kept so duplicates can refer back to it.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+from geo_index import METERS_PER_DEGREE
+
+
+# (city, country calling code, latitude, longitude)
+CITIES = [
+    ('Lahore', '92', 31.5204, 74.3587),
+    ('Karachi', '92', 24.8607, 67.0011),
+    ('New York', '1', 40.7128, -74.0060),
+    ('Austin', '1', 30.2672, -97.7431),
+    ('London', '44', 51.5072, -0.1276),
+]
+
+WORDS = ['Golden', 'Silver', 'Royal', 'Green', 'Blue', 'Urban', 'Classic', 'Prime', 'Sunrise', 'Lakeside',
+         'Metro', 'Cedar', 'Maple', 'Crescent', 'Liberty', 'Harbor', 'Summit', 'Evergreen', 'Orchard', 'Pioneer']
+SURNAMES = ['Khan', 'Ahmed', 'Smith', 'Garcia', 'Patel', 'Johnson', 'Brown', 'Malik', 'Taylor', 'Lopez',
+            'Chaudhry', 'Wilson', 'Davies', 'Hussain', 'Martin']
+KINDS = ['Cafe', 'Pizza', 'Bakery', 'Grill', 'Dental Clinic', 'Hair Salon', 'Motors', 'Pharmacy',
+         'Fitness Center', 'Books', 'Florist', 'Sushi Bar', 'Tailors', 'Hardware', 'Medical Center',
+         'Restaurant', 'Coffee House', 'Auto Repair', 'Law Office', 'Pet Store']
+STREETS = ['Main', 'Oak', 'Park', 'Mall', 'Canal Bank', 'Liberty', 'Gulberg', 'Jail', 'Ferozepur', 'Church',
+           'High', 'Station', 'Market', 'Mill', 'Elm', 'Washington', 'King', 'Queen', 'Victoria', 'Lake']
+STREET_TYPES = ['Street', 'Road', 'Avenue', 'Boulevard', 'Lane', 'Drive']
+SOURCES = ['maps', 'yelp', 'yellowpages']
+
+# Expanded form -> abbreviation, as found in listings
+ABBREVIATIONS = {
+    'Street': 'St', 'Road': 'Rd', 'Avenue': 'Ave', 'Boulevard': 'Blvd', 'Lane': 'Ln', 'Drive': 'Dr',
+    'Suite': 'Ste', 'North': 'N', 'South': 'S', 'East': 'E', 'West': 'W', 'Center': 'Ctr',
+}
+
+PHONE_FORMATS = ['e164', 'international', 'national', 'dashed', 'dotted']
+
+
+@dataclass
+class Noise:
+    """Probabilities of each kind of corruption applied to a duplicate."""
+    
+    typo: float = 0.4
+    case: float = 0.1
+    phone_format: float = 0.7
+    abbreviation: float = 0.5
+    drop_unit: float = 0.3
+    missing_field: float = 0.15
+    jitter_m: float = 25.0
+    
+    @classmethod
+    def scaled(cls, factor: float) -> 'Noise':
+        """Noise with every probability (and the jitter) multiplied by factor."""
+        base = cls()
+        return cls(**{
+            name: value * factor if name == 'jitter_m' else min(1.0, value * factor)
+            for name, value in vars(base).items()
+        })
+
+
+# name, address, unit, phone digits (national), country code, latitude, longitude, place_id
+Business = Tuple[str, str, str, str, str, float, float, str]
+
+
+def iter_leads(count: int, duplicate_rate: float = 0.3, noise: Noise = None,
+               seed: int = 7) -> Iterator[Dict]:
+    """
+    Generate leads one at a time.
+    
+    Args:
+        count: Number of leads
+        duplicate_rate: Share of leads that re-list an earlier business
+        noise: Corruption applied to duplicates (default: Noise())
+        seed: Random seed; the same arguments always give the same leads
+    
+    Yields:
+        Lead dictionaries with an entity_id field
+    """
+    rng = random.Random(seed)
+    noise = noise or Noise()
+    businesses: List[Business] = []
+    
+    for _ in range(count):
+        if businesses and rng.random() < duplicate_rate:
+            entity_id = rng.randrange(len(businesses))
+            yield _duplicate(rng, businesses[entity_id], entity_id, noise)
+        else:
+            entity_id = len(businesses)
+            businesses.append(_business(rng, entity_id))
+            yield _listing(rng, businesses[entity_id], entity_id, rng.choice(SOURCES))
+
+
+def generate_leads(count: int, duplicate_rate: float = 0.3, noise: Noise = None,
+                   seed: int = 7) -> List[Dict]:
+    """Generate a list of leads (see iter_leads())."""
+    return list(iter_leads(count, duplicate_rate, noise, seed))
+
+
+def _business(rng: random.Random, entity_id: int) -> Business:
+    """Draw a new business."""
+    city, code, lat, lon = rng.choice(CITIES)
+    
+    pattern = rng.random()
+    kind = rng.choice(KINDS)
+    if pattern < 0.4:
+        name = f"{rng.choice(WORDS)} {kind}"
+    elif pattern < 0.7:
+        name = f"{rng.choice(SURNAMES)}'s {kind}"
+    elif pattern < 0.85:
+        name = f"The {rng.choice(WORDS)} {rng.choice(WORDS)} {kind}"
+    else:
+        name = f"{rng.choice(SURNAMES)} & {rng.choice(SURNAMES)} {kind}"
+    
+    direction = rng.choice(['', '', '', 'North ', 'South ', 'East ', 'West '])
+    address = f"{rng.randint(1, 9999)} {direction}{rng.choice(STREETS)} {rng.choice(STREET_TYPES)}, {city}"
+    unit = f"Suite {rng.randint(1, 400)}" if rng.random() < 0.25 else ''
+    
+    digits = str(rng.randint(2, 9)) + ''.join(str(rng.randint(0, 9)) for _ in range(9))
+    has_coordinates = rng.random() < 0.8
+    radius = 0.15
+    return (
+        name,
+        address,
+        unit,
+        digits,
+        code,
+        lat + rng.uniform(-radius, radius) if has_coordinates else None,
+        lon + rng.uniform(-radius, radius) if has_coordinates else None,
+        f"ChIJ{entity_id:012d}",
+    )
+
+
+def _listing(rng: random.Random, business: Business, entity_id: int, source: str) -> Dict:
+    """Render a business as one source would list it, without noise."""
+    name, address, unit, digits, code, lat, lon, place_id = business
+    if unit:
+        street, city = address.rsplit(', ', 1)
+        address = f"{street}, {unit}, {city}"
+    return {
+        'entity_id': entity_id,
+        'name': name,
+        'address': address,
+        'phone': _format_phone(digits, code, rng.choice(PHONE_FORMATS)),
+        'latitude': lat,
+        'longitude': lon,
+        'place_id': place_id if source == 'maps' else '',
+        'source': source,
+    }
+
+
+def _duplicate(rng: random.Random, business: Business, entity_id: int, noise: Noise) -> Dict:
+    """Render a business again with noise."""
+    lead = _listing(rng, business, entity_id, rng.choice(SOURCES))
+    
+    if rng.random() < noise.typo:
+        lead['name'] = _typo(rng, lead['name'])
+    if rng.random() < noise.case:
+        lead['name'] = rng.choice([str.upper, str.lower, str.title])(lead['name'])
+    
+    if rng.random() < noise.abbreviation:
+        lead['address'] = _abbreviate(rng, lead['address'])
+    if business[2] and rng.random() < noise.drop_unit:
+        lead['address'] = lead['address'].replace(f", {business[2]}", '')
+    
+    if rng.random() < noise.phone_format:
+        lead['phone'] = _format_phone(business[3], business[4], rng.choice(PHONE_FORMATS))
+    
+    if lead['latitude'] is not None and noise.jitter_m:
+        lat_offset = rng.gauss(0, noise.jitter_m) / METERS_PER_DEGREE
+        lon_offset = rng.gauss(0, noise.jitter_m) / (METERS_PER_DEGREE * math.cos(math.radians(lead['latitude'])))
+        lead['latitude'] += lat_offset
+        lead['longitude'] += lon_offset
+    
+    if rng.random() < noise.missing_field:
+        field = rng.choice(['phone', 'address', 'latitude'])
+        lead[field] = '' if field != 'latitude' else None
+        if field == 'latitude':
+            lead['longitude'] = None
+    
+    return lead
+
+
+def _typo(rng: random.Random, text: str) -> str:
+    """Apply one keyboard-style edit: substitute, delete, insert or transpose."""
+    if len(text) < 3:
+        return text
+    position = rng.randrange(1, len(text) - 1)
+    letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    edit = rng.randrange(4)
+    if edit == 0:
+        return text[:position] + letter + text[position + 1:]
+    if edit == 1:
+        return text[:position] + text[position + 1:]
+    if edit == 2:
+        return text[:position] + letter + text[position:]
+    return text[:position - 1] + text[position] + text[position - 1] + text[position + 1:]
+
+
+def _abbreviate(rng: random.Random, address: str) -> str:
+    """Abbreviate every expanded word, or expand every abbreviation."""
+    words = address.replace(',', ' ,').split(' ')
+    if rng.random() < 0.7:
+        words = [ABBREVIATIONS.get(word, word) + ('.' if word in ABBREVIATIONS and rng.random() < 0.3 else '')
+                 for word in words]
+    else:
+        expanded = {short: full for full, short in ABBREVIATIONS.items()}
+        words = [expanded.get(word, word) for word in words]
+    return ' '.join(words).replace(' ,', ',')
+
+
+def _format_phone(digits: str, code: str, style: str) -> str:
+    """Write a national number in one of PHONE_FORMATS."""
+    a, b, c = digits[:3], digits[3:6], digits[6:]
+    if style == 'e164':
+        return f"+{code}{digits}"
+    if style == 'international':
+        return f"+{code} {a} {b} {c}"
+    if style == 'national':
+        return f"({a}) {b}-{c}" if code == '1' else f"0{a} {b}{c}"
+    if style == 'dashed':
+        return f"{a}-{b}-{c}"
+    return f"{a}.{b}.{c}"
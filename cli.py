@@ -12,12 +12,14 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
+from functools import partial
 import yaml
 from colorama import init, Fore, Style
 
-from selenium_scraper import SeleniumScraper
 from exporter import DataExporter
+from lead_store import open_store
 from dedupe import Deduplicator
+from sources import SOURCE_TYPES, GoogleMapsSource, collect_from_sources
 from config import Config
 from utils import setup_logging, validate_location
 
@@ -35,6 +37,7 @@ Examples:
   %(prog)s --query "coffee shop" --location "Lahore, Pakistan" --max 50
   %(prog)s --query "restaurants" --location "New York" --tile-mode --max 200
   %(prog)s --query "hotels" --location "Paris" --guest-mode --format csv json
+  %(prog)s --query "plumbers" --location "Austin, TX" --sources maps yelp yellowpages
         """
     )
     
@@ -69,11 +72,48 @@ Examples:
     parser.add_argument(
         '--format', '-f',
         nargs='+',
-        choices=['csv', 'json', 'sqlite', 'all'],
+        choices=['csv', 'json', 'sqlite', 'parquet', 'all'],
         default=['all'],
         help='Export formats (default: all)'
     )
     
+    parser.add_argument(
+        '--sources', '-s',
+        nargs='+',
+        choices=sorted(SOURCE_TYPES),
+        default=['maps'],
+        help='Lead sources to run concurrently (default: maps)'
+    )
+    
+    parser.add_argument(
+        '--engine',
+        choices=['http', 'selenium'],
+        default='http',
+        help='Engine for the Yelp and Yellow Pages sources (default: http)'
+    )
+    
+    parser.add_argument(
+        '--cluster',
+        action='store_true',
+        help='Merge duplicates into one record per business instead of keeping the first'
+    )
+    
+    parser.add_argument(
+        '--only-new',
+        action='store_true',
+        help='Only export leads not kept in an earlier run (uses the persistent dedupe index)'
+    )
+    
+    parser.add_argument(
+        '--nearby-report',
+        type=float,
+        nargs='?',
+        const=100.0,
+        default=None,
+        metavar='METERS',
+        help='Also export pairs of kept leads within METERS of each other (default: 100)'
+    )
+    
     parser.add_argument(
         '--tile-mode',
         action='store_true',
@@ -127,6 +167,20 @@ Examples:
         help='Resume from a previous session file'
     )
     
+    parser.add_argument(
+        '--delta',
+        type=str,
+        default=None,
+        metavar='CONSUMER',
+        help='Add leads to the master store and export only those new or changed since CONSUMER\'s last delta'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Write unique leads to CSV and JSONL files as they are collected'
+    )
+    
     parser.add_argument(
         '--enrich-osm',
         action='store_true',
@@ -171,6 +225,47 @@ def print_summary(leads, elapsed_time):
     print(f"{Fore.GREEN}{'='*70}{Style.RESET_ALL}\n")
 
 
+def print_source_report(source_stats):
+    """Print per-source timing and yield."""
+    print(f"{Fore.CYAN}Sources:{Style.RESET_ALL}")
+    for stats in source_stats:
+        if stats.error:
+            print(f"  {Fore.RED}✗{Style.RESET_ALL} {stats.name:<12} failed: {stats.error}")
+            continue
+        print(
+            f"  {Fore.GREEN}✓{Style.RESET_ALL} {stats.name:<12} "
+            f"{Fore.YELLOW}{stats.leads}{Style.RESET_ALL} leads, "
+            f"{Fore.YELLOW}{stats.unique}{Style.RESET_ALL} unique, "
+            f"{Fore.YELLOW}{stats.elapsed:.1f}s{Style.RESET_ALL}"
+        )
+    print()
+
+
+def build_source_factories(args, config):
+    """Map each requested source name to a callable that builds it."""
+    factories = {}
+    for name in args.sources:
+        if name == GoogleMapsSource.name:
+            factories[name] = partial(
+                GoogleMapsSource,
+                config,
+                headless=args.headless,
+                guest_mode=args.guest_mode if not args.profile else False,
+                profile=args.profile,
+                delay=args.delay,
+                tile_mode=args.tile_mode,
+                tile_size=args.tile_size
+            )
+        else:
+            factories[name] = partial(
+                SOURCE_TYPES[name],
+                config,
+                engine=args.engine,
+                headless=args.headless
+            )
+    return factories
+
+
 def main():
     """Main CLI entry point."""
     try:
@@ -186,6 +281,10 @@ def main():
         # Override config with CLI arguments
         if args.verbose:
             config.logging['level'] = 'DEBUG'
+        if args.only_new:
+            config.deduplication['only_new'] = True
+        if args.cluster:
+            config.deduplication['mode'] = 'cluster'
         
         # Setup logging
         logger = setup_logging(config)
@@ -196,39 +295,49 @@ def main():
         if not validate_location(args.location):
             logger.warning("Location format may not be optimal. Consider using 'City, Country' format.")
         
-        # Initialize scraper
-        logger.info("Initializing Selenium scraper...")
-        scraper = SeleniumScraper(
-            config=config,
-            headless=args.headless,
-            guest_mode=args.guest_mode if not args.profile else False,
-            profile=args.profile,
-            delay=args.delay
-        )
-        
         # Start scraping
         start_time = datetime.now()
         logger.info(f"Starting scraping session at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"Sources: {', '.join(args.sources)}")
         
-        leads = scraper.scrape_google_maps(
-            query=args.query,
-            location=args.location,
-            max_results=args.max,
-            tile_mode=args.tile_mode,
-            tile_size=args.tile_size
-        )
+        # Run sources concurrently, deduplicating as each one finishes
+        deduplicator = Deduplicator(config)
+        exporter = DataExporter(config, output_dir=args.output_dir)
+        
+        # Optionally write each unique lead to disk as soon as it is kept
+        stream_writers = []
+        if args.stream:
+            stream_writers = exporter.open_stream(
+                ['csv', 'jsonl'], f"leads_{start_time.strftime('%Y%m%d_%H%M%S')}_stream"
+            )
+        
+        def write_lead(lead):
+            for writer in stream_writers:
+                writer.write(lead)
         
-        # Close scraper
-        scraper.close()
+        try:
+            unique_leads, source_stats = collect_from_sources(
+                build_source_factories(args, config),
+                query=args.query,
+                location=args.location,
+                max_results=args.max,
+                deduplicator=deduplicator,
+                on_lead=write_lead if stream_writers else None
+            )
+        finally:
+            for writer in stream_writers:
+                writer.close()
+                logger.info(f"✓ Streamed {writer.rows} leads to {writer.path}")
         
-        if not leads:
+        if deduplicator.store is not None:
+            logger.info(f"{deduplicator.previously_seen} leads were already seen in earlier runs")
+        deduplicator.close()
+        
+        if not unique_leads:
             logger.warning("No leads found. Try adjusting your query or location.")
+            print_source_report(source_stats)
             return 1
         
-        # Deduplicate
-        logger.info("Deduplicating results...")
-        deduplicator = Deduplicator(config)
-        unique_leads = deduplicator.deduplicate(leads)
         logger.info(f"✓ {len(unique_leads)} unique leads after deduplication")
         
         # Optional OSM enrichment
@@ -240,23 +349,35 @@ def main():
         
         # Export results
         logger.info("Exporting results...")
-        exporter = DataExporter(config, output_dir=args.output_dir)
         
         formats = args.format if 'all' not in args.format else ['csv', 'json', 'sqlite']
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         base_filename = f"leads_{timestamp}"
         
-        exported_files = exporter.export(
-            data=unique_leads,
-            formats=formats,
-            filename=base_filename
-        )
+        if args.delta:
+            with open_store(config) as store:
+                store.add(unique_leads)
+                exported_files = exporter.export_delta(store, formats, consumer=args.delta)
+        else:
+            exported_files = exporter.export(
+                data=unique_leads,
+                formats=formats,
+                filename=base_filename
+            )
+        
+        if args.nearby_report is not None:
+            nearby = deduplicator.nearby_duplicates(unique_leads, radius_m=args.nearby_report)
+            logger.info(f"Found {len(nearby)} lead pairs within {args.nearby_report:g} m")
+            exported_files.append(
+                exporter.export_nearby_duplicates(nearby, f"nearby_duplicates_{timestamp}")
+            )
         
         # Print summary
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
         print_summary(unique_leads, elapsed)
+        print_source_report(source_stats)
         
         # Print exported files
         print(f"{Fore.CYAN}Exported Files:{Style.RESET_ALL}")
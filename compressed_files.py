@@ -0,0 +1,221 @@
+"""
+Transparent compression for exported text files.
+
+open_text() opens a CSV or JSON file for writing (or appending, or
+reading) through a gzip or zstd compressor, so exports are compressed as
+they are written, without an intermediate uncompressed file. The codec is
+chosen with export.compression in config.yaml:
+
+    none   leads.csv
+    gzip   leads.csv.gz   (standard library)
+    zstd   leads.csv.zst  (needs the zstandard package)
+
+Appending adds a new gzip member or zstd frame; both decompress as one
+stream with the standard tools. Instead of a path, open_text() also takes
+a binary file object such as a BytesIO, which is left open.
+
+A writer killed mid-write leaves its last member or frame cut off, and
+anything appended after it would be unreadable; repair_compressed() cuts
+such a file back to its last complete line before it is appended to.
+"""
+
+import gzip
+import io
+import os
+import zlib
+from pathlib import Path
+from typing import Optional, TextIO
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+CODEC_SUFFIXES = {
+    'none': '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+# Download MIME types by codec
+CODEC_MIME_TYPES = {
+    'gzip': 'application/gzip',
+    'zstd': 'application/zstd',
+}
+
+DEFAULT_LEVELS = {
+    'gzip': 6,
+    'zstd': 3,
+}
+
+# Compressed bytes read per step by repair_compressed()
+READ_CHUNK_SIZE = 1 << 20
+
+
+def check_codec(codec: str) -> str:
+    """
+    Validate a codec name.
+    
+    Args:
+        codec: 'none', 'gzip' or 'zstd' (None and '' mean 'none')
+    
+    Returns:
+        The codec name
+    
+    Raises:
+        ValueError: If the codec is unknown or zstandard is not installed
+    """
+    codec = codec or 'none'
+    if codec not in CODEC_SUFFIXES:
+        raise ValueError(f"Unknown compression codec: {codec} (use {', '.join(CODEC_SUFFIXES)})")
+    if codec == 'zstd' and not ZSTD_AVAILABLE:
+        raise ValueError("zstd compression requires the zstandard package (pip install zstandard)")
+    return codec
+
+
+def compressed_path(path, codec: str) -> Path:
+    """Path with the codec's suffix appended (leads.csv -> leads.csv.gz)."""
+    return Path(f"{path}{CODEC_SUFFIXES[check_codec(codec)]}")
+
+
+def codec_of(path) -> str:
+    """Codec of a file, from its suffix."""
+    suffix = Path(path).suffix
+    for codec, codec_suffix in CODEC_SUFFIXES.items():
+        if codec_suffix and suffix == codec_suffix:
+            return codec
+    return 'none'
+
+
+def open_text(path, mode: str = 'w', codec: str = 'none', level: Optional[int] = None,
+              newline: Optional[str] = None) -> TextIO:
+    """
+    Open a UTF-8 text file through a compressor or decompressor.
+    
+    Args:
+        path: File path (including any codec suffix), or a binary file
+            object that stays open when the text file is closed
+        mode: 'w', 'a' or 'r'
+        codec: 'none', 'gzip' or 'zstd'
+        level: Compression level (default: 6 for gzip, 3 for zstd)
+        newline: As for open(); pass '' for CSV files
+    
+    Returns:
+        Text file object; closing it finishes the compressed stream
+    """
+    codec = check_codec(codec)
+    if mode not in ('w', 'a', 'r'):
+        raise ValueError(f"Unsupported mode: {mode}")
+    level = level or DEFAULT_LEVELS.get(codec)
+    is_path = isinstance(path, (str, os.PathLike))
+    
+    if codec == 'none':
+        if is_path:
+            return open(path, mode, encoding='utf-8', newline=newline)
+        return io.TextIOWrapper(_Borrowed(path), encoding='utf-8', newline=newline)
+    if codec == 'gzip':
+        return gzip.open(path, mode + 't', compresslevel=level, encoding='utf-8', newline=newline)
+    
+    raw = open(path, mode + 'b') if is_path else path
+    if mode == 'r':
+        stream = io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=is_path)
+        )
+    else:
+        stream = zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=is_path)
+    return io.TextIOWrapper(stream, encoding='utf-8', newline=newline)
+
+
+def repair_compressed(path, codec: str, level: Optional[int] = None) -> bool:
+    """
+    Cut a compressed text file back to its last complete line.
+    
+    The file is decompressed once. If its last gzip member or zstd frame
+    was cut off, or it ends in the middle of a line, the complete lines
+    are recompressed into a file that replaces it.
+    
+    Args:
+        path: File path
+        codec: 'gzip' or 'zstd'
+        level: Compression level of the rewritten file
+    
+    Returns:
+        True if the file was rewritten
+    """
+    path = Path(path)
+    codec = check_codec(codec)
+    last = b''
+    try:
+        for data in _decompressed(path, codec):
+            last = data or last
+        if not last or last.endswith(b'\n'):
+            return False
+    except EOFError:
+        pass
+    
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open_text(tmp_path, 'w', codec, level, newline='') as out:
+            pending = b''
+            try:
+                for data in _decompressed(path, codec):
+                    pending += data
+                    end = pending.rfind(b'\n') + 1
+                    if end:
+                        out.write(pending[:end].decode('utf-8'))
+                        pending = pending[end:]
+            except EOFError:
+                pass
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return True
+
+
+def _decompressed(path: Path, codec: str):
+    """Yield the decompressed bytes of every member/frame; EOFError if the last one is cut off."""
+    decompressor = None
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+            while chunk:
+                if decompressor is None:
+                    if codec == 'gzip':
+                        decompressor = zlib.decompressobj(wbits=31)
+                    else:
+                        decompressor = zstandard.ZstdDecompressor().decompressobj()
+                yield decompressor.decompress(chunk)
+                if decompressor.eof:
+                    chunk, decompressor = decompressor.unused_data, None
+                else:
+                    chunk = b''
+    if decompressor is not None:
+        raise EOFError(f"{path} ends in the middle of a compressed stream")
+
+
+class _Borrowed(io.BufferedIOBase):
+    """Binary file object whose close() flushes but leaves the wrapped file open."""
+    
+    def __init__(self, f):
+        super().__init__()
+        self.f = f
+    
+    def readable(self) -> bool:
+        return self.f.readable()
+    
+    def writable(self) -> bool:
+        return self.f.writable()
+    
+    def read(self, size: int = -1) -> bytes:
+        return self.f.read(size)
+    
+    def read1(self, size: int = -1) -> bytes:
+        return self.f.read(size)
+    
+    def write(self, data) -> int:
+        return self.f.write(data)
+    
+    def flush(self):
+        self.f.flush()
@@ -31,7 +31,9 @@ class Config:
                 'request_timeout': 30,
                 'retry_attempts': 3,
                 'backoff_multiplier': 2,
-                'max_leads_per_session': 500
+                'max_leads_per_session': 500,
+                'http_workers': 4,
+                'http_host_interval': 0.5
             },
             'selenium': {
                 'page_load_timeout': 60,
@@ -57,12 +59,33 @@ class Config:
                 'csv_delimiter': ',',
                 'csv_encoding': 'utf-8',
                 'json_indent': 2,
-                'sqlite_table_name': 'leads'
+                'sqlite_table_name': 'leads',
+                'sqlite_fts': False,
+                'stream_batch_size': 500,
+                'fsync_every': 5000,
+                'parquet_compression': 'zstd',
+                'parquet_partition_by': [],
+                'parallel_formats': True,
+                'master_store_dir': '',
+                'compression': 'none',
+                'compression_level': None
             },
             'deduplication': {
                 'fuzzy_threshold': 0.85,
                 'dedupe_fields': ['name', 'address', 'phone'],
-                'prefer_place_id': True
+                'prefer_place_id': True,
+                'blocking': True,
+                'mode': 'first',
+                'similarity_backend': 'auto',
+                'minhash': False,
+                'minhash_bands': 16,
+                'minhash_rows': 4,
+                'shingle_size': 3,
+                'default_country_code': '',
+                'persistent_index': False,
+                'index_file': './data/dedupe_index.db',
+                'only_new': False,
+                'workers': 0
             },
             'logging': {
                 'level': 'INFO',
@@ -74,7 +97,10 @@ class Config:
                 'enabled': True,
                 'user_agent': '*',
                 'cache_enabled': True,
-                'cache_duration': 3600
+                'cache_duration': 3600,
+                'negative_cache_duration': 300,
+                'cache_max_entries': 1000,
+                'cache_file': './data/robots_cache.json'
             },
             'enrichment': {
                 'osm_enabled': False,
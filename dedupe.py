@@ -6,9 +6,82 @@ using multiple strategies: exact matching, place_id matching, and fuzzy matching
 """
 
 import logging
-from typing import List, Dict, Set, Tuple
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import List, Dict, Sequence, Set, Tuple, Optional
 from difflib import SequenceMatcher
 
+from dedupe_store import DedupeStore
+from geo_index import GridIndex, cells_within, grid_cell, haversine_m, nearby_pairs
+from minhash import LSHIndex, MinHasher
+from normalization import NormalizedLead, get_normalizer
+from similarity import get_backend
+
+
+# Leads further apart than this score 0 in _coordinate_similarity, so the
+# spatial index only needs to return neighbours within it
+COORDINATE_RADIUS_M = 1000.0
+BLOCK_CELL_DEGREES = 0.01
+NAME_PREFIX_LENGTH = 4
+ADDRESS_PREFIX_LENGTH = 6
+
+# Slack for float rounding when comparing batched score bounds to the threshold
+BOUND_TOLERANCE = 1e-6
+
+# Blocking keys recorded in the persistent index. Name tokens and address
+# numbers are left out: a key such as "name:cafe" matches a growing share
+# of the store, while these stay small per key.
+STORE_KEY_PREFIXES = ('phone:', 'nprefix:', 'aprefix:')
+
+# Fields that don't count towards a record's completeness in cluster mode
+BOOKKEEPING_FIELDS = {'timestamp', 'source', 'cluster_size', 'first_seen'}
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path halving and union by size."""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+    
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a: int, b: int) -> int:
+        """Merge the sets of a and b and return the new root."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+    
+    def groups(self) -> List[List[int]]:
+        """Return the members of each set, ordered by their first member."""
+        members: Dict[int, List[int]] = {}
+        for item in range(len(self.parent)):
+            members.setdefault(self.find(item), []).append(item)
+        return list(members.values())
+
+
+@dataclass
+class ClusterStats:
+    """Summary of a cluster-mode deduplication run."""
+    
+    leads: int = 0
+    clusters: int = 0
+    merged_clusters: int = 0
+    largest_cluster: int = 0
+    filled_fields: int = 0
+    elapsed: float = 0.0
+
 
 class Deduplicator:
     """
@@ -18,6 +91,30 @@ class Deduplicator:
     1. Exact place_id matching (highest priority)
     2. Fuzzy matching on name + address + phone using difflib
     3. Coordinate-based proximity matching
+    
+    Fuzzy matching only compares a lead against the unique leads that share
+    a blocking key with it (phone, coordinate cell, name token/prefix,
+    address number/prefix) instead of against every unique lead. The block
+    is first scored in one batch by the similarity backend (rapidfuzz or
+    NumPy, see similarity.py); only candidates whose score bound reaches the
+    threshold are confirmed with difflib.
+    
+    Fields are compared in canonical form (see normalization.py): names
+    without stopwords, addresses with abbreviations expanded and phones in
+    E.164. Each lead is normalized once per run.
+    
+    With deduplication.minhash enabled, the name/address token and grid
+    keys are replaced by an LSH index over MinHash signatures of the
+    normalized name + address (see minhash.py), which keeps candidate sets
+    small when tokens like "restaurant" are everywhere. Phone keys stay.
+    
+    With deduplication.mode set to 'cluster', duplicates are grouped with
+    union-find and each group is merged into one record instead of keeping
+    only the first lead (see cluster()).
+    
+    With deduplication.persistent_index enabled, kept leads are also
+    recorded in a SQLite index (see dedupe_store.py) and checked against it
+    on later runs; only_new drops leads recorded in an earlier run.
     """
     
     def __init__(self, config):
@@ -31,6 +128,46 @@ class Deduplicator:
         self.logger = logging.getLogger(__name__)
         self.threshold = config.deduplication['fuzzy_threshold']
         self.prefer_place_id = config.deduplication['prefer_place_id']
+        self.blocking = config.deduplication.get('blocking', True)
+        self.similarity = get_backend(config.deduplication.get('similarity_backend', 'auto'))
+        self.normalizer = get_normalizer(str(config.deduplication.get('default_country_code', '')))
+        self.only_new = config.deduplication.get('only_new', False)
+        self.mode = config.deduplication.get('mode', 'first')
+        self.cluster_stats: Optional[ClusterStats] = None
+        
+        self.minhash = config.deduplication.get('minhash', False)
+        self.lsh_bands = config.deduplication.get('minhash_bands', 16)
+        self.lsh_rows = config.deduplication.get('minhash_rows', 4)
+        self.minhasher = MinHasher(
+            self.lsh_bands * self.lsh_rows,
+            shingle_size=config.deduplication.get('shingle_size', 3)
+        ) if self.minhash else None
+        
+        self.store: Optional[DedupeStore] = None
+        if config.deduplication.get('persistent_index', False) or self.only_new:
+            self.store = DedupeStore(config.deduplication.get('index_file', './data/dedupe_index.db'))
+        
+        self.reset()
+    
+    def reset(self):
+        """Forget all leads seen so far in this run (the persistent index is kept)."""
+        self.unique_leads: List[Dict] = []
+        self.previously_seen = 0
+        self.seen_place_ids: Set[str] = set()
+        self.seen_signatures: Set[str] = set()
+        self.blocks: Dict[str, List[int]] = defaultdict(list)
+        self.spatial = GridIndex(BLOCK_CELL_DEGREES)
+        # Normalized name/address per unique lead, for batched scoring
+        self.match_names: List[str] = []
+        self.match_addresses: List[str] = []
+        # Normalized view of every lead seen in this run, by id(lead)
+        self._views: Dict[int, Tuple[Dict, NormalizedLead]] = {}
+        # Views of the persistent index rows being compared, by id(row)
+        self._store_views: Dict[int, NormalizedLead] = {}
+        self.lsh = LSHIndex(self.lsh_bands, self.lsh_rows) if self.minhash else None
+        # MinHash signatures computed ahead in one batch, by id(lead)
+        self._lsh_signatures: Dict[int, tuple] = {}
+        self._last_lsh_signature: Optional[Tuple[Dict, tuple]] = None
     
     def deduplicate(self, leads: List[Dict]) -> List[Dict]:
         """
@@ -45,95 +182,622 @@ class Deduplicator:
         if not leads:
             return []
         
-        self.logger.info(f"Deduplicating {len(leads)} leads...")
+        if self.mode == 'cluster':
+            return self.cluster(leads)
         
-        unique_leads = []
-        seen_place_ids: Set[str] = set()
-        seen_signatures: Set[str] = set()
+        self.logger.info(f"Deduplicating {len(leads)} leads...")
         
+        self.reset()
+        self._prepare_signatures(leads)
         for lead in leads:
-            # Strategy 1: place_id matching
+            self.add(lead)
+        self.flush()
+        self._lsh_signatures.clear()
+        unique_leads = self.unique_leads
+        
+        removed_count = len(leads) - len(unique_leads)
+        self.logger.info(f"Removed {removed_count} duplicates")
+        if self.store is not None:
+            self.logger.info(f"{self.previously_seen} leads were already seen in earlier runs")
+        
+        return unique_leads
+    
+    def add(self, lead: Dict) -> bool:
+        """
+        Check a lead against the leads seen so far and keep it if it is new.
+        
+        Lets callers stream leads in as they arrive instead of deduplicating
+        one finished list.
+        
+        Args:
+            lead: Business dictionary
+            
+        Returns:
+            True if the lead was new and kept, False if it was a duplicate
+        """
+        # Strategy 1: place_id matching
+        if self.prefer_place_id and lead.get('place_id'):
+            if lead['place_id'] in self.seen_place_ids:
+                self.logger.debug(f"Duplicate place_id: {lead.get('name')}")
+                return False
+            self.seen_place_ids.add(lead['place_id'])
+            return self._accept(lead)
+        
+        # Strategy 2: Fuzzy matching
+        candidates = self._candidates(lead) if self.blocking else range(len(self.unique_leads))
+        if self._is_duplicate_fuzzy(lead, candidates):
+            self.logger.debug(f"Fuzzy duplicate: {lead.get('name')}")
+            return False
+        
+        # Strategy 3: Exact signature matching (fallback)
+        signature = self._generate_signature(lead)
+        if signature in self.seen_signatures:
+            self.logger.debug(f"Duplicate signature: {lead.get('name')}")
+            return False
+        
+        self.seen_signatures.add(signature)
+        return self._accept(lead, signature)
+    
+    def flush(self):
+        """Write leads recorded in the persistent index to disk."""
+        if self.store is not None:
+            self.store.flush()
+    
+    def close(self):
+        """Flush and close the persistent index."""
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+    
+    def cluster(self, leads: List[Dict]) -> List[Dict]:
+        """
+        Group duplicate leads and merge each group into a single record.
+        
+        groups() matches every lead against the first lead of each cluster
+        found so far with the same strategies as add() (place_id, blocked fuzzy
+        match, signature); all clusters it matches are joined with
+        union-find. Each cluster is then merged with _merge_cluster() and,
+        with a persistent index, checked against earlier runs like add()
+        does. Statistics are left in self.cluster_stats.
+        
+        Args:
+            leads: List of business dictionaries
+            
+        Returns:
+            One merged record per cluster, in order of first appearance
+        """
+        start = time.perf_counter()
+        self.logger.info(f"Clustering {len(leads)} leads...")
+        
+        stats = ClusterStats(leads=len(leads))
+        merged = []
+        for members in self.groups(leads):
+            record, filled = self._merge_cluster([leads[i] for i in members])
+            merged.append(record)
+            stats.filled_fields += filled
+            if len(members) > 1:
+                stats.merged_clusters += 1
+            stats.largest_cluster = max(stats.largest_cluster, len(members))
+        
+        stats.clusters = len(merged)
+        stats.elapsed = time.perf_counter() - start
+        self.cluster_stats = stats
+        
+        if self.store is None:
+            self.unique_leads = merged
+        else:
+            # Check the merged records against earlier runs
+            self.reset()
+            for record in merged:
+                uses_place_id = self.prefer_place_id and record.get('place_id')
+                self._accept(record, None if uses_place_id else self._generate_signature(record))
+            self.flush()
+            merged = self.unique_leads
+        
+        self.logger.info(
+            f"{stats.clusters} clusters from {stats.leads} leads "
+            f"({stats.merged_clusters} merged, largest {stats.largest_cluster}, "
+            f"{stats.filled_fields} fields filled from duplicates) in {stats.elapsed:.2f}s"
+        )
+        return merged
+    
+    def groups(self, leads: List[Dict]) -> List[List[int]]:
+        """
+        Group duplicate leads without merging them.
+        
+        Args:
+            leads: List of business dictionaries
+            
+        Returns:
+            Indices into leads of each group's members, ordered by first member
+        """
+        self.reset()
+        self._prepare_signatures(leads)
+        forest = UnionFind(len(leads))
+        # Position in unique_leads -> index in leads of that cluster's first lead
+        founders: List[int] = []
+        place_ids: Dict[str, int] = {}
+        signatures: Dict[str, int] = {}
+        
+        for index, lead in enumerate(leads):
+            matches = []
+            signature = None
+            
             if self.prefer_place_id and lead.get('place_id'):
-                if lead['place_id'] in seen_place_ids:
-                    self.logger.debug(f"Duplicate place_id: {lead.get('name')}")
-                    continue
-                seen_place_ids.add(lead['place_id'])
-                unique_leads.append(lead)
-                continue
+                if lead['place_id'] in place_ids:
+                    matches.append(place_ids[lead['place_id']])
+            else:
+                candidates = self._candidates(lead) if self.blocking else range(len(self.unique_leads))
+                match = self._fuzzy_match(
+                    lead, candidates, self.unique_leads, self.match_names, self.match_addresses
+                )
+                if match is not None:
+                    matches.append(match)
+                
+                signature = self._generate_signature(lead)
+                if signature in signatures:
+                    matches.append(signatures[signature])
             
-            # Strategy 2: Fuzzy matching
-            if self._is_duplicate_fuzzy(lead, unique_leads):
-                self.logger.debug(f"Fuzzy duplicate: {lead.get('name')}")
-                continue
+            if matches:
+                position = matches[0]
+                for other in matches:
+                    forest.union(founders[position], founders[other])
+                forest.union(founders[position], index)
+            else:
+                position = len(self.unique_leads)
+                founders.append(index)
+                self._keep(lead)
             
-            # Strategy 3: Exact signature matching (fallback)
-            signature = self._generate_signature(lead)
-            if signature in seen_signatures:
-                self.logger.debug(f"Duplicate signature: {lead.get('name')}")
-                continue
+            if self.prefer_place_id and lead.get('place_id'):
+                place_ids.setdefault(lead['place_id'], position)
+            if signature is not None:
+                signatures.setdefault(signature, position)
+        
+        self._lsh_signatures.clear()
+        return forest.groups()
+    
+    def nearby_duplicates(self, leads: List[Dict], radius_m: float = 100.0) -> List[Dict]:
+        """
+        List pairs of leads located within a radius of each other.
+        
+        Meant for reviewing deduplicated output: two listings at the same
+        spot are often one business under slightly different names.
+        
+        Args:
+            leads: List of business dictionaries
+            radius_m: Maximum distance between the two leads in meters
             
-            seen_signatures.add(signature)
-            unique_leads.append(lead)
+        Returns:
+            One dict per pair, closest pairs first
+        """
+        points = []
+        for index, lead in enumerate(leads):
+            coordinates = self._coordinates(lead)
+            if coordinates:
+                points.append((index, *coordinates))
         
-        removed_count = len(leads) - len(unique_leads)
-        self.logger.info(f"Removed {removed_count} duplicates")
+        report = []
+        for first, second, distance in nearby_pairs(points, radius_m):
+            lead1, lead2 = leads[first], leads[second]
+            name_sim = 0.0
+            name1, name2 = self._view(lead1).name, self._view(lead2).name
+            if name1 and name2:
+                name_sim = self._string_similarity(name1, name2)
+            report.append({
+                'name_1': lead1.get('name'),
+                'address_1': lead1.get('address'),
+                'place_id_1': lead1.get('place_id'),
+                'name_2': lead2.get('name'),
+                'address_2': lead2.get('address'),
+                'place_id_2': lead2.get('place_id'),
+                'distance_m': round(distance, 1),
+                'name_similarity': round(name_sim, 3),
+                'similarity': round(self._calculate_similarity(lead1, lead2), 3)
+            })
         
-        return unique_leads
+        report.sort(key=lambda row: row['distance_m'])
+        return report
     
-    def _is_duplicate_fuzzy(self, lead: Dict, existing_leads: List[Dict]) -> bool:
+    def _merge_cluster(self, records: List[Dict]) -> Tuple[Dict, int]:
+        """
+        Merge the records of one cluster using survivorship rules.
+        
+        The survivor is the most complete record, then the most recent
+        (timestamp), then the one with the most reviews. Fields it lacks are
+        filled from the other records in the same order of preference, and
+        rating/reviews come from the record with the most reviews.
+        
+        Args:
+            records: Leads of one cluster
+            
+        Returns:
+            Tuple of (merged record, number of fields filled from other records)
+        """
+        if len(records) == 1:
+            return records[0], 0
+        
+        ranked = sorted(
+            records,
+            key=lambda r: (self._completeness(r), str(r.get('timestamp') or ''), self._review_count(r)),
+            reverse=True
+        )
+        
+        merged = dict(ranked[0])
+        filled = 0
+        for record in ranked[1:]:
+            for field, value in record.items():
+                if self._is_empty(merged.get(field)) and not self._is_empty(value):
+                    merged[field] = value
+                    filled += 1
+        
+        most_reviewed = max(ranked, key=self._review_count)
+        if self._review_count(most_reviewed) > self._review_count(merged):
+            merged['reviews'] = most_reviewed.get('reviews')
+            if not self._is_empty(most_reviewed.get('rating')):
+                merged['rating'] = most_reviewed['rating']
+        
+        sources = sorted({str(r['source']) for r in records if r.get('source')})
+        if sources:
+            merged['source'] = ', '.join(sources)
+        merged['cluster_size'] = len(records)
+        
+        return merged, filled
+    
+    @staticmethod
+    def _is_empty(value) -> bool:
+        return value is None or value == '' or value == [] or value == {}
+    
+    def _completeness(self, record: Dict) -> int:
+        """Count the non-empty business fields of a record."""
+        return sum(
+            1 for field, value in record.items()
+            if field not in BOOKKEEPING_FIELDS and not self._is_empty(value)
+        )
+    
+    @staticmethod
+    def _review_count(record: Dict) -> int:
+        """Parse the review count of a record ('1,234 reviews' -> 1234)."""
+        reviews = record.get('reviews')
+        if isinstance(reviews, (int, float)):
+            return int(reviews)
+        digits = ''.join(filter(str.isdigit, str(reviews or '')))
+        return int(digits) if digits else 0
+    
+    def _accept(self, lead: Dict, signature: Optional[str] = None) -> bool:
+        """
+        Keep a lead that is new in this run, consulting the persistent index.
+        
+        Args:
+            lead: Business dictionary
+            signature: Lead signature (None when matched by place_id)
+            
+        Returns:
+            False if only_new is set and an earlier run already kept the lead
+        """
+        if self.store is None:
+            self._keep(lead)
+            return True
+        
+        first_seen = self._first_seen(lead, signature)
+        if first_seen:
+            self.previously_seen += 1
+            if self.only_new:
+                self.logger.debug(f"Seen in an earlier run: {lead.get('name')}")
+                return False
+            lead['first_seen'] = first_seen
+        
+        self._keep(lead)
+        if not first_seen:
+            self.store.add(lead, signature, self._store_keys(lead))
+        return True
+    
+    def _first_seen(self, lead: Dict, signature: Optional[str]) -> Optional[str]:
+        """
+        Look a lead up in the persistent index with the same strategies as add().
+        
+        Args:
+            lead: Business dictionary
+            signature: Lead signature (None when matched by place_id)
+            
+        Returns:
+            When the matching recorded lead was first kept, or None
+        """
+        if signature is None:
+            return self.store.first_seen(place_id=lead['place_id'])
+        
+        stored = self.store.candidates(self._store_keys(lead, query=True))
+        # Store rows are only compared in this lookup, so their views are dropped
+        # afterwards instead of joining _views for the rest of the run
+        self._store_views = {id(item): self.normalizer.lead(item) for item in stored}
+        try:
+            views = [self._store_views[id(item)] for item in stored]
+            match = self._fuzzy_match(
+                lead,
+                range(len(stored)),
+                stored,
+                [view.name for view in views],
+                [view.address for view in views]
+            )
+        finally:
+            self._store_views = {}
+        if match is not None:
+            return stored[match]['first_seen']
+        
+        return self.store.first_seen(signature=signature)
+    
+    def _store_keys(self, lead: Dict, query: bool = False) -> Set[str]:
+        """
+        Blocking keys of a lead in the persistent index: the selective ones
+        (STORE_KEY_PREFIXES) and grid cells.
+        
+        Args:
+            lead: Business dictionary
+            query: Include every cell within COORDINATE_RADIUS_M instead of
+                only the lead's own cell
+            
+        Returns:
+            Set of blocking key strings
+        """
+        keys = {key for key in self._blocking_keys(lead) if key.startswith(STORE_KEY_PREFIXES)}
+        coordinates = self._coordinates(lead)
+        if coordinates:
+            if query:
+                cells = cells_within(*coordinates, COORDINATE_RADIUS_M, BLOCK_CELL_DEGREES)
+            else:
+                cells = [grid_cell(*coordinates, BLOCK_CELL_DEGREES)]
+            keys.update(f"geo:{row}:{col}" for row, col in cells)
+        return keys
+    
+    def _keep(self, lead: Dict):
+        """Record a unique lead and index it under its blocking keys."""
+        index = len(self.unique_leads)
+        self.unique_leads.append(lead)
+        view = self._view(lead)
+        self.match_names.append(view.name)
+        self.match_addresses.append(view.address)
+        
+        if self.blocking:
+            for key in self._index_keys(lead):
+                self.blocks[key].append(index)
+            if self.lsh is not None:
+                self.lsh.add(index, self._lsh_signature(lead))
+            else:
+                coordinates = self._coordinates(lead)
+                if coordinates:
+                    self.spatial.add(index, *coordinates)
+    
+    def _candidates(self, lead: Dict) -> List[int]:
+        """
+        Return the unique leads that share a blocking key with a lead or lie
+        within COORDINATE_RADIUS_M of it.
+        
+        Args:
+            lead: Business dictionary
+            
+        Returns:
+            Sorted indices into unique_leads
+        """
+        indices = set()
+        for key in self._index_keys(lead):
+            indices.update(self.blocks.get(key, ()))
+        
+        if self.lsh is not None:
+            indices.update(self.lsh.query(self._lsh_signature(lead)))
+        else:
+            coordinates = self._coordinates(lead)
+            if coordinates:
+                indices.update(index for index, _ in self.spatial.query(*coordinates, COORDINATE_RADIUS_M))
+        
+        return sorted(indices)
+    
+    def _index_keys(self, lead: Dict) -> Set[str]:
+        """Blocking keys used in this run: only the phone key when MinHash is on."""
+        if self.lsh is None:
+            return self._blocking_keys(lead)
+        phone = self._view(lead).phone
+        return {f"phone:{self.normalizer.phone_key(phone)}"} if phone else set()
+    
+    def _prepare_signatures(self, leads: List[Dict]):
+        """Compute the MinHash signatures of a whole list in one batch."""
+        if self.minhasher is None:
+            return
+        signatures = self.minhasher.signatures([self._lsh_text(lead) for lead in leads])
+        self._lsh_signatures = {id(lead): signature for lead, signature in zip(leads, signatures)}
+    
+    def _lsh_signature(self, lead: Dict) -> tuple:
+        """Return a lead's MinHash signature, computing it if it wasn't prepared."""
+        signature = self._lsh_signatures.get(id(lead))
+        if signature is not None:
+            return signature
+        
+        # add() looks the signature up twice (_candidates, then _keep)
+        if self._last_lsh_signature is not None and self._last_lsh_signature[0] is lead:
+            return self._last_lsh_signature[1]
+        
+        signature = self.minhasher.signature(self._lsh_text(lead))
+        self._last_lsh_signature = (lead, signature)
+        return signature
+    
+    def _lsh_text(self, lead: Dict) -> str:
+        """Normalized name + address text that MinHash shingles."""
+        view = self._view(lead)
+        return f"{view.name} {view.address}"
+    
+    def _view(self, lead: Dict) -> NormalizedLead:
+        """Return a lead's normalized fields, normalizing it on first use in this run."""
+        entry = self._views.get(id(lead))
+        if entry is not None and entry[0] is lead:
+            return entry[1]
+        view = self._store_views.get(id(lead))
+        if view is not None:
+            return view
+        view = self.normalizer.lead(lead)
+        self._views[id(lead)] = (lead, view)
+        return view
+    
+    def _blocking_keys(self, lead: Dict) -> Set[str]:
+        """
+        Generate the non-spatial blocking keys of a lead.
+        
+        Args:
+            lead: Business dictionary
+            
+        Returns:
+            Set of blocking key strings
+        """
+        keys = set()
+        view = self._view(lead)
+        
+        if view.phone:
+            keys.add(f"phone:{self.normalizer.phone_key(view.phone)}")
+        
+        name_tokens = view.name_tokens
+        keys.update(f"name:{token}" for token in name_tokens if len(token) > 1)
+        if name_tokens:
+            keys.add(f"nprefix:{''.join(name_tokens)[:NAME_PREFIX_LENGTH]}")
+        
+        address_tokens = view.address_tokens
+        keys.update(
+            f"addr:{token}" for token in address_tokens
+            if any(char.isdigit() for char in token)
+        )
+        if address_tokens:
+            keys.add(f"aprefix:{''.join(address_tokens)[:ADDRESS_PREFIX_LENGTH]}")
+        
+        return keys
+    
+    def _coordinates(self, lead: Dict) -> Optional[Tuple[float, float]]:
+        """Return a lead's (latitude, longitude), if it has any."""
+        if not lead.get('latitude') or lead.get('longitude') is None:
+            return None
+        return lead['latitude'], lead['longitude']
+    
+    def _is_duplicate_fuzzy(self, lead: Dict, candidates: Sequence[int]) -> bool:
         """
         Check if lead is a fuzzy duplicate of any existing lead.
         
         Args:
             lead: Business dictionary to check
-            existing_leads: List of existing unique leads
+            candidates: Indices of the unique leads to compare against
             
         Returns:
             True if duplicate found, False otherwise
         """
-        for existing in existing_leads:
-            similarity = self._calculate_similarity(lead, existing)
+        match = self._fuzzy_match(
+            lead, candidates, self.unique_leads, self.match_names, self.match_addresses
+        )
+        return match is not None
+    
+    def _fuzzy_match(self, lead: Dict, candidates: Sequence[int], leads: List[Dict],
+                     names: List[str], addresses: List[str]) -> Optional[int]:
+        """
+        Find the first candidate a lead is a fuzzy duplicate of.
+        
+        Args:
+            lead: Business dictionary to check
+            candidates: Indices into leads to compare against
+            leads: Pool of leads
+            names: Normalized names aligned with leads
+            addresses: Normalized addresses aligned with leads
             
-            if similarity >= self.threshold:
-                return True
+        Returns:
+            Index of the matching lead, or None
+        """
+        if self.similarity.exact:
+            for index in candidates:
+                similarity = self._calculate_similarity(lead, leads[index])
+                
+                if similarity >= self.threshold:
+                    return index
+            
+            return None
+        
+        view = self._view(lead)
+        name_bounds = self._batch_similarity(view.name, names, candidates)
+        address_bounds = self._batch_similarity(view.address, addresses, candidates)
+        
+        # Best weighted score possible if phone and coordinates matched too
+        limit = self.threshold * 1.3 - 0.5 - BOUND_TOLERANCE
+        
+        for index, name_bound, address_bound in zip(candidates, name_bounds, address_bounds):
+            if 0.4 * name_bound + 0.4 * address_bound < limit:
+                continue
+            
+            existing = leads[index]
+            bound = self._calculate_similarity(lead, existing, name_bound, address_bound)
+            if bound < self.threshold - BOUND_TOLERANCE:
+                continue
+            
+            if self._calculate_similarity(lead, existing) >= self.threshold:
+                return index
         
-        return False
+        return None
     
-    def _calculate_similarity(self, lead1: Dict, lead2: Dict) -> float:
+    def _batch_similarity(self, value: str, texts: List[str],
+                          candidates: Sequence[int]) -> List[float]:
+        """
+        Score one field of a lead against a candidate block in a single backend call.
+        
+        Args:
+            value: The lead's normalized field value
+            texts: Normalized field values of the candidate pool
+            candidates: Indices of the candidates to score
+            
+        Returns:
+            Score upper bound per candidate (1.0 where either value is empty,
+            since _calculate_similarity then leaves the field out)
+        """
+        if not value:
+            return [1.0] * len(candidates)
+        
+        others = [texts[index] for index in candidates]
+        positions = [i for i, other in enumerate(others) if other]
+        if len(positions) == len(others):
+            return self.similarity.ratios(value, others)
+        
+        bounds = [1.0] * len(others)
+        scores = self.similarity.ratios(value, [others[i] for i in positions])
+        for i, score in zip(positions, scores):
+            bounds[i] = score
+        
+        return bounds
+    
+    def _calculate_similarity(self, lead1: Dict, lead2: Dict,
+                              name_sim: Optional[float] = None,
+                              addr_sim: Optional[float] = None) -> float:
         """
         Calculate similarity score between two leads.
         
-        Uses weighted fuzzy matching on multiple fields using difflib.
+        Uses weighted fuzzy matching on the normalized fields using difflib.
         
         Args:
             lead1: First business dictionary
             lead2: Second business dictionary
+            name_sim: Precomputed name score to use instead of difflib
+            addr_sim: Precomputed address score to use instead of difflib
             
         Returns:
             Similarity score between 0.0 and 1.0
         """
         # Fields to compare with weights
         comparisons = []
+        view1, view2 = self._view(lead1), self._view(lead2)
         
         # Name comparison (weight: 0.4)
-        name1 = lead1.get('name', '')
-        name2 = lead2.get('name', '')
-        if name1 and name2:
-            name_sim = self._string_similarity(name1.lower(), name2.lower())
+        if view1.name and view2.name:
+            if name_sim is None:
+                name_sim = self._string_similarity(view1.name, view2.name)
             comparisons.append(('name', name_sim, 0.4))
         
         # Address comparison (weight: 0.4)
-        addr1 = lead1.get('address', '')
-        addr2 = lead2.get('address', '')
-        if addr1 and addr2:
-            addr_sim = self._string_similarity(addr1.lower(), addr2.lower())
+        if view1.address and view2.address:
+            if addr_sim is None:
+                addr_sim = self._string_similarity(view1.address, view2.address)
             comparisons.append(('address', addr_sim, 0.4))
         
         # Phone comparison (weight: 0.2)
-        phone1 = self._normalize_phone(lead1.get('phone', ''))
-        phone2 = self._normalize_phone(lead2.get('phone', ''))
-        if phone1 and phone2:
-            phone_sim = 1.0 if phone1 == phone2 else 0.0
+        if view1.phone and view2.phone:
+            phone_sim = 1.0 if self.normalizer.phones_match(view1.phone, view2.phone) else 0.0
             comparisons.append(('phone', phone_sim, 0.2))
         
         # Coordinate comparison (weight: 0.3)
@@ -177,13 +841,8 @@ class Deduplicator:
         Returns:
             Similarity score (1.0 if very close, decreasing with distance)
         """
-        # Calculate approximate distance in meters
-        lat1, lon1 = coord1
-        lat2, lon2 = coord2
-        
-        # Simple Euclidean distance (good enough for small distances)
-        # 1 degree ≈ 111km at equator
-        distance = ((lat1 - lat2)**2 + (lon1 - lon2)**2)**0.5 * 111000
+        # Great-circle distance in meters
+        distance = haversine_m(coord1[0], coord1[1], coord2[0], coord2[1])
         
         # Consider matches within 100m as very similar
         if distance < 100:
@@ -203,13 +862,9 @@ class Deduplicator:
             phone: Phone number string
             
         Returns:
-            Normalized phone number (digits only)
+            E.164 number, or the digits if no country code is known
         """
-        if not phone:
-            return ''
-        
-        # Remove all non-digit characters
-        return ''.join(filter(str.isdigit, phone))
+        return self.normalizer.phone(phone or '')
     
     def _generate_signature(self, lead: Dict) -> str:
         """
@@ -222,8 +877,5 @@ class Deduplicator:
             Signature string
         """
         # Combine normalized fields
-        name = lead.get('name', '').lower().strip()
-        address = lead.get('address', '').lower().strip()
-        phone = self._normalize_phone(lead.get('phone', ''))
-        
-        return f"{name}|{address}|{phone}"
+        view = self._view(lead)
+        return f"{view.name}|{view.address}|{view.phone}"
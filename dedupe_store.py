@@ -0,0 +1,195 @@
+"""
+Persistent deduplication index.
+
+Keeps the place_ids, signatures and blocking keys of every lead the
+Deduplicator has kept in a SQLite file, so later runs can recognise leads
+scraped in earlier ones. Lookups and inserts go through primary-key
+indexes; writes are committed in batches. A lookup reads at most
+MAX_KEY_CANDIDATES leads per blocking key (the most recent ones), so its
+cost does not grow with the size of the store.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS leads (
+        id INTEGER PRIMARY KEY,
+        place_id TEXT,
+        name TEXT,
+        address TEXT,
+        phone TEXT,
+        latitude REAL,
+        longitude REAL,
+        first_seen TEXT
+    );
+    CREATE TABLE IF NOT EXISTS place_ids (
+        place_id TEXT PRIMARY KEY,
+        lead_id INTEGER
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS signatures (
+        signature TEXT PRIMARY KEY,
+        lead_id INTEGER
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS block_keys (
+        key TEXT,
+        lead_id INTEGER,
+        PRIMARY KEY (key, lead_id)
+    ) WITHOUT ROWID;
+'''
+
+LEAD_FIELDS = ('place_id', 'name', 'address', 'phone', 'latitude', 'longitude', 'first_seen')
+
+# SQLite caps the number of bound parameters per statement
+MAX_QUERY_KEYS = 500
+
+# Leads read per blocking key in a lookup (newest first)
+MAX_KEY_CANDIDATES = 200
+
+
+class DedupeStore:
+    """SQLite-backed record of every lead kept across runs."""
+    
+    def __init__(self, path: str, batch_size: int = 1000):
+        """
+        Open (or create) the index file.
+        
+        Args:
+            path: SQLite file path
+            batch_size: Number of recorded leads per commit
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(__name__)
+        self._pending = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+    
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM leads').fetchone()[0]
+    
+    def candidates(self, keys: Iterable[str], limit_per_key: int = MAX_KEY_CANDIDATES) -> List[Dict]:
+        """
+        Return recorded leads that share at least one blocking key.
+        
+        Args:
+            keys: Blocking keys to look up
+            limit_per_key: Most recently recorded leads read per key
+        
+        Returns:
+            Lead dictionaries with the LEAD_FIELDS, oldest first
+        """
+        lead_ids = set()
+        
+        for key in keys:
+            lead_ids.update(
+                row[0] for row in self.conn.execute(
+                    'SELECT lead_id FROM block_keys WHERE key = ? ORDER BY lead_id DESC LIMIT ?',
+                    (key, limit_per_key)
+                )
+            )
+        
+        if not lead_ids:
+            return []
+        
+        ids = sorted(lead_ids)
+        leads = []
+        for start in range(0, len(ids), MAX_QUERY_KEYS):
+            chunk = ids[start:start + MAX_QUERY_KEYS]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = self.conn.execute(
+                f'SELECT {", ".join(LEAD_FIELDS)} FROM leads WHERE id IN ({placeholders}) ORDER BY id',
+                chunk
+            )
+            leads.extend(dict(zip(LEAD_FIELDS, row)) for row in cursor)
+        
+        return leads
+    
+    def first_seen(self, place_id: Optional[str] = None, signature: Optional[str] = None) -> Optional[str]:
+        """
+        Return when a recorded lead was first kept.
+        
+        Args:
+            place_id: place_id to look up
+            signature: Signature to look up if place_id is not given or unknown
+        
+        Returns:
+            ISO timestamp, or None if the lead is unknown
+        """
+        lookups = []
+        if place_id:
+            lookups.append(('place_ids', 'place_id', place_id))
+        if signature:
+            lookups.append(('signatures', 'signature', signature))
+        
+        for table, column, value in lookups:
+            row = self.conn.execute(
+                f'SELECT leads.first_seen FROM {table} JOIN leads ON leads.id = {table}.lead_id '
+                f'WHERE {table}.{column} = ?', (value,)
+            ).fetchone()
+            if row:
+                return row[0]
+        
+        return None
+    
+    def add(self, lead: Dict, signature: Optional[str], keys: Iterable[str]):
+        """
+        Record a kept lead.
+        
+        Args:
+            lead: Business dictionary
+            signature: Lead signature (None for leads matched by place_id)
+            keys: Blocking keys of the lead
+        """
+        cursor = self.conn.execute(
+            f'INSERT INTO leads ({", ".join(LEAD_FIELDS)}) VALUES ({",".join("?" * len(LEAD_FIELDS))})',
+            (
+                lead.get('place_id'),
+                lead.get('name'),
+                lead.get('address'),
+                lead.get('phone'),
+                lead.get('latitude'),
+                lead.get('longitude'),
+                datetime.now().isoformat(timespec='seconds')
+            )
+        )
+        lead_id = cursor.lastrowid
+        
+        if lead.get('place_id'):
+            self.conn.execute(
+                'INSERT OR IGNORE INTO place_ids (place_id, lead_id) VALUES (?, ?)',
+                (lead['place_id'], lead_id)
+            )
+        if signature:
+            self.conn.execute(
+                'INSERT OR IGNORE INTO signatures (signature, lead_id) VALUES (?, ?)',
+                (signature, lead_id)
+            )
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO block_keys (key, lead_id) VALUES (?, ?)',
+            [(key, lead_id) for key in keys]
+        )
+        
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """Commit recorded leads to disk."""
+        if self._pending:
+            self.conn.commit()
+            self._pending = 0
+    
+    def close(self):
+        """Commit and close the index file."""
+        self.flush()
+        self.conn.close()
@@ -2,16 +2,169 @@
 Data export module for business leads.
 
 Handles exporting to CSV, JSON, and SQLite formats with email support.
+CSV and JSON files can be gzip or zstd compressed (export.compression).
+MemoryExport builds the files in memory instead, e.g. for downloads.
 """
 
-import json
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 import csv
 import sqlite3
 import logging
+import tempfile
 from pathlib import Path
-from typing import List, Dict
-import pandas as pd
+from typing import BinaryIO, List, Dict, Iterable, Optional, Tuple
+import xlsxwriter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from compressed_files import ZSTD_AVAILABLE, check_codec, compressed_path, open_text
+from json_io import write_array
+from lead_search import create_fts_index
+from lead_store import LeadStore, open_store
+from lead_table import LeadTable
+from normalization import get_normalizer
+from stream_writers import LEAD_COLUMNS, STREAM_WRITERS, StreamWriter
+
+
+# Columns of the SQLite leads table (besides lead_key)
+SQLITE_COLUMNS = [
+    'place_id', 'name', 'address', 'phone', 'email', 'website',
+    'facebook', 'instagram', 'twitter', 'linkedin', 'youtube', 'tiktok', 'whatsapp_status',
+    'opening_hours', 'price_level',
+    'category', 'rating', 'reviews', 'latitude', 'longitude', 'maps_url',
+    'source_url', 'timestamp', 'labels'
+]
+
+# Columns indexed for common filters
+SQLITE_INDEXED_COLUMNS = ['category', 'rating', 'phone', 'email', 'timestamp']
+
+# Columns of Parquet files: the CSV columns plus where each lead came from
+PARQUET_COLUMNS = LEAD_COLUMNS + ['source', 'query', 'location']
+
+# Arrow types of the non-string Parquet columns
+PARQUET_TYPES = {
+    'rating': 'float64',
+    'reviews': 'int64',
+    'latitude': 'float64',
+    'longitude': 'float64',
+}
+
+# Columns a Parquet export can be partitioned by ('date' is the day of the lead's timestamp)
+PARQUET_PARTITIONS = ['query', 'location', 'date']
+
+# Excel column groups, in sheet order
+EXCEL_CONTACT_COLUMNS = ['name', 'category', 'phone', 'email', 'website', 'address', 'opening_hours', 'price_level']
+EXCEL_SOCIAL_COLUMNS = ['facebook', 'instagram', 'twitter', 'linkedin', 'youtube', 'tiktok', 'whatsapp_status']
+EXCEL_METRIC_COLUMNS = ['rating', 'reviews']
+EXCEL_CRM_COLUMNS = ['Status', 'Next Action', 'Notes']
+EXCEL_CRM_DEFAULTS = {'Status': 'New', 'Next Action': '', 'Notes': ''}
+
+# Lowercase CRM fields are superseded by the CRM columns
+EXCEL_HIDDEN_COLUMNS = ['status', 'next_action', 'notes']
+
+# Column headers for a professional look
+EXCEL_HEADERS = {
+    'name': 'Business Name',
+    'category': 'Category',
+    'phone': 'Phone Number',
+    'website': 'Website',
+    'address': 'Full Address',
+    'opening_hours': 'Opening Hours',
+    'price_level': 'Price Level',
+    'rating': 'Rating',
+    'reviews': 'Review Count',
+    'facebook': 'Facebook',
+    'instagram': 'Instagram',
+    'twitter': 'X / Twitter',
+    'linkedin': 'LinkedIn',
+    'youtube': 'YouTube',
+    'tiktok': 'TikTok',
+    'whatsapp_status': 'WhatsApp Availability',
+    'maps_url': 'Google Maps Link',
+    'place_id': 'Place ID'
+}
+EXCEL_SOCIAL_HEADERS = ['Facebook', 'Instagram', 'X / Twitter', 'LinkedIn', 'YouTube', 'TikTok']
+
+# Column widths of wrapped text and centered columns
+EXCEL_TEXT_WIDTHS = {
+    'Business Name': 35, 'Category': 20, 'Phone Number': 18, 'email': 30, 'Website': 30, 'Full Address': 40
+}
+EXCEL_CENTER_WIDTHS = {'WhatsApp Availability': 22, 'Rating': 10, 'Review Count': 12}
+
+
+@dataclass
+class ExportReport:
+    """Files written by one export and how long each step took."""
+    
+    files: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    prepare: float = 0.0
+    elapsed: float = 0.0
+
+
+class MemoryExport:
+    """
+    Export files of one lead list, built in memory when first requested.
+    
+    Nothing is written to disk: file() renders a format into a BytesIO the
+    first time it is asked for and keeps the result, so formats that are
+    never downloaded are never built.
+    """
+    
+    def __init__(self, exporter: 'DataExporter', data: List[Dict], formats: List[str], filename: str):
+        """
+        Prepare the leads for export.
+        
+        Args:
+            exporter: Exporter whose settings (compression etc.) are used
+            data: List of business dictionaries
+            formats: Formats that may be requested
+            filename: Base filename (without extension)
+        """
+        self.exporter = exporter
+        self.table = LeadTable(data)
+        self.formats = list(dict.fromkeys(formats))
+        self.filename = filename
+        self._files: Dict[str, Optional[Tuple[str, bytes]]] = {}
+    
+    def file(self, fmt: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Return one format's file, building it on the first request.
+        
+        Args:
+            fmt: Format string ('csv', 'json', 'sqlite', 'excel', 'parquet')
+            
+        Returns:
+            Tuple of (file name, content), or None if the format cannot be written
+        """
+        if fmt not in self._files:
+            self._files[fmt] = self.exporter.export_bytes(self.table, fmt, self.filename)
+        return self._files[fmt]
+
+
+def _serialize_sqlite(conn: sqlite3.Connection) -> bytes:
+    """Contents of a database file holding conn's database."""
+    if hasattr(conn, 'serialize'):
+        return conn.serialize()
+    # Connection.serialize() needs Python 3.11: copy into a temporary file instead
+    with tempfile.TemporaryDirectory(prefix='leads-sqlite-') as directory:
+        path = Path(directory) / 'leads.db'
+        target = sqlite3.connect(path)
+        try:
+            conn.backup(target)
+        finally:
+            target.close()
+        return path.read_bytes()
 
 
 class DataExporter:
@@ -23,12 +176,21 @@ class DataExporter:
         
         Args:
             config: Configuration object
-            output_dir: Directory for output files
+            output_dir: Directory for output files (created on the first export
+                that writes files; in-memory exports never create it)
         """
         self.config = config
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        self.normalizer = get_normalizer(str(config.deduplication.get('default_country_code', '')))
+        
+        # CSV and JSON files are compressed as they are written (leads.csv.gz, leads.jsonl.zst)
+        self.compression = config.export.get('compression') or 'none'
+        self.compression_level = config.export.get('compression_level')
+        if self.compression == 'zstd' and not ZSTD_AVAILABLE:
+            self.logger.warning("zstd compression requires zstandard (pip install zstandard); writing uncompressed files")
+            self.compression = 'none'
+        check_codec(self.compression)
     
     def export(self, data: List[Dict], formats: List[str], filename: str) -> List[str]:
         """
@@ -36,92 +198,379 @@ class DataExporter:
         
         Args:
             data: List of business dictionaries
-            formats: List of format strings ('csv', 'json', 'sqlite')
+            formats: List of format strings ('csv', 'json', 'sqlite', 'excel', 'parquet')
             filename: Base filename (without extension)
             
         Returns:
             List of created file paths
         """
-        exported_files = []
-        
-        for fmt in formats:
-            if fmt == 'csv':
-                file_path = self._export_csv(data, filename)
-            elif fmt == 'json':
-                file_path = self._export_json(data, filename)
-            elif fmt == 'sqlite':
-                file_path = self._export_sqlite(data, filename)
-            elif fmt == 'excel':
-                file_path = self._export_excel(data, filename)
+        return self.export_report(data, formats, filename).files
+    
+    def export_report(self, data: List[Dict], formats: List[str], filename: str,
+                      master: bool = True) -> ExportReport:
+        """
+        Export data to specified formats and report per-format timings.
+        
+        The leads are normalized once into a LeadTable that every writer
+        reads. The formats are then written concurrently, one thread per
+        format, unless export.parallel_formats is false or there is only
+        one CPU. If export.master_store_dir is set, the leads are also
+        added to the master lead store.
+        
+        Args:
+            data: List of business dictionaries
+            formats: List of format strings ('csv', 'json', 'sqlite', 'excel', 'parquet')
+            filename: Base filename (without extension)
+            master: Add the leads to the configured master store
+            
+        Returns:
+            ExportReport with the created file paths and timings
+        """
+        start = time.perf_counter()
+        report = ExportReport()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        available = self._writers()
+        writers = {}
+        for fmt in dict.fromkeys(formats):
+            if fmt in available:
+                writers[fmt] = available[fmt]
             else:
                 self.logger.warning(f"Unknown format: {fmt}")
-                continue
-            
+        
+        table = LeadTable(data)
+        report.prepare = time.perf_counter() - start
+        
+        def write(fmt):
+            began = time.perf_counter()
+            file_path = writers[fmt](table, filename)
+            return file_path, time.perf_counter() - began
+        
+        # The writers are mostly Python and share the GIL; threads only pay off when
+        # SQLite, Arrow and file I/O can run on another core
+        parallel = self.config.export.get('parallel_formats', True) and (os.cpu_count() or 1) > 1
+        if len(writers) > 1 and parallel:
+            with ThreadPoolExecutor(max_workers=len(writers), thread_name_prefix='export') as executor:
+                results = dict(zip(writers, executor.map(write, writers)))
+        else:
+            results = {fmt: write(fmt) for fmt in writers}
+        
+        for fmt, (file_path, seconds) in results.items():
+            report.timings[fmt] = seconds
             if file_path:
-                exported_files.append(file_path)
-                self.logger.info(f"✓ Exported to {fmt.upper()}: {file_path}")
+                report.files.append(file_path)
+                self.logger.info(f"✓ Exported to {fmt.upper()} in {seconds:.2f}s: {file_path}")
+        
+        if master and data and self.config.export.get('master_store_dir'):
+            began = time.perf_counter()
+            with open_store(self.config) as store:
+                store.add(data)
+            report.timings['master_store'] = time.perf_counter() - began
+        
+        report.elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"Exported {len(table)} leads to {len(report.files)} formats in {report.elapsed:.2f}s "
+            f"(normalized in {report.prepare:.2f}s)"
+        )
+        return report
+    
+    def export_memory(self, data: List[Dict], formats: List[str], filename: str) -> MemoryExport:
+        """
+        Prepare an in-memory export whose files are built only when requested.
         
-        return exported_files
+        Args:
+            data: List of business dictionaries
+            formats: Formats that may be requested
+            filename: Base filename of the files (without extension)
+            
+        Returns:
+            MemoryExport (see MemoryExport.file())
+        """
+        return MemoryExport(self, data, formats, filename)
     
-    def _export_csv(self, data: List[Dict], filename: str) -> str:
-        """Export to CSV format with email field."""
-        file_path = self.output_dir / f"{filename}.csv"
+    def export_bytes(self, table: LeadTable, fmt: str, filename: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Write one format into memory instead of the output directory.
         
-        if not data:
-            self.logger.warning("No data to export to CSV")
-            return str(file_path)
+        Args:
+            table: Leads to export
+            fmt: Format string ('csv', 'json', 'sqlite', 'excel', 'parquet')
+            filename: Base filename (without extension)
+            
+        Returns:
+            Tuple of (file name, content), or None if the format cannot be written
+        """
+        writer = self._writers().get(fmt)
+        if writer is None:
+            self.logger.warning(f"Unknown format: {fmt}")
+            return None
+        
+        buffer = io.BytesIO()
+        file_path = writer(table, filename, buffer)
+        if not file_path:
+            return None
+        return Path(file_path).name, buffer.getvalue()
+    
+    def export_delta(self, store: LeadStore, formats: List[str], consumer: str = 'default',
+                     filename: Optional[str] = None) -> List[str]:
+        """
+        Export only the leads added or changed since a consumer's last delta export.
+        
+        The changes come from the master store's index (see LeadStore.changes());
+        the consumer's watermark is advanced once the files are written.
+        
+        Args:
+            store: Master lead store
+            formats: List of format strings ('csv', 'json', 'sqlite', 'excel', 'parquet')
+            consumer: Name whose watermark is used and advanced
+            filename: Base filename (default: delta_<consumer>_<first>-<last change>)
+            
+        Returns:
+            List of created file paths (empty if nothing changed)
+        """
+        since = store.watermark(consumer)
+        leads, upto = store.changes(since)
+        if not leads:
+            self.logger.info(f"No leads changed since the last export of {consumer}")
+            return []
+        
+        files = self.export_report(leads, formats, filename or f"delta_{consumer}_{since + 1}-{upto}", master=False).files
+        store.set_watermark(consumer, upto)
+        self.logger.info(f"✓ Delta export for {consumer}: {len(leads)} new or changed leads (changes {since + 1}-{upto})")
+        return files
+    
+    def open_stream(self, formats: List[str], filename: str, append: bool = True) -> List[StreamWriter]:
+        """
+        Open streaming writers that leads can be written to as they arrive.
+        
+        Only CSV and newline-delimited JSON can be streamed; 'json' is written
+        as JSONL, compressed with export.compression like export(). Writers
+        flush every export.stream_batch_size leads and fsync every
+        export.fsync_every leads; close them when done.
+        
+        Args:
+            formats: List of format strings ('csv', 'json', 'jsonl')
+            filename: Base filename (without extension)
+            append: Append to existing files instead of replacing them
+            
+        Returns:
+            List of open writers
+        """
+        batch_size = int(self.config.export.get('stream_batch_size', 500))
+        fsync_every = int(self.config.export.get('fsync_every', 5000))
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        writers = []
+        for fmt in dict.fromkeys('jsonl' if fmt == 'json' else fmt for fmt in formats):
+            writer_class = STREAM_WRITERS.get(fmt)
+            if writer_class is None:
+                self.logger.warning(f"Format cannot be streamed: {fmt}")
+                continue
+            file_path = self._output_path(filename, writer_class.extension)
+            writers.append(writer_class(file_path, batch_size, fsync_every, append,
+                                        self.compression, self.compression_level))
+        return writers
+    
+    def export_stream(self, data: Iterable[Dict], formats: List[str], filename: str,
+                      append: bool = True) -> List[str]:
+        """
+        Export leads from an iterator with constant memory.
+        
+        Leads are written as the iterator yields them, so a generator that
+        scrapes for hours leaves its results on disk continuously.
+        
+        Args:
+            data: Iterable of business dictionaries (consumed once)
+            formats: List of format strings ('csv', 'json', 'jsonl')
+            filename: Base filename (without extension)
+            append: Append to existing files instead of replacing them
+            
+        Returns:
+            List of written file paths
+        """
+        writers = self.open_stream(formats, filename, append)
+        try:
+            for lead in data:
+                for writer in writers:
+                    writer.write(lead)
+        finally:
+            for writer in writers:
+                writer.close()
+        
+        for writer in writers:
+            self.logger.info(f"✓ Streamed {writer.rows} leads to {writer.extension.upper()}: {writer.path}")
+        return [str(writer.path) for writer in writers]
+    
+    def export_nearby_duplicates(self, pairs: List[Dict], filename: str) -> str:
+        """
+        Export a nearby-duplicates report (see Deduplicator.nearby_duplicates) to CSV.
+        
+        Args:
+            pairs: Report rows
+            filename: Base filename (without extension)
+            
+        Returns:
+            Created file path
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        file_path = self._output_path(filename, 'csv')
         
-        # Define column order - EMAIL ADDED
-
         columns = [
-            'place_id', 'name', 'address', 'phone', 'email', 'website',
-            'opening_hours', 'price_level',
-            'facebook', 'instagram', 'twitter', 'linkedin', 'youtube', 'tiktok', 'whatsapp_status',
-            'category', 'rating', 'reviews', 'latitude', 'longitude',
-            'maps_url', 'source_url', 'timestamp', 'labels'
+            'distance_m', 'similarity', 'name_similarity',
+            'name_1', 'address_1', 'place_id_1',
+            'name_2', 'address_2', 'place_id_2'
         ]
         
-        # Write CSV
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        with self._open_output(file_path, newline='') as f:
             writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(data)
+            writer.writerows(pairs)
         
+        self.logger.info(f"✓ Exported nearby duplicates report: {file_path}")
         return str(file_path)
     
-    def _export_json(self, data: List[Dict], filename: str) -> str:
-        """Export to JSON format."""
-        file_path = self.output_dir / f"{filename}.json"
+    def _writers(self) -> Dict:
+        """
+        Writer of each format.
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Writers take (table, filename, buffer=None), write the file into
+        buffer instead of the output directory when one is given and return
+        the file's path either way.
+        """
+        return {
+            'csv': self._export_csv,
+            'json': self._export_json,
+            'sqlite': self._export_sqlite,
+            'excel': self._export_excel,
+            'parquet': self._export_parquet,
+        }
+    
+    def _export_csv(self, table: LeadTable, filename: str, buffer: Optional[BinaryIO] = None) -> str:
+        """Export to CSV format with email field."""
+        file_path = self._output_path(filename, 'csv')
+        
+        if not len(table):
+            self.logger.warning("No data to export to CSV")
+            return str(file_path)
+        
+        # Write CSV
+        with self._open_output(buffer or file_path, newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(LEAD_COLUMNS)
+            writer.writerows(table.rows(LEAD_COLUMNS))
+        
+        return str(file_path)
+    
+    def _export_json(self, table: LeadTable, filename: str, buffer: Optional[BinaryIO] = None) -> str:
+        """Export to JSON format (indented by 2 spaces unless export.json_indent is 0)."""
+        file_path = self._output_path(filename, 'json')
+        
+        with self._open_output(buffer or file_path) as f:
+            write_array(f, table.leads, pretty=bool(self.config.export.get('json_indent', 2)))
         
         return str(file_path)
     
-    def _export_sqlite(self, data: List[Dict], filename: str) -> str:
-        """Export to SQLite database with proper schema including email."""
+    def _output_path(self, filename: str, extension: str) -> Path:
+        """Path of a CSV or JSON file, with the export.compression suffix (e.g. leads.csv.gz)."""
+        return compressed_path(self.output_dir / f"{filename}.{extension}", self.compression)
+    
+    def _open_output(self, target, newline: Optional[str] = None):
+        """Open a CSV or JSON file (path or binary buffer) for writing through the configured compressor."""
+        return open_text(target, 'w', self.compression, self.compression_level, newline)
+    
+    def _export_sqlite(self, table: LeadTable, filename: str, buffer: Optional[BinaryIO] = None) -> str:
+        """
+        Export to SQLite with a bulk upsert.
+        
+        Every lead gets a natural key (Normalizer.lead_key()): its place_id,
+        or its normalized name and address when it has none. Rows are written
+        with one executemany in a single transaction (WAL, synchronous=NORMAL);
+        a lead whose key is already in the table updates that row, overwriting
+        only the fields it has a value for. Exporting into an existing file
+        therefore merges instead of piling up rows without a place_id. Leads
+        without any key are inserted with a NULL lead_key and never merged.
+        
+        With export.sqlite_fts set, an FTS5 index of name, category, address
+        and website is kept in sync by triggers (see lead_search.py).
+        
+        With a buffer, the database is built in memory and serialized into
+        it (see _serialize_sqlite).
+        """
         file_path = self.output_dir / f"{filename}.db"
         
-        if not data:
+        if not len(table):
             self.logger.warning("No data to export to SQLite")
             return str(file_path)
         
-        # Connect to SQLite
-        conn = sqlite3.connect(file_path)
-        cursor = conn.cursor()
-        
-        # Get table name from config
         table_name = self.config.export.get('sqlite_table_name', 'leads')
         
-        # Create table with EMAIL field
-        cursor.execute(f'''
+        conn = sqlite3.connect(':memory:' if buffer else file_path)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._prepare_sqlite_table(conn, table_name)
+            
+            before = conn.execute(f'SELECT COUNT(*) FROM {table_name}').fetchone()[0]
+            # An existing table's full-text index is updated by its triggers during the load;
+            # a new table is indexed in one pass afterwards, which is several times faster
+            full_text = self.config.export.get('sqlite_fts')
+            if full_text and before:
+                self._create_sqlite_fts(conn, table_name)
+            # Filtered on the cell that is bound, so a NaN or empty name cannot hit NOT NULL
+            rows = [
+                row + (self.normalizer.lead_key(lead),)
+                for row, lead, name in zip(table.rows(SQLITE_COLUMNS), table.leads, table.texts('name'))
+                if name is not None
+            ]
+            skipped = len(table) - len(rows)
+            if skipped:
+                self.logger.warning(f"SQLite: Skipped {skipped} records without a name")
+            
+            # Empty strings are stored as NULL so that an upsert keeps the stored value
+            values = ', '.join(["NULLIF(?, '')"] * len(SQLITE_COLUMNS) + ['?'])
+            updates = ', '.join(
+                f"{column} = COALESCE(excluded.{column}, {column})" for column in SQLITE_COLUMNS
+            )
+            with conn:
+                conn.executemany(
+                    f'INSERT INTO {table_name} ({", ".join(SQLITE_COLUMNS)}, lead_key) VALUES ({values}) '
+                    f'ON CONFLICT (lead_key) DO UPDATE SET {updates}',
+                    rows
+                )
+            
+            # Building the filter indexes after a first load is faster than updating them per row
+            for column in SQLITE_INDEXED_COLUMNS:
+                conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table_name}_{column} ON {table_name} ({column})')
+            if full_text and not before:
+                self._create_sqlite_fts(conn, table_name)
+            conn.commit()
+            
+            count = conn.execute(f'SELECT COUNT(*) FROM {table_name}').fetchone()[0]
+            self.logger.info(
+                f"SQLite: Inserted {count - before} and merged {len(rows) - (count - before)} records "
+                f"into {table_name} (total: {count})"
+            )
+            if buffer:
+                buffer.write(_serialize_sqlite(conn))
+        finally:
+            conn.close()
+        
+        return str(file_path)
+    
+    def _create_sqlite_fts(self, conn: sqlite3.Connection, table_name: str):
+        """Add the full-text index and its triggers to a leads table (see lead_search.py)."""
+        if not create_fts_index(conn, table_name):
+            self.logger.warning("SQLite: This SQLite build has no FTS5; skipping the full-text index")
+    
+    def _prepare_sqlite_table(self, conn: sqlite3.Connection, table_name: str):
+        """Create the leads table and its lead_key index, adding lead_key to tables from older exports."""
+        conn.execute(f'''
             CREATE TABLE IF NOT EXISTS {table_name} (
                 place_id TEXT,
                 name TEXT NOT NULL,
                 address TEXT,
                 phone TEXT,
                 email TEXT,
-
                 website TEXT,
                 facebook TEXT,
                 instagram TEXT,
@@ -141,252 +590,193 @@ class DataExporter:
                 source_url TEXT,
                 timestamp TEXT,
                 labels TEXT,
-                PRIMARY KEY (place_id)
+                lead_key TEXT
             )
         ''')
         
-        # Insert data with EMAIL field
-        inserted_count = 0
-        for row in data:
-            try:
-                cursor.execute(f'''
-                    INSERT OR REPLACE INTO {table_name} 
-                    (place_id, name, address, phone, email, website, 
-                     facebook, instagram, twitter, linkedin, youtube, tiktok, whatsapp_status,
-                     opening_hours, price_level,
-                     category, rating, reviews, latitude, longitude, maps_url, 
-                     source_url, timestamp, labels)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    row.get('place_id'),
-                    row.get('name'),
-                    row.get('address'),
-                    row.get('phone'),
-                    row.get('email'),  # EMAIL FIELD ADDED
-
-                    row.get('website'),
-                    row.get('facebook'),
-                    row.get('instagram'),
-                    row.get('twitter'),
-                    row.get('linkedin'),
-                    row.get('youtube'),
-                    row.get('tiktok'),
-                    row.get('whatsapp_status'),
-                    row.get('opening_hours'),
-                    row.get('price_level'),
-                    row.get('category'),
-                    row.get('rating'),
-                    row.get('reviews'),
-                    row.get('latitude'),
-                    row.get('longitude'),
-                    row.get('maps_url'),
-                    row.get('source_url'),
-                    row.get('timestamp'),
-                    row.get('labels')
-                ))
-                inserted_count += 1
-            except sqlite3.Error as e:
-                self.logger.warning(f"Error inserting row: {e}")
-                continue
-        
-        # Commit and close
+        existing = {row[1] for row in conn.execute(f'PRAGMA table_info({table_name})')}
+        if 'lead_key' not in existing:
+            # Tables written before lead_key existed: key the first row of each
+            # business; older duplicates keep a NULL key and are left alone
+            conn.execute(f'ALTER TABLE {table_name} ADD COLUMN lead_key TEXT')
+            keyed = {}
+            for rowid, place_id, name, address in conn.execute(
+                f'SELECT rowid, place_id, name, address FROM {table_name} ORDER BY rowid'
+            ):
+                key = self.normalizer.lead_key({'place_id': place_id, 'name': name, 'address': address})
+                if key is not None:
+                    keyed.setdefault(key, rowid)
+            with conn:
+                conn.executemany(
+                    f'UPDATE {table_name} SET lead_key = ? WHERE rowid = ?', keyed.items()
+                )
+            self.logger.info(f"SQLite: Added lead_key to {len(keyed)} existing records in {table_name}")
+        
+        conn.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS idx_{table_name}_lead_key ON {table_name} (lead_key)')
         conn.commit()
+    
+    def _export_parquet(self, table: LeadTable, filename: str, buffer: Optional[BinaryIO] = None) -> Optional[str]:
+        """
+        Export to Parquet with typed columns (requires pyarrow).
         
-        # Log statistics
-        cursor.execute(f'SELECT COUNT(*) FROM {table_name}')
-        count = cursor.fetchone()[0]
-        self.logger.info(f"SQLite: Inserted {inserted_count} records into {table_name} (total: {count})")
+        rating, reviews, latitude and longitude are stored as numbers, every
+        other column as text. Compression comes from export.parquet_compression.
+        With export.parquet_partition_by set, a hive-partitioned dataset
+        directory (e.g. query=cafe/date=2024-05-01/) is written instead of a
+        single file (but not into a buffer, which always gets a single file).
+        """
+        if not PYARROW_AVAILABLE:
+            self.logger.warning("Parquet export requires pyarrow (pip install pyarrow); skipping")
+            return None
+        
+        file_path = self.output_dir / f"{filename}.parquet"
         
-        conn.close()
+        if not len(table):
+            self.logger.warning("No data to export to Parquet")
+            return str(file_path)
+        
+        compression = self.config.export.get('parquet_compression', 'zstd')
+        partition_by = list(self.config.export.get('parquet_partition_by') or []) if not buffer else []
+        unknown = [column for column in partition_by if column not in PARQUET_PARTITIONS]
+        if unknown:
+            self.logger.warning(f"Ignoring unknown Parquet partition columns: {', '.join(unknown)}")
+            partition_by = [column for column in partition_by if column in PARQUET_PARTITIONS]
+        
+        columns = {}
+        for column in PARQUET_COLUMNS:
+            column_type = PARQUET_TYPES.get(column)
+            if column_type == 'int64':
+                columns[column] = pa.array(table.ints(column), type=pa.int64())
+            elif column_type == 'float64':
+                columns[column] = pa.array(table.floats(column), type=pa.float64())
+            else:
+                columns[column] = pa.array(table.texts(column), type=pa.string())
+        
+        if 'date' in partition_by:
+            today = datetime.now().strftime('%Y-%m-%d')
+            columns['date'] = pa.array([(value or today)[:10] for value in table.texts('timestamp')], type=pa.string())
+        for column in partition_by:
+            # Rows without a value go to an explicit "unknown" partition
+            columns[column] = pa.array([value or 'unknown' for value in columns[column].to_pylist()], type=pa.string())
+        
+        arrow_table = pa.table(columns)
+        if partition_by:
+            pq.write_to_dataset(
+                arrow_table, root_path=str(file_path), partition_cols=partition_by,
+                compression=compression, existing_data_behavior='overwrite_or_ignore'
+            )
+        else:
+            pq.write_table(arrow_table, buffer or str(file_path), compression=compression)
         
         return str(file_path)
-
-    def _export_excel(self, data: List[Dict], filename: str) -> str:
-        """Export to beautifully formatted Excel file with advanced features."""
+    
+    def _export_excel(self, table: LeadTable, filename: str, buffer: Optional[BinaryIO] = None) -> str:
+        """
+        Export to a formatted Excel file, streaming rows with xlsxwriter.
+        
+        The workbook is opened in constant_memory mode and rows are written
+        straight from the table's columns, so the writer itself does not
+        hold the sheet in memory. A workbook written into a buffer is built
+        in memory (in_memory mode) instead.
+        """
         file_path = self.output_dir / f"{filename}.xlsx"
+        keys = table.keys
         
-        if not data:
+        if not keys:
             self.logger.warning("No data to export to Excel")
             return str(file_path)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
-        
-        # Define column order - Organized by function
-        # 1. Contact Info
-        contact_cols = ['name', 'category', 'phone', 'email', 'website', 'address', 'opening_hours', 'price_level']
-        # 2. Social Media
-        social_cols = ['facebook', 'instagram', 'twitter', 'linkedin', 'youtube', 'tiktok', 'whatsapp_status']
-        # 3. Metrics
-        metric_cols = ['rating', 'reviews']
-        # 4. Meta
-        meta_cols = ['status', 'next_action', 'notes', 'maps_url', 'place_id'] # Lowercase for matching logic, will title case later
-        
-        # Prepare DataFrame columns
-        final_cols = []
-        for col in contact_cols + social_cols + metric_cols:
-            if col in df.columns:
-                final_cols.append(col)
-            elif col in social_cols: # Add missing social cols
-                df[col] = ''
-                final_cols.append(col)
-        
-        # Add CRM columns if not present
-        if 'Status' not in df.columns: df['Status'] = 'New'
-        if 'Next Action' not in df.columns: df['Next Action'] = ''
-        if 'Notes' not in df.columns: df['Notes'] = ''
-        
-        crm_cols = ['Status', 'Next Action', 'Notes']
-        
-        # Add remaining existing columns not in our specific lists
-        existing_others = [c for c in df.columns if c not in final_cols and c not in crm_cols and c not in ['status', 'next_action', 'notes']]
-        
-        # Final Column Order
-        ordered_cols = final_cols + crm_cols + existing_others
-        # Filter to only columns that actually exist now
-        ordered_cols = [c for c in ordered_cols if c in df.columns]
-        
-        df = df[ordered_cols]
-        
-        # Rename columns for professional look
-        col_mapping = {
-            'name': 'Business Name',
-            'category': 'Category',
-            'phone': 'Phone Number',
-            'website': 'Website',
-            'address': 'Full Address',
-            'opening_hours': 'Opening Hours',
-            'price_level': 'Price Level',
-            'rating': 'Rating',
-            'reviews': 'Review Count',
-            'facebook': 'Facebook',
-            'instagram': 'Instagram',
-            'twitter': 'X / Twitter',
-            'linkedin': 'LinkedIn',
-            'youtube': 'YouTube',
-            'tiktok': 'TikTok',
-            'whatsapp_status': 'WhatsApp Availability',
-            'maps_url': 'Google Maps Link',
-            'place_id': 'Place ID'
+        
+        # Column order - contact info, social media (always shown), metrics, CRM, then the rest
+        columns = [
+            column for column in EXCEL_CONTACT_COLUMNS + EXCEL_SOCIAL_COLUMNS + EXCEL_METRIC_COLUMNS
+            if column in keys or column in EXCEL_SOCIAL_COLUMNS
+        ]
+        columns += EXCEL_CRM_COLUMNS
+        columns += [column for column in keys if column not in columns and column not in EXCEL_HIDDEN_COLUMNS]
+        
+        # CRM columns missing from every lead are filled with their defaults
+        headers = [EXCEL_HEADERS.get(column, column) for column in columns]
+        
+        if buffer:
+            workbook = xlsxwriter.Workbook(buffer, {'in_memory': True})
+        else:
+            workbook = xlsxwriter.Workbook(str(file_path), {'constant_memory': True})
+        worksheet = workbook.add_worksheet('Leads')
+        
+        # --- Formats (created once per workbook) ---
+        header_style = {
+            'bold': True, 'text_wrap': True, 'valign': 'vcenter', 'align': 'center',
+            'font_color': 'white', 'border': 1, 'font_size': 11
         }
-        df.rename(columns=col_mapping, inplace=True)
-
-        # Create Excel writer
-        writer = pd.ExcelWriter(file_path, engine='xlsxwriter')
-        df.to_excel(writer, sheet_name='Leads', index=False, startrow=1, header=False)
-
-        workbook = writer.book
-        worksheet = writer.sheets['Leads']
-
-        # --- Formats ---
-        
-        # Headers
-        header_format = workbook.add_format({
-            'bold': True,
-            'text_wrap': True,
-            'valign': 'vcenter',
-            'align': 'center',
-            'fg_color': '#2C3E50',
-            'font_color': 'white',
-            'border': 1,
-            'font_size': 11
-        })
-        
-        metric_header_format = workbook.add_format({
-            'bold': True,
-            'text_wrap': True,
-            'valign': 'vcenter',
-            'align': 'center',
-            'fg_color': '#27ae60', # Green for metrics
-            'font_color': 'white',
-            'border': 1,
-            'font_size': 11
-        })
-        
-        crm_header_format = workbook.add_format({
-            'bold': True,
-            'text_wrap': True,
-            'valign': 'vcenter',
-            'align': 'center',
-            'fg_color': '#e67e22', # Orange for CRM
-            'font_color': 'white',
-            'border': 1,
-            'font_size': 11
-        })
-        
-        # Data Formats
+        header_format = workbook.add_format({**header_style, 'fg_color': '#2C3E50'})
+        metric_header_format = workbook.add_format({**header_style, 'fg_color': '#27ae60'})  # Green for metrics
+        crm_header_format = workbook.add_format({**header_style, 'fg_color': '#e67e22'})  # Orange for CRM
+        social_header_format = workbook.add_format(
+            {'bold': True, 'align': 'center', 'fg_color': '#3498db', 'font_color': 'white', 'border': 1}
+        )
+        whatsapp_header_format = workbook.add_format(
+            {'bold': True, 'align': 'center', 'fg_color': '#25D366', 'font_color': 'white', 'border': 1}
+        )
+        title_format = workbook.add_format({'bold': True, 'font_size': 16, 'font_color': '#2C3E50'})
         text_wrap = workbook.add_format({'text_wrap': True, 'valign': 'top', 'border': 1, 'border_color': '#E0E0E0'})
+        center = workbook.add_format({'align': 'center', 'valign': 'vcenter', 'border': 1, 'border_color': '#E0E0E0'})
+        status_format = workbook.add_format({'bg_color': '#FFF9C4', 'border': 1})
+        
+        # Column widths and formats
+        for idx, header in enumerate(headers):
+            if header in EXCEL_TEXT_WIDTHS:
+                worksheet.set_column(idx, idx, EXCEL_TEXT_WIDTHS[header], text_wrap)
+            elif header in EXCEL_SOCIAL_HEADERS:
+                worksheet.set_column(idx, idx, 25, text_wrap)
+            elif header in EXCEL_CENTER_WIDTHS:
+                worksheet.set_column(idx, idx, EXCEL_CENTER_WIDTHS[header], center)
+            elif header == 'Status':
+                worksheet.set_column(idx, idx, 15, status_format)
         
-        # Write Title
-        title_format = workbook.add_format({
-            'bold': True, 'font_size': 16, 'font_color': '#2C3E50'
-        })
+        # Title and headers (constant_memory mode needs rows written top to bottom)
         worksheet.write(0, 0, f"Business Leads Export - {datetime.now().strftime('%Y-%m-%d')}", title_format)
-
-        # Write Headers with proper formatting
-        for col_num, value in enumerate(df.columns.values):
-            fmt = header_format
-            if value in ['Rating', 'Review Count']:
+        for idx, header in enumerate(headers):
+            if header in ['Rating', 'Review Count']:
                 fmt = metric_header_format
-            elif value in ['Status', 'Next Action', 'Notes']:
+            elif header in EXCEL_CRM_COLUMNS:
                 fmt = crm_header_format
-            elif value in ['Facebook', 'Instagram', 'X / Twitter', 'LinkedIn', 'YouTube', 'TikTok']:
-                fmt = workbook.add_format({'bold': True, 'align': 'center', 'fg_color': '#3498db', 'font_color': 'white', 'border': 1})
-            elif value == 'WhatsApp Availability':
-                fmt = workbook.add_format({'bold': True, 'align': 'center', 'fg_color': '#25D366', 'font_color': 'white', 'border': 1})
-                
-            worksheet.write(1, col_num, value, fmt)
-
-        # Set Column Widths and Formatting
-        worksheet.set_column('A:A', 35, text_wrap) # Name
-        worksheet.set_column('B:B', 20, text_wrap) # Category
-        worksheet.set_column('C:C', 18, text_wrap) # Phone
-        worksheet.set_column('D:D', 30, text_wrap) # Email
-        worksheet.set_column('E:E', 30, text_wrap) # Website
-        worksheet.set_column('F:F', 40, text_wrap) # Address
-        
-        # Social Media Columns (G-L roughly) - set simpler width
-        # Dynamic finding of column indices would be better, but we know the order roughly.
-        # Let's iterate to be safe.
-        for idx, col_name in enumerate(df.columns):
-            if col_name in ['Facebook', 'Instagram', 'X / Twitter', 'LinkedIn', 'YouTube', 'TikTok']:
-                worksheet.set_column(idx, idx, 25, text_wrap)
-            elif col_name == 'WhatsApp Availability':
-                worksheet.set_column(idx, idx, 22, self._get_center_format(workbook))
-            elif col_name == 'Rating':
-                worksheet.set_column(idx, idx, 10, self._get_center_format(workbook))
-            elif col_name == 'Review Count':
-                worksheet.set_column(idx, idx, 12, self._get_center_format(workbook))
-            elif col_name == 'Status':
-                worksheet.set_column(idx, idx, 15, workbook.add_format({'bg_color': '#FFF9C4', 'border': 1}))
-                # Add validation
-                worksheet.data_validation(2, idx, len(df)+1, idx, {
-                    'validate': 'list',
-                    'source': ['New', 'Contacted', 'Qualified', 'Lost', 'Closed'],
-                })
-
-        # Add AutoFilter
-        worksheet.autofilter(1, 0, len(df)+1, len(df.columns)-1)
+            elif header in EXCEL_SOCIAL_HEADERS:
+                fmt = social_header_format
+            elif header == 'WhatsApp Availability':
+                fmt = whatsapp_header_format
+            else:
+                fmt = header_format
+            worksheet.write(1, idx, header, fmt)
+        
+        # Data rows
+        row = 1
+        for row, values in enumerate(table.rows(columns, EXCEL_CRM_DEFAULTS), start=2):
+            worksheet.write_row(row, 0, values)
+        
+        # Validation, filter and conditional formatting cover the written rows
+        if 'Status' in headers:
+            status_idx = headers.index('Status')
+            worksheet.data_validation(2, status_idx, row, status_idx, {
+                'validate': 'list',
+                'source': ['New', 'Contacted', 'Qualified', 'Lost', 'Closed'],
+            })
+        
+        worksheet.autofilter(1, 0, row, len(headers) - 1)
         
         # Freeze Panes (Top 2 rows)
         worksheet.freeze_panes(2, 0)
         
         # Conditional Formatting for Rating (Data Bar)
-        if 'Rating' in df.columns:
-            try:
-                rating_idx = df.columns.get_loc('Rating')
-                worksheet.conditional_format(2, rating_idx, len(df)+1, rating_idx, {
-                    'type': 'data_bar',
-                    'bar_color': '#63C384',
-                    'bar_solid': True,
-                    'min_type': 'num', 'min_value': 0,
-                    'max_type': 'num', 'max_value': 5
-                })
-            except:
-                pass
-
-        writer.close()
+        if 'Rating' in headers:
+            rating_idx = headers.index('Rating')
+            worksheet.conditional_format(2, rating_idx, row, rating_idx, {
+                'type': 'data_bar',
+                'bar_color': '#63C384',
+                'bar_solid': True,
+                'min_type': 'num', 'min_value': 0,
+                'max_type': 'num', 'max_value': 5
+            })
+        
+        workbook.close()
+        self.logger.info(f"Excel: Wrote {row - 1} rows")
         return str(file_path)
-    
-    def _get_center_format(self, workbook):
-        return workbook.add_format({'align': 'center', 'valign': 'vcenter', 'border': 1, 'border_color': '#E0E0E0'})
@@ -0,0 +1,294 @@
+"""
+Spatial index over lead coordinates.
+
+Answers "which leads lie within r metres of this point" without scanning
+every lead:
+
+- GridIndex buckets points into a uniform lat/lon grid and supports
+  incremental inserts, which is what streaming deduplication needs.
+- KDTreeIndex (SciPy only) indexes a fixed set of points as unit vectors in
+  a cKDTree, which is faster for bulk queries such as the nearby-duplicates
+  report.
+
+Candidates from the buckets or tree are filtered with a haversine distance
+vectorized over the whole neighbour set (NumPy when installed).
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+DEFAULT_RADIUS_M = 1000.0
+DEFAULT_CELL_DEGREES = 0.01
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance between two points.
+    
+    Args:
+        lat1: Latitude of the first point in degrees
+        lon1: Longitude of the first point in degrees
+        lat2: Latitude of the second point in degrees
+        lon2: Longitude of the second point in degrees
+    
+    Returns:
+        Distance in metres
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_many(lat: float, lon: float, lats: Sequence[float], lons: Sequence[float]) -> List[float]:
+    """
+    Distances from one point to many points in a single pass.
+    
+    Args:
+        lat: Latitude of the origin in degrees
+        lon: Longitude of the origin in degrees
+        lats: Latitudes of the other points
+        lons: Longitudes of the other points
+    
+    Returns:
+        Distance in metres to each point
+    """
+    if not NUMPY_AVAILABLE:
+        return [haversine_m(lat, lon, other_lat, other_lon) for other_lat, other_lon in zip(lats, lons)]
+    
+    phi1 = math.radians(lat)
+    phi2 = np.radians(np.asarray(lats, dtype=float))
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lons, dtype=float) - lon)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return (2 * EARTH_RADIUS_M * np.arcsin(np.minimum(1.0, np.sqrt(a)))).tolist()
+
+
+def cells_within(lat: float, lon: float, radius_m: float,
+                 cell_degrees: float = DEFAULT_CELL_DEGREES) -> List[Tuple[int, int]]:
+    """
+    List the grid cells overlapping the bounding box of a circle.
+    
+    Args:
+        lat: Latitude of the centre in degrees
+        lon: Longitude of the centre in degrees
+        radius_m: Circle radius in metres
+        cell_degrees: Cell edge length in degrees
+    
+    Returns:
+        (row, col) cells; every point within radius_m lies in one of them
+    """
+    row, col = grid_cell(lat, lon, cell_degrees)
+    lat_span = radius_m / METERS_PER_DEGREE
+    lon_span = lat_span / max(math.cos(math.radians(min(abs(lat) + lat_span, 90.0))), 1e-6)
+    
+    rows = math.ceil(lat_span / cell_degrees)
+    cols = min(math.ceil(lon_span / cell_degrees), math.ceil(180 / cell_degrees))
+    
+    return [
+        (r, c)
+        for r in range(row - rows, row + rows + 1)
+        for c in range(col - cols, col + cols + 1)
+    ]
+
+
+def grid_cell(lat: float, lon: float, cell_degrees: float = DEFAULT_CELL_DEGREES) -> Tuple[int, int]:
+    """Return the (row, col) grid cell containing a point."""
+    return math.floor(lat / cell_degrees), math.floor(lon / cell_degrees)
+
+
+class GridIndex:
+    """
+    Uniform lat/lon grid of points with incremental inserts.
+    
+    A radius query scans the cells overlapping the query circle's bounding
+    box (wider in longitude away from the equator) and keeps the points
+    whose haversine distance is within the radius.
+    """
+    
+    def __init__(self, cell_degrees: float = DEFAULT_CELL_DEGREES):
+        """
+        Initialize an empty grid.
+        
+        Args:
+            cell_degrees: Cell edge length in degrees
+        """
+        self.cell_degrees = cell_degrees
+        self._cells: Dict[Tuple[int, int], List[Tuple[Hashable, float, float]]] = defaultdict(list)
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def add(self, item: Hashable, lat: float, lon: float):
+        """
+        Insert a point.
+        
+        Args:
+            item: Identifier returned by queries (e.g. a list index)
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+        """
+        self._cells[grid_cell(lat, lon, self.cell_degrees)].append((item, lat, lon))
+        self._size += 1
+    
+    def query(self, lat: float, lon: float, radius_m: float = DEFAULT_RADIUS_M) -> List[Tuple[Hashable, float]]:
+        """
+        Find the points within a radius.
+        
+        Args:
+            lat: Latitude of the centre in degrees
+            lon: Longitude of the centre in degrees
+            radius_m: Search radius in metres
+        
+        Returns:
+            (item, distance in metres) tuples, nearest first
+        """
+        points = []
+        for cell in cells_within(lat, lon, radius_m, self.cell_degrees):
+            points.extend(self._cells.get(cell, ()))
+        
+        if not points:
+            return []
+        
+        distances = haversine_many(lat, lon, [p[1] for p in points], [p[2] for p in points])
+        neighbours = [
+            (point[0], distance) for point, distance in zip(points, distances)
+            if distance <= radius_m
+        ]
+        neighbours.sort(key=lambda neighbour: neighbour[1])
+        return neighbours
+
+
+class KDTreeIndex:
+    """Static KD-tree over points on the unit sphere (requires SciPy)."""
+    
+    def __init__(self, items: Sequence[Hashable], lats: Sequence[float], lons: Sequence[float]):
+        """
+        Build the tree.
+        
+        Args:
+            items: Identifiers returned by queries
+            lats: Latitudes in degrees
+            lons: Longitudes in degrees
+        """
+        self.items = list(items)
+        self.lats = np.asarray(lats, dtype=float)
+        self.lons = np.asarray(lons, dtype=float)
+        self.tree = cKDTree(_unit_vectors(self.lats, self.lons))
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def query(self, lat: float, lon: float, radius_m: float = DEFAULT_RADIUS_M) -> List[Tuple[Hashable, float]]:
+        """
+        Find the points within a radius.
+        
+        Args:
+            lat: Latitude of the centre in degrees
+            lon: Longitude of the centre in degrees
+            radius_m: Search radius in metres
+        
+        Returns:
+            (item, distance in metres) tuples, nearest first
+        """
+        centre = _unit_vectors(np.array([lat]), np.array([lon]))[0]
+        positions = self.tree.query_ball_point(centre, _chord(radius_m))
+        if not positions:
+            return []
+        
+        distances = haversine_many(lat, lon, self.lats[positions], self.lons[positions])
+        neighbours = [
+            (self.items[position], distance) for position, distance in zip(positions, distances)
+            if distance <= radius_m
+        ]
+        neighbours.sort(key=lambda neighbour: neighbour[1])
+        return neighbours
+    
+    def pairs(self, radius_m: float = DEFAULT_RADIUS_M) -> List[Tuple[Hashable, Hashable, float]]:
+        """
+        Find every pair of points within a radius of each other.
+        
+        Args:
+            radius_m: Pair distance limit in metres
+        
+        Returns:
+            (item_a, item_b, distance in metres) tuples, item_a inserted first
+        """
+        found = self.tree.query_pairs(_chord(radius_m), output_type='ndarray')
+        if len(found) == 0:
+            return []
+        
+        first, second = found[:, 0], found[:, 1]
+        phi1, phi2 = np.radians(self.lats[first]), np.radians(self.lats[second])
+        dlambda = np.radians(self.lons[second] - self.lons[first])
+        a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+        distances = 2 * EARTH_RADIUS_M * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+        
+        return [
+            (self.items[i], self.items[j], distance)
+            for i, j, distance in zip(first.tolist(), second.tolist(), distances.tolist())
+            if distance <= radius_m
+        ]
+
+
+def nearby_pairs(points: Iterable[Tuple[Hashable, float, float]],
+                 radius_m: float = DEFAULT_RADIUS_M) -> List[Tuple[Hashable, Hashable, float]]:
+    """
+    Find every pair of points within a radius, using a KD-tree when SciPy is installed.
+    
+    Args:
+        points: (item, latitude, longitude) tuples
+        radius_m: Pair distance limit in metres
+    
+    Returns:
+        (item_a, item_b, distance in metres) tuples, item_a listed first in points
+    """
+    points = list(points)
+    if not points:
+        return []
+    
+    if SCIPY_AVAILABLE:
+        items, lats, lons = zip(*points)
+        found = KDTreeIndex(items, lats, lons).pairs(radius_m)
+        order = {item: position for position, item in enumerate(items)}
+        return [
+            (a, b, distance) if order[a] < order[b] else (b, a, distance)
+            for a, b, distance in found
+        ]
+    
+    grid = GridIndex()
+    found = []
+    for item, lat, lon in points:
+        found.extend((other, item, distance) for other, distance in grid.query(lat, lon, radius_m))
+        grid.add(item, lat, lon)
+    return found
+
+
+def _unit_vectors(lats, lons):
+    """Convert degrees to 3-D unit vectors."""
+    phi = np.radians(lats)
+    lam = np.radians(lons)
+    return np.column_stack((np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)))
+
+
+def _chord(radius_m: float) -> float:
+    """Straight-line distance through the unit sphere for an arc of radius_m (padded for rounding)."""
+    return 2 * math.sin(min(radius_m / EARTH_RADIUS_M, math.pi) / 2) * (1 + 1e-9)
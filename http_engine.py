@@ -0,0 +1,169 @@
+"""
+HTTP fetching helpers for the browser-free scraper engines.
+
+Provides a pooled requests session, a per-host rate limiter and a concurrent
+page fetcher shared by the HTTP-based directory scrapers.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """
+    Space out request start times per host across worker threads.
+    
+    Each host gets its own schedule, so concurrent fetches against one site
+    stay polite while fetches against different sites do not wait on each other.
+    """
+    
+    def __init__(self, min_interval: float = 0.5):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            min_interval: Minimum seconds between request starts on one host
+        """
+        self.min_interval = min_interval
+        self._intervals: Dict[str, float] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def set_interval(self, url: str, interval: float):
+        """
+        Slow a host down below the default rate (e.g. for a robots.txt Crawl-delay).
+        
+        Args:
+            url: Any URL on the host
+            interval: Minimum seconds between request starts on that host
+        """
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            self._intervals[host] = max(self.min_interval, interval)
+    
+    def respect_crawl_delay(self, robots_checker, url: str, user_agent: str = '*'):
+        """
+        Apply the robots.txt Crawl-delay of the URL's host, if it sets one.
+        
+        Args:
+            robots_checker: RobotsChecker used to look up the delay
+            url: Any URL on the host
+            user_agent: User agent string
+        """
+        crawl_delay = robots_checker.crawl_delay(url, user_agent)
+        if crawl_delay:
+            self.set_interval(url, crawl_delay)
+    
+    def wait(self, url: str):
+        """
+        Block until a request to the URL's host may start.
+        
+        Args:
+            url: URL about to be requested
+        """
+        host = urlparse(url).netloc.lower()
+        
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._intervals.get(host, self.min_interval)
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def build_session(config, pool_size: int = 8) -> requests.Session:
+    """
+    Build a requests session with a connection pool sized for concurrent fetches.
+    
+    Args:
+        config: Configuration object
+        pool_size: Maximum number of pooled connections per host
+    
+    Returns:
+        Configured requests.Session
+    """
+    retries = Retry(
+        total=config.scraping.get('retry_attempts', 2),
+        backoff_factor=config.scraping.get('backoff_multiplier', 2),
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET', 'HEAD')
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retries
+    )
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': config.selenium.get('user_agent') or DEFAULT_USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def fetch_pages(
+    session: requests.Session,
+    urls: List[str],
+    timeout: float = 30,
+    max_workers: int = 4,
+    rate_limiter: Optional[HostRateLimiter] = None
+) -> List[Optional[str]]:
+    """
+    Fetch several pages concurrently through a shared session.
+    
+    Args:
+        session: Pooled requests session
+        urls: Page URLs to fetch
+        timeout: Per-request timeout in seconds
+        max_workers: Number of concurrent fetches
+        rate_limiter: Optional per-host limiter applied before each request
+    
+    Returns:
+        Page bodies in the same order as ``urls`` (None for failed fetches)
+    """
+    def _fetch(url: str) -> Optional[str]:
+        if rate_limiter:
+            rate_limiter.wait(url)
+        try:
+            response = session.get(url, timeout=timeout)
+            if response.status_code == 200:
+                return response.text
+            logger.warning(f"{url} returned status {response.status_code}")
+        except requests.RequestException as e:
+            logger.warning(f"Failed to fetch {url}: {e}")
+        return None
+    
+    if not urls:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        return list(executor.map(_fetch, urls))
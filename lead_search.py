@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Ranked full-text search over SQLite lead exports.
+
+Searching an export with LIKE '%pizza%' scans every row. With
+export.sqlite_fts set, DataExporter._export_sqlite() also builds an FTS5
+index of each lead's name, category, address and website:
+
+    leads       the exported rows (unchanged)
+    leads_fts   FTS5 index over them (external content: it stores only the
+                index, the text stays in leads)
+
+Triggers on leads keep the index in sync with every insert, upsert and
+delete, including later exports into the same file. Results are ranked
+with BM25, a match in the name weighing most. VACUUM can renumber the
+rows of the leads table; run with --rebuild afterwards.
+
+Usage:
+    python lead_search.py data/leads.db "pizza brooklyn"
+    python lead_search.py data/leads.db 'category:cafe AND name:"blue bottle"' --raw
+"""
+
+import argparse
+import logging
+import re
+import sqlite3
+import sys
+import time
+from typing import Dict, List
+
+
+# Indexed columns and their BM25 weights
+FTS_COLUMNS = ['name', 'category', 'address', 'website']
+FTS_WEIGHTS = [10.0, 5.0, 2.0, 1.0]
+
+# Columns returned with each result
+RESULT_COLUMNS = ['name', 'category', 'address', 'phone', 'email', 'website', 'rating', 'reviews', 'place_id']
+
+WORD = re.compile(r'\w+')
+
+
+def fts_table(table_name: str) -> str:
+    """Name of a leads table's FTS5 index."""
+    return f"{table_name}_fts"
+
+
+def create_fts_index(conn: sqlite3.Connection, table_name: str) -> bool:
+    """
+    Create a leads table's FTS5 index and sync triggers if they do not exist.
+    
+    A new index over a table that already has rows is filled from them.
+    
+    Args:
+        conn: Connection to the export
+        table_name: Leads table
+    
+    Returns:
+        False if this SQLite build has no FTS5, True otherwise
+    """
+    fts = fts_table(table_name)
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (fts,)).fetchone():
+        return True
+    
+    columns = ', '.join(FTS_COLUMNS)
+    new_values = ', '.join(f"new.{column}" for column in FTS_COLUMNS)
+    old_values = ', '.join(f"old.{column}" for column in FTS_COLUMNS)
+    try:
+        conn.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{table_name}', content_rowid='rowid', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+    except sqlite3.OperationalError as e:
+        if 'fts5' in str(e):
+            return False
+        raise
+    
+    conn.executescript(f'''
+        CREATE TRIGGER {fts}_insert AFTER INSERT ON {table_name} BEGIN
+            INSERT INTO {fts} (rowid, {columns}) VALUES (new.rowid, {new_values});
+        END;
+        CREATE TRIGGER {fts}_delete AFTER DELETE ON {table_name} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+        END;
+        CREATE TRIGGER {fts}_update AFTER UPDATE ON {table_name} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+            INSERT INTO {fts} (rowid, {columns}) VALUES (new.rowid, {new_values});
+        END;
+    ''')
+    # ORDER BY rank then uses the weighted BM25
+    conn.execute(
+        f"INSERT INTO {fts} ({fts}, rank) VALUES ('rank', 'bm25({', '.join(map(str, FTS_WEIGHTS))})')"
+    )
+    conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+    conn.commit()
+    return True
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query.
+    
+    Every word must match (in any indexed column); the last word also
+    matches as a prefix, so "blue bott" finds "Blue Bottle Coffee".
+    
+    Args:
+        text: Search text
+    
+    Returns:
+        FTS5 MATCH expression ('' if the text has no words)
+    """
+    words = WORD.findall(text)
+    if not words:
+        return ''
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+class LeadSearch:
+    """Ranked search over one SQLite export."""
+    
+    def __init__(self, db_path: str, table_name: str = 'leads'):
+        """
+        Open an export.
+        
+        Args:
+            db_path: SQLite file written by DataExporter
+            table_name: Leads table (export.sqlite_table_name)
+        
+        Raises:
+            ValueError: If the export has no full-text index
+        """
+        self.table_name = table_name
+        self.fts = fts_table(table_name)
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        self.conn.row_factory = sqlite3.Row
+        if not self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (self.fts,)).fetchone():
+            self.conn.close()
+            raise ValueError(
+                f"{db_path} has no full-text index; export with export.sqlite_fts: true or run with --rebuild"
+            )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def search(self, text: str, limit: int = 20, raw: bool = False) -> List[Dict]:
+        """
+        Find the leads that best match a search.
+        
+        Args:
+            text: Free text (every word must match), or an FTS5 query with raw=True
+            limit: Maximum number of results
+            raw: Pass text to FTS5 as it is (column filters, OR, NEAR, ...)
+        
+        Returns:
+            Matching leads, best first, each with its BM25 score ('rank', lower is better)
+        """
+        query = text if raw else fts_query(text)
+        if not query:
+            return []
+        # Rank in the index first, then read only the top rows from the table
+        rows = self.conn.execute(
+            f'SELECT {", ".join(f"l.{column}" for column in RESULT_COLUMNS)}, top.rank AS rank '
+            f'FROM (SELECT rowid, rank FROM {self.fts} WHERE {self.fts} MATCH ? ORDER BY rank LIMIT ?) top '
+            f'JOIN {self.table_name} l ON l.rowid = top.rowid ORDER BY top.rank',
+            (query, limit)
+        ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def close(self):
+        """Close the export."""
+        self.conn.close()
+
+
+def rebuild_index(db_path: str, table_name: str = 'leads') -> bool:
+    """
+    Create (or re-create) the full-text index of an export.
+    
+    Args:
+        db_path: SQLite file written by DataExporter
+        table_name: Leads table
+    
+    Returns:
+        False if this SQLite build has no FTS5
+    """
+    fts = fts_table(table_name)
+    conn = sqlite3.connect(db_path)
+    try:
+        existing = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (fts,)).fetchone()
+        if not create_fts_index(conn, table_name):
+            return False
+        if existing:
+            conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+            conn.commit()
+        return True
+    finally:
+        conn.close()
+
+
+def main():
+    """Command line entry point: search an export."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('db', help='SQLite export (.db)')
+    parser.add_argument('query', nargs='?', default='', help='Search text')
+    parser.add_argument('--limit', '-n', type=int, default=20, help='Maximum number of results')
+    parser.add_argument('--raw', action='store_true', help='Pass the query to FTS5 as it is')
+    parser.add_argument('--table', default='leads', help='Leads table (export.sqlite_table_name)')
+    parser.add_argument('--rebuild', action='store_true', help='Create or rebuild the full-text index first')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logger = logging.getLogger(__name__)
+    
+    try:
+        if args.rebuild:
+            if not rebuild_index(args.db, args.table):
+                logger.error("This SQLite build has no FTS5")
+                sys.exit(1)
+            logger.info(f"✓ Rebuilt full-text index of {args.table} in {args.db}")
+        if not args.query:
+            return
+        
+        with LeadSearch(args.db, args.table) as search:
+            start = time.perf_counter()
+            results = search.search(args.query, args.limit, args.raw)
+            elapsed = time.perf_counter() - start
+    except (ValueError, sqlite3.Error) as e:
+        logger.error(str(e))
+        sys.exit(1)
+    
+    for lead in results:
+        print(' | '.join(str(lead[column]) for column in ('name', 'category', 'address', 'phone') if lead[column]))
+    print(f"{len(results)} results in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
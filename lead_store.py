@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Master lead store with incremental (delta) exports.
+
+Every export can also write its leads into one master dataset instead of
+only a new timestamped file. The dataset is a directory of append-only
+JSONL partitions by the day a lead version was stored and its source:
+
+    master/date=2024-05-01/source=maps/leads.jsonl
+    master/date=2024-05-01/source=yelp/leads.jsonl
+    master/index.db
+
+Leads are identified by their natural key (Normalizer.lead_key()), or by
+their content hash when they have none. A lead seen before is merged into
+the stored version (its non-empty fields win unless its timestamp is not
+newer, see _merge()); if that changes the record, the new version is
+appended to today's partition. index.db keeps, per lead, a hash of the
+current version, a change sequence number and where the version sits
+(file, offset, length).
+
+Consumers keep a watermark: the last sequence number they exported. A
+delta export reads the index rows above the watermark and seeks straight
+to those records, so nothing is diffed and unchanged partitions are never
+read.
+
+Usage:
+    python lead_store.py --consumer crm --format csv json
+    python lead_store.py --consumer crm --peek
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from config import Config
+from json_io import dumps, loads
+from normalization import get_normalizer
+from stream_writers import drop_partial_line
+
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS leads (
+        lead_key TEXT PRIMARY KEY,
+        content_hash TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        first_seen TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        path TEXT NOT NULL,
+        offset INTEGER NOT NULL,
+        length INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS leads_seq ON leads (seq);
+    CREATE TABLE IF NOT EXISTS watermarks (
+        consumer TEXT PRIMARY KEY,
+        seq INTEGER NOT NULL,
+        updated_at TEXT NOT NULL
+    ) WITHOUT ROWID;
+'''
+
+# Fields that change on every scrape and do not make a lead "changed"
+VOLATILE_FIELDS = frozenset({'timestamp'})
+
+PARTITION_VALUE = re.compile(r'[^\w.-]+')
+
+
+@dataclass
+class StoreStats:
+    """Outcome of adding leads to the store."""
+    
+    added: int = 0
+    changed: int = 0
+    unchanged: int = 0
+
+
+class LeadStore:
+    """Partitioned master dataset of leads with a change index."""
+    
+    def __init__(self, root: str, default_country_code: str = ''):
+        """
+        Open (or create) the store.
+        
+        Args:
+            root: Store directory
+            default_country_code: Calling code used to normalize lead keys
+        """
+        self.root = Path(root)
+        self.normalizer = get_normalizer(default_country_code)
+        self.logger = logging.getLogger(__name__)
+        
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.root / 'index.db'))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM leads').fetchone()[0]
+    
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest stored change (0 for an empty store)."""
+        return self.conn.execute('SELECT COALESCE(MAX(seq), 0) FROM leads').fetchone()[0]
+    
+    def add(self, leads: Iterable[Dict]) -> StoreStats:
+        """
+        Store new and changed leads.
+        
+        Leads with the same key are merged in memory first and only the
+        final version of each is compared with the store, so duplicates
+        that disagree do not store intermediate versions (or count as
+        changed when the same leads are added again). Partition files are
+        written and fsynced before the index is committed, so a crash
+        leaves at most unindexed records behind.
+        
+        Args:
+            leads: Business dictionaries
+        
+        Returns:
+            StoreStats with the number of added and changed stored leads; every
+            other lead (including duplicates) counts as unchanged
+        """
+        stats = StoreStats()
+        now = datetime.now()
+        stored_at = now.isoformat(timespec='seconds')
+        seq = self.sequence
+        files: Dict[Path, object] = {}
+        readers: Dict[str, object] = {}
+        merged: Dict[str, list] = {}
+        updates: Dict[str, Tuple] = {}
+        
+        count = 0
+        try:
+            for lead in leads:
+                count += 1
+                # A lead with no natural key is only merged with identical copies of itself
+                key = self.normalizer.lead_key(lead) or f"hash:{_content_hash(lead)}"
+                entry = merged.get(key)
+                if entry is None:
+                    row = self.conn.execute(
+                        'SELECT content_hash, first_seen, path, offset, length FROM leads WHERE lead_key = ?', (key,)
+                    ).fetchone()
+                    entry = merged[key] = [row, self._read(readers, *row[2:]) if row is not None else None]
+                entry[1] = dict(lead) if entry[1] is None else _merge(entry[1], lead)
+        finally:
+            for f in readers.values():
+                f.close()
+        
+        try:
+            for key, (row, record) in merged.items():
+                content_hash = _content_hash(record)
+                if row is not None and row[0] == content_hash:
+                    continue
+                
+                path = self._partition(now, record)
+                f = files.get(path)
+                if f is None:
+                    f = files[path] = self._open_partition(path)
+                line = dumps(record) + b'\n'
+                offset = f.tell()
+                f.write(line)
+                
+                seq += 1
+                first_seen = row[1] if row is not None else stored_at
+                updates[key] = (content_hash, first_seen, path.relative_to(self.root).as_posix(), offset, len(line), seq)
+                if row is None:
+                    stats.added += 1
+                else:
+                    stats.changed += 1
+            
+            for f in files.values():
+                f.flush()
+                os.fsync(f.fileno())
+        finally:
+            for f in files.values():
+                f.close()
+        stats.unchanged = count - stats.added - stats.changed
+        
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO leads (lead_key, content_hash, first_seen, path, offset, length, seq, '
+                'updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(key, *values, stored_at) for key, values in updates.items()]
+            )
+        
+        self.logger.info(
+            f"✓ Master store: {stats.added} added, {stats.changed} changed, {stats.unchanged} unchanged "
+            f"(total: {len(self)})"
+        )
+        return stats
+    
+    def changes(self, since: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Return the current version of every lead added or changed after a sequence number.
+        
+        Args:
+            since: Sequence number (e.g. a consumer's watermark)
+        
+        Returns:
+            Tuple of (leads in change order, sequence number of the last change)
+        """
+        rows = self.conn.execute(
+            'SELECT path, offset, length, seq FROM leads WHERE seq > ? ORDER BY seq', (since,)
+        ).fetchall()
+        
+        leads = []
+        readers = {}
+        try:
+            for path, offset, length, _ in rows:
+                leads.append(self._read(readers, path, offset, length))
+        finally:
+            for f in readers.values():
+                f.close()
+        
+        return leads, (rows[-1][3] if rows else since)
+    
+    def pending(self, consumer: str) -> int:
+        """Number of leads added or changed since a consumer's watermark."""
+        return self.conn.execute(
+            'SELECT COUNT(*) FROM leads WHERE seq > ?', (self.watermark(consumer),)
+        ).fetchone()[0]
+    
+    def watermark(self, consumer: str) -> int:
+        """Sequence number a consumer has exported up to (0 if it never exported)."""
+        row = self.conn.execute('SELECT seq FROM watermarks WHERE consumer = ?', (consumer,)).fetchone()
+        return row[0] if row else 0
+    
+    def set_watermark(self, consumer: str, seq: int):
+        """Record that a consumer has exported every change up to seq."""
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO watermarks (consumer, seq, updated_at) VALUES (?, ?, ?)',
+                (consumer, seq, datetime.now().isoformat(timespec='seconds'))
+            )
+    
+    def close(self):
+        """Close the index."""
+        self.conn.close()
+    
+    def _partition(self, when: datetime, lead: Dict) -> Path:
+        """Partition file of a lead version stored at a given time."""
+        source = str(lead.get('source') or 'unknown').split(', ')[0]
+        source = PARTITION_VALUE.sub('_', source).strip('_') or 'unknown'
+        return self.root / f"date={when.strftime('%Y-%m-%d')}" / f"source={source}" / 'leads.jsonl'
+    
+    def _open_partition(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size > 0:
+            drop_partial_line(path)
+        return open(path, 'ab')
+    
+    def _read(self, readers: Dict[str, object], path: str, offset: int, length: int) -> Dict:
+        """Read one stored record, keeping partition files open in readers."""
+        f = readers.get(path)
+        if f is None:
+            f = readers[path] = open(self.root / path, 'rb')
+        f.seek(offset)
+        return loads(f.read(length))
+
+
+def _merge(stored: Dict, lead: Dict) -> Dict:
+    """
+    Merge a lead into its stored version.
+    
+    The lead's non-empty fields win, unless its timestamp shows it is not
+    newer than the stored version (e.g. the same export added twice); then
+    it only fills fields the stored version lacks.
+    """
+    fresh = {field: value for field, value in lead.items() if value not in (None, '')}
+    stored_at, scraped_at = stored.get('timestamp'), lead.get('timestamp')
+    if stored_at and scraped_at and str(scraped_at) <= str(stored_at):
+        fresh = {field: value for field, value in fresh.items() if stored.get(field) in (None, '')}
+    return {**stored, **fresh}
+
+
+def _content_hash(lead: Dict) -> str:
+    # Stays on the json module: stored hashes must not change with the serializer
+    content = {field: value for field, value in lead.items() if field not in VOLATILE_FIELDS}
+    return hashlib.blake2b(
+        json.dumps(content, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'), digest_size=16
+    ).hexdigest()
+
+
+def open_store(config) -> LeadStore:
+    """Open the master store configured in export.master_store_dir."""
+    return LeadStore(
+        config.export.get('master_store_dir') or './data/master',
+        str(config.deduplication.get('default_country_code', ''))
+    )
+
+
+def main():
+    """Command line entry point: export the changes a consumer has not seen yet."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--consumer', default='default', help='Name whose watermark is used and advanced')
+    parser.add_argument('--format', '-f', nargs='+', default=['csv'],
+                        choices=['csv', 'json', 'sqlite', 'excel', 'parquet'], help='Export formats')
+    parser.add_argument('--output-dir', default='./data', help='Directory for the delta files')
+    parser.add_argument('--peek', action='store_true', help='Only report how many leads changed')
+    parser.add_argument('--config', '-c', default='config.yaml', help='Configuration file')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    config = Config(args.config)
+    
+    from exporter import DataExporter
+    
+    try:
+        with open_store(config) as store:
+            if args.peek:
+                print(f"{store.pending(args.consumer)} leads changed since the last export of {args.consumer} "
+                      f"(store: {len(store)} leads)")
+                return
+            exporter = DataExporter(config, output_dir=args.output_dir)
+            for file_path in exporter.export_delta(store, args.format, args.consumer):
+                print(file_path)
+    except (OSError, sqlite3.Error) as e:
+        logging.getLogger(__name__).error(str(e))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
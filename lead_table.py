@@ -0,0 +1,128 @@
+"""
+Column buffer of a lead list shared by the export writers.
+
+DataExporter writes the same leads to several formats. LeadTable turns
+the lead dictionaries into one list of values per field in a single pass,
+so every writer reads ready-made columns instead of re-deriving its own
+from the raw dicts:
+
+- cells: values as the row-oriented writers (CSV, SQLite, Excel) store
+  them; lists and dicts become JSON text and NaN/inf become None
+- floats / ints / texts: typed columns for Parquet
+
+Derived columns are computed once and cached. The cache is guarded by a
+lock, so writers running in separate threads can share one table.
+"""
+
+import json
+import math
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# Value types every writer stores as they are
+SCALAR_TYPES = frozenset({str, int, float, bool, type(None), bytes})
+
+
+class LeadTable:
+    """Column-oriented view of a list of leads."""
+    
+    def __init__(self, leads: List[Dict]):
+        """
+        Build the cell columns of every field.
+        
+        Args:
+            leads: Business dictionaries (kept as they are for JSON output)
+        """
+        self.leads = leads
+        self.keys = list(dict.fromkeys(key for lead in leads for key in lead))
+        
+        columns: Dict[str, list] = {key: [] for key in self.keys}
+        for lead in leads:
+            get = lead.get
+            for key, values in columns.items():
+                values.append(get(key))
+        
+        for key, values in columns.items():
+            types = set(map(type, values))
+            if not SCALAR_TYPES.issuperset(types):
+                columns[key] = [_cell(value) for value in values]
+            elif float in types:
+                columns[key] = [None if type(value) is float and not math.isfinite(value) else value
+                                for value in values]
+        
+        self._cells = columns
+        self._derived: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self.leads)
+    
+    def cells(self, column: str) -> list:
+        """Values of a field (None where a lead lacks it)."""
+        values = self._cells.get(column)
+        if values is None:
+            return self._derive('cells', column, lambda: [None] * len(self.leads))
+        return values
+    
+    def rows(self, columns: Sequence[str], defaults: Optional[Dict] = None) -> Iterator[tuple]:
+        """
+        Iterate over rows of cells.
+        
+        Args:
+            columns: Fields in row order
+            defaults: Values of fields that no lead has
+        
+        Returns:
+            Iterator of tuples, one per lead
+        """
+        defaults = defaults or {}
+        return zip(*(
+            self.cells(column) if column in self._cells or column not in defaults
+            else [defaults[column]] * len(self.leads)
+            for column in columns
+        ))
+    
+    def floats(self, column: str) -> List[Optional[float]]:
+        """Field as numbers; values that do not parse become None."""
+        return self._derive('floats', column, lambda: [_to_float(value) for value in self.cells(column)])
+    
+    def ints(self, column: str) -> List[Optional[int]]:
+        """Field as integers ("1,234" parses as 1234); values that do not parse become None."""
+        return self._derive('ints', column, lambda: [_to_int(value) for value in self.cells(column)])
+    
+    def texts(self, column: str) -> List[Optional[str]]:
+        """Field as text; missing and empty values become None."""
+        return self._derive('texts', column, lambda: [
+            None if value is None or value == '' else str(value) for value in self.cells(column)
+        ])
+    
+    def _derive(self, kind: str, column: str, build) -> list:
+        with self._lock:
+            values = self._derived.get((kind, column))
+            if values is None:
+                values = self._derived[(kind, column)] = build()
+            return values
+
+
+def _cell(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _to_int(value) -> Optional[int]:
+    if isinstance(value, str):
+        value = value.replace(',', '')
+    number = _to_float(value)
+    return int(number) if number is not None else None
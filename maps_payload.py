@@ -0,0 +1,132 @@
+"""
+Targeted extraction of business entities from Google Maps page payloads.
+
+The search page embeds a multi-megabyte ``window.APP_INITIALIZATION_STATE``
+array. Instead of decoding all of it and walking every node, this module
+locates candidate business objects by their ``"title"`` key and decodes only
+those slices of the page with ``JSONDecoder.raw_decode``.
+"""
+
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+PAYLOAD_PATTERN = re.compile(r'window\.APP_INITIALIZATION_STATE\s*=\s*')
+TITLE_KEY_PATTERN = re.compile(r'"title"\s*:')
+REQUIRED_FIELDS = ('title', 'address')
+
+_decoder = json.JSONDecoder()
+
+
+def find_payload_bounds(html: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate the APP_INITIALIZATION_STATE array in the page.
+    
+    Args:
+        html: Search page HTML
+    
+    Returns:
+        (start, end) offsets of the payload region, or None if absent
+    """
+    match = PAYLOAD_PATTERN.search(html)
+    if not match:
+        return None
+    
+    start = html.find('[', match.end())
+    if start == -1:
+        return None
+    
+    end = html.find('</script>', start)
+    return start, end if end != -1 else len(html)
+
+
+def extract_business_entities(html: str) -> Optional[List[Dict]]:
+    """
+    Extract business-like dicts from the page payload without decoding it whole.
+    
+    Returns the same entities as walking the fully decoded payload with
+    ``AdvancedGoogleMapsScraper._find_business_entities``, in document order.
+    
+    Args:
+        html: Search page HTML
+    
+    Returns:
+        List of entity dicts, or None if the payload is missing or could not
+        be sliced (callers should fall back to the full decode)
+    """
+    bounds = find_payload_bounds(html)
+    if bounds is None:
+        return None
+    
+    start, end = bounds
+    spans: List[Tuple[int, int, List[Dict]]] = []
+    
+    for key_match in TITLE_KEY_PATTERN.finditer(html, start, end):
+        key_pos = key_match.start()
+        
+        # Already covered by an object decoded earlier
+        if spans and key_pos < spans[-1][1]:
+            continue
+        
+        obj_start = _object_start(html, key_pos, start)
+        if obj_start == -1:
+            return None
+        
+        try:
+            obj, obj_end = _decoder.raw_decode(html, obj_start)
+        except ValueError:
+            return None
+        
+        # An enclosing object supersedes the nested ones decoded before it
+        while spans and spans[-1][0] >= obj_start:
+            spans.pop()
+        spans.append((obj_start, obj_end, find_business_entities(obj)))
+    
+    return [entity for _, _, entities in spans for entity in entities]
+
+
+def find_business_entities(data_item) -> List[Dict]:
+    """
+    Recursively find business entities in a decoded structure.
+    
+    Args:
+        data_item: Decoded JSON value
+    
+    Returns:
+        Dicts that carry all REQUIRED_FIELDS, in pre-order
+    """
+    business_entities = []
+    
+    if isinstance(data_item, dict):
+        if all(field in data_item for field in REQUIRED_FIELDS):
+            business_entities.append(data_item)
+        for value in data_item.values():
+            if isinstance(value, (dict, list)):
+                business_entities.extend(find_business_entities(value))
+    
+    elif isinstance(data_item, list):
+        for item in data_item:
+            if isinstance(item, (dict, list)):
+                business_entities.extend(find_business_entities(item))
+    
+    return business_entities
+
+
+def _object_start(text: str, key_pos: int, lower_bound: int) -> int:
+    """Walk back from a key to the '{' that opens its enclosing object."""
+    pos = key_pos
+    depth = 0
+    
+    while True:
+        open_pos = text.rfind('{', lower_bound, pos)
+        if open_pos == -1:
+            return -1
+        
+        # Only '}' can sit between open_pos and pos
+        depth += text.count('}', open_pos, pos)
+        if depth == 0:
+            return open_pos
+        
+        depth -= 1
+        pos = open_pos
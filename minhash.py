@@ -0,0 +1,180 @@
+"""
+MinHash signatures and LSH banding for candidate generation.
+
+Blocking on name tokens degenerates when tokens such as "restaurant" or
+"cafe" are shared by a large part of a master file. MinHash instead gives
+every lead a short signature over the character shingles of its normalized
+name and address; LSH splits the signature into bands and only leads that
+agree on a whole band become candidates. With b bands of r rows a pair of
+Jaccard similarity s collides with probability 1 - (1 - s^r)^b, an S-curve
+centred near (1/b)^(1/r): more bands raise recall, more rows raise
+precision.
+
+Signatures for a batch of texts are computed in one NumPy pass when NumPy
+is installed.
+"""
+
+import random
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, List, Sequence, Set
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Mersenne prime for the universal hash family; shingle hashes are reduced
+# below it so a * x + b stays inside 64 bits
+MERSENNE_PRIME = (1 << 31) - 1
+
+# Texts hashed per NumPy pass; bounds the (num_perm x shingles) work array
+BATCH_SIZE = 2048
+
+
+def shingles(text: str, size: int = 3) -> Set[int]:
+    """
+    Hash the character shingles of a text.
+    
+    Args:
+        text: Normalized text
+        size: Shingle length in characters
+    
+    Returns:
+        Set of 31-bit shingle hashes (texts shorter than size give one shingle)
+    """
+    if len(text) <= size:
+        return {zlib.crc32(text.encode('utf-8')) % MERSENNE_PRIME} if text else set()
+    return {
+        zlib.crc32(text[i:i + size].encode('utf-8')) % MERSENNE_PRIME
+        for i in range(len(text) - size + 1)
+    }
+
+
+def collision_probability(similarity: float, bands: int, rows: int) -> float:
+    """Probability that two texts of the given Jaccard similarity share a band."""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+class MinHasher:
+    """MinHash signatures of fixed length over character shingles."""
+    
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        """
+        Draw the hash functions.
+        
+        Args:
+            num_perm: Signature length (bands * rows)
+            shingle_size: Shingle length in characters
+            seed: Seed for the hash parameters (fixed so signatures are
+                comparable across processes and runs)
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self.a = [rng.randrange(1, MERSENNE_PRIME) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, MERSENNE_PRIME) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a = np.array(self.a, dtype=np.uint64)[:, None]
+            self._b = np.array(self.b, dtype=np.uint64)[:, None]
+    
+    def signature(self, text: str) -> tuple:
+        """
+        Compute the signature of one text.
+        
+        Args:
+            text: Normalized text
+        
+        Returns:
+            Tuple of num_perm minimum hash values
+        """
+        return self.signatures([text])[0]
+    
+    def signatures(self, texts: Sequence[str]) -> List[tuple]:
+        """
+        Compute the signatures of many texts in one batch.
+        
+        Args:
+            texts: Normalized texts
+        
+        Returns:
+            One signature tuple per text (all MERSENNE_PRIME for empty texts)
+        """
+        if NUMPY_AVAILABLE and len(texts) > BATCH_SIZE:
+            return [
+                signature
+                for start in range(0, len(texts), BATCH_SIZE)
+                for signature in self.signatures(texts[start:start + BATCH_SIZE])
+            ]
+        
+        hashed = [shingles(text, self.shingle_size) or {MERSENNE_PRIME} for text in texts]
+        
+        if not NUMPY_AVAILABLE:
+            return [
+                tuple(min((a * x + b) % MERSENNE_PRIME for x in values) for a, b in zip(self.a, self.b))
+                for values in hashed
+            ]
+        
+        lengths = np.fromiter((len(values) for values in hashed), dtype=np.int64, count=len(hashed))
+        flat = np.fromiter(
+            (x for values in hashed for x in values), dtype=np.uint64, count=int(lengths.sum())
+        )
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        
+        permuted = (self._a * flat[None, :] + self._b) % MERSENNE_PRIME
+        minima = np.minimum.reduceat(permuted, offsets, axis=1).T
+        return [tuple(row) for row in minima.tolist()]
+
+
+class LSHIndex:
+    """Band index over MinHash signatures."""
+    
+    def __init__(self, bands: int = 16, rows: int = 4):
+        """
+        Initialize an empty index.
+        
+        Args:
+            bands: Number of bands (more bands: higher recall)
+            rows: Signature rows per band (more rows: higher precision)
+        """
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[int, List[Hashable]]] = [defaultdict(list) for _ in range(bands)]
+    
+    @property
+    def threshold(self) -> float:
+        """Approximate Jaccard similarity at which collisions become likely."""
+        return (1 / self.bands) ** (1 / self.rows)
+    
+    def add(self, item: Hashable, signature: Sequence[int]):
+        """
+        Index a signature.
+        
+        Args:
+            item: Identifier returned by queries
+            signature: MinHash signature of length bands * rows
+        """
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket[key].append(item)
+    
+    def query(self, signature: Sequence[int]) -> Set[Hashable]:
+        """
+        Find the items sharing at least one band with a signature.
+        
+        Args:
+            signature: MinHash signature of length bands * rows
+        
+        Returns:
+            Set of candidate items
+        """
+        found = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            found.update(bucket.get(key, ()))
+        return found
+    
+    def _band_keys(self, signature: Sequence[int]) -> List[int]:
+        """Hash each band of a signature to one int (ints hash deterministically)."""
+        rows = self.rows
+        return [hash(tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
@@ -0,0 +1,197 @@
+"""
+Canonical forms of lead fields for matching.
+
+The same business shows up as "The Golden Cafe, 12 Main St." with phone
+"0300 1234567" in one source and "Golden Cafe, 12 Main Street" with
+"+92 300 1234567" in another. Normalizer maps each field to one canonical
+form:
+
+- names: casefolded tokens without stopwords ("the", "and", "inc", ...)
+- addresses: casefolded tokens with street-type and direction
+  abbreviations expanded ("st" -> "street", "n" -> "north")
+- phones: E.164 ("+923001234567") when the country code is known or can
+  be defaulted, otherwise the digits
+
+Every field method is memoized, so normalizing a value that was seen
+before costs one cache lookup. get_normalizer() shares one Normalizer per
+default country code across all callers in a process.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+TOKEN_PATTERN = re.compile(r'\w+')
+APOSTROPHES = re.compile(r"['’]")
+
+NAME_STOPWORDS = frozenset({
+    'the', 'and', 'of', 'a', 'an', 'at', 'co', 'company', 'corp', 'corporation', 'inc', 'llc', 'ltd',
+    'limited', 'pvt', 'plc',
+})
+
+ADDRESS_ABBREVIATIONS = {
+    'st': 'street', 'str': 'street', 'rd': 'road', 'ave': 'avenue', 'av': 'avenue', 'blvd': 'boulevard',
+    'ln': 'lane', 'dr': 'drive', 'hwy': 'highway', 'pkwy': 'parkway', 'sq': 'square', 'pl': 'place',
+    'ct': 'court', 'cir': 'circle', 'ter': 'terrace', 'ste': 'suite', 'apt': 'apartment', 'fl': 'floor',
+    'bldg': 'building', 'ctr': 'center', 'centre': 'center', 'n': 'north', 's': 'south', 'e': 'east',
+    'w': 'west', 'ne': 'northeast', 'nw': 'northwest', 'se': 'southeast', 'sw': 'southwest',
+}
+
+# Longest national significant number; longer digit strings carry a country code
+MAX_NATIONAL_DIGITS = 10
+
+# Shortest digit suffix two phones must share to match when one lacks a country code
+MIN_PHONE_MATCH_DIGITS = 7
+
+# Trailing digits used as the phone blocking key, so formats with and
+# without a country code land in the same block
+PHONE_KEY_DIGITS = 9
+
+CACHE_SIZE = 1 << 16
+
+
+@dataclass(frozen=True)
+class NormalizedLead:
+    """Canonical view of the match fields of one lead."""
+    
+    name: str
+    address: str
+    phone: str
+    name_tokens: Tuple[str, ...]
+    address_tokens: Tuple[str, ...]
+
+
+class Normalizer:
+    """Memoizing normalizer for names, addresses and phone numbers."""
+    
+    def __init__(self, default_country_code: str = '', cache_size: int = CACHE_SIZE):
+        """
+        Initialize the normalizer.
+        
+        Args:
+            default_country_code: Calling code (e.g. '92') assumed for numbers
+                written without one; '' leaves such numbers as digits
+            cache_size: Entries kept per field cache
+        """
+        self.default_country_code = default_country_code.lstrip('+')
+        self.name_tokens = lru_cache(maxsize=cache_size)(self._name_tokens)
+        self.address_tokens = lru_cache(maxsize=cache_size)(self._address_tokens)
+        self.phone = lru_cache(maxsize=cache_size)(self._phone)
+    
+    def name(self, name) -> str:
+        """Canonical name: casefolded tokens without stopwords, space separated."""
+        return ' '.join(self.name_tokens(name or ''))
+    
+    def address(self, address) -> str:
+        """Canonical address: casefolded tokens with abbreviations expanded."""
+        return ' '.join(self.address_tokens(address or ''))
+    
+    def lead(self, lead: Dict) -> NormalizedLead:
+        """
+        Normalize the match fields of a lead.
+        
+        Args:
+            lead: Business dictionary (missing or None fields count as empty)
+        
+        Returns:
+            NormalizedLead view
+        """
+        name_tokens = self.name_tokens(lead.get('name') or '')
+        address_tokens = self.address_tokens(lead.get('address') or '')
+        return NormalizedLead(
+            name=' '.join(name_tokens),
+            address=' '.join(address_tokens),
+            phone=self.phone(lead.get('phone') or ''),
+            name_tokens=name_tokens,
+            address_tokens=address_tokens,
+        )
+    
+    def lead_key(self, lead: Dict) -> Optional[str]:
+        """
+        Natural key of a lead: its place_id, else its normalized name and
+        address, else its phone, else its website's domain.
+        
+        Used wherever leads are stored by identity (SQLite export, master
+        lead store) so the same business maps to the same record. Returns
+        None for a lead with none of these, which identifies nothing.
+        """
+        if lead.get('place_id'):
+            return f"place:{lead['place_id']}"
+        name, address = self.name(lead.get('name')), self.address(lead.get('address'))
+        if name or address:
+            return f"name:{name}|{address}"
+        phone = self.phone(lead.get('phone') or '')
+        if phone:
+            return f"phone:{phone}"
+        domain = website_domain(lead.get('website'))
+        if domain:
+            return f"web:{domain}"
+        return None
+    
+    def phones_match(self, phone1: str, phone2: str) -> bool:
+        """
+        Compare two normalized phone numbers.
+        
+        Numbers in E.164 must be equal. If either lacks a country code, the
+        national parts (without trunk zeros) match when one ends with the
+        other.
+        """
+        if phone1 == phone2:
+            return True
+        if phone1.startswith('+') and phone2.startswith('+'):
+            return False
+        digits1, digits2 = (phone[1:] if phone.startswith('+') else phone.lstrip('0') for phone in (phone1, phone2))
+        shorter, longer = sorted((digits1, digits2), key=len)
+        return len(shorter) >= MIN_PHONE_MATCH_DIGITS and longer.endswith(shorter)
+    
+    @staticmethod
+    def phone_key(phone: str) -> str:
+        """Blocking key of a normalized phone number (its trailing digits)."""
+        return phone.lstrip('+')[-PHONE_KEY_DIGITS:]
+    
+    def _name_tokens(self, name: str) -> Tuple[str, ...]:
+        tokens = TOKEN_PATTERN.findall(APOSTROPHES.sub('', str(name).casefold()))
+        kept = tuple(token for token in tokens if token not in NAME_STOPWORDS)
+        # A name made only of stopwords ("The Company") keeps them
+        return kept or tuple(tokens)
+    
+    def _address_tokens(self, address: str) -> Tuple[str, ...]:
+        tokens = TOKEN_PATTERN.findall(APOSTROPHES.sub('', str(address).casefold()))
+        return tuple(ADDRESS_ABBREVIATIONS.get(token, token) for token in tokens)
+    
+    def _phone(self, phone: str) -> str:
+        text = str(phone).strip()
+        digits = ''.join(filter(str.isdigit, text))
+        if not digits:
+            return ''
+        
+        if text.startswith('+'):
+            return f"+{digits}"
+        if digits.startswith('00'):
+            return f"+{digits[2:]}"
+        
+        code = self.default_country_code
+        if not code:
+            return digits
+        if len(digits) > MAX_NATIONAL_DIGITS and digits.startswith(code):
+            return f"+{digits}"
+        # Drop the trunk prefix of national formats ("0300 ..." -> "300 ...")
+        return f"+{code}{digits.lstrip('0')}"
+
+
+def website_domain(website) -> str:
+    """Host of a website URL without "www." ('' if there is none)."""
+    text = str(website or '').strip().casefold()
+    if not text:
+        return ''
+    host = urlparse(text if '//' in text else f"//{text}").hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+
+@lru_cache(maxsize=None)
+def get_normalizer(default_country_code: str = '') -> Normalizer:
+    """Return the shared Normalizer for a default country code."""
+    return Normalizer(default_country_code)
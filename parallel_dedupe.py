@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Parallel deduplication of large lead files.
+
+Deduplicator keeps every unique lead of a run in one process. For master
+files of millions of rows, dedupe_file() instead:
+
+1. Streams a CSV or JSONL file once and routes every row to the partition
+   of each of its routing keys (phone number, name prefix, address prefix),
+   spilling the partitions to temporary CSV files. Only the match fields
+   of a row are kept, and never more than one row at a time.
+2. Groups the rows of each partition by routing key in a process pool and
+   runs Deduplicator.groups() on every block with more than one row.
+3. Joins the matched pairs from all workers with union-find in the parent
+   and streams the input a second time, writing the first row of every
+   cluster (or every row, tagged with its cluster).
+
+Two leads are only compared if they share a routing key. Duplicates that
+differ in phone, name prefix and address prefix all at once are missed,
+where the in-memory Deduplicator could still match them on a shared name
+token or grid cell.
+
+Usage:
+    python parallel_dedupe.py leads.csv -o unique_leads.csv --workers 8
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import Config
+from dedupe import ADDRESS_PREFIX_LENGTH, NAME_PREFIX_LENGTH, ClusterStats, Deduplicator, UnionFind
+from normalization import Normalizer, get_normalizer
+
+
+# Fields read from each row for matching
+MATCH_FIELDS = ('place_id', 'name', 'address', 'phone', 'latitude', 'longitude')
+
+# Partitions per worker process; more, smaller partitions balance the pool
+PARTITIONS_PER_WORKER = 16
+
+# Rows held in memory while partitioning before they are appended to the
+# partition files; only one file is open at a time, however many there are
+PARTITION_BUFFER_ROWS = 50000
+
+FILE_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+# Deduplicator of the current worker process, built once by _init_worker()
+_worker_deduplicator: Optional[Deduplicator] = None
+
+
+def file_format(path: str) -> str:
+    """
+    Detect the format of a lead file from its extension.
+    
+    Args:
+        path: File path
+    
+    Returns:
+        'csv' or 'jsonl'
+    
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in FILE_FORMATS:
+        raise ValueError(f"Unsupported lead file {path} (expected one of {', '.join(FILE_FORMATS)})")
+    return FILE_FORMATS[suffix]
+
+
+def read_rows(path: str, fmt: str) -> Iterator[Tuple[object, Dict]]:
+    """
+    Stream the rows of a lead file.
+    
+    Args:
+        path: Input file path
+        fmt: 'csv' or 'jsonl'
+    
+    Yields:
+        (raw row, match fields) tuples; the raw row is a list for CSV and a
+        dict for JSONL
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            reader = csv.reader(f)
+            header = next(reader, [])
+            positions = {field: header.index(field) for field in MATCH_FIELDS if field in header}
+            for row in reader:
+                yield row, {
+                    field: row[position] if position < len(row) else ''
+                    for field, position in positions.items()
+                }
+        else:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record, {field: record.get(field) for field in MATCH_FIELDS}
+
+
+def routing_keys(lead: Dict, normalizer: Normalizer) -> List[str]:
+    """
+    Compute the keys that decide which blocks a lead is matched in.
+    
+    Args:
+        lead: Match fields of a lead
+        normalizer: Normalizer the Deduplicator uses
+    
+    Returns:
+        Phone, name prefix and address prefix keys (only those present)
+    """
+    keys = []
+    view = normalizer.lead(lead)
+    
+    if view.phone:
+        keys.append(f"phone:{normalizer.phone_key(view.phone)}")
+    
+    name = ''.join(view.name_tokens)
+    if name:
+        keys.append(f"nprefix:{name[:NAME_PREFIX_LENGTH]}")
+    
+    address = ''.join(view.address_tokens)
+    if address:
+        keys.append(f"aprefix:{address[:ADDRESS_PREFIX_LENGTH]}")
+    
+    return keys
+
+
+def dedupe_file(input_path: str, output_path: str, config, workers: Optional[int] = None,
+                keep_all: bool = False) -> ClusterStats:
+    """
+    Deduplicate a CSV or JSONL lead file across a pool of processes.
+    
+    Args:
+        input_path: CSV or JSONL file of leads
+        output_path: File to write, in the same format as the input
+        config: Configuration object (its deduplication section is used)
+        workers: Worker processes (default: deduplication.workers, or one per CPU)
+        keep_all: Write every row with its cluster instead of one row per cluster
+    
+    Returns:
+        Cluster statistics (filled_fields stays 0; rows are not merged)
+    """
+    logger = logging.getLogger(__name__)
+    start = time.perf_counter()
+    fmt = file_format(input_path)
+    workers = workers or config.deduplication.get('workers') or os.cpu_count() or 1
+    
+    # Workers only match; the persistent index is never touched from the pool
+    settings = dict(config.deduplication, persistent_index=False, only_new=False)
+    
+    with tempfile.TemporaryDirectory(prefix='dedupe-') as directory:
+        normalizer = get_normalizer(str(settings.get('default_country_code', '')))
+        partitions, count = _partition(
+            input_path, fmt, Path(directory), workers * PARTITIONS_PER_WORKER, normalizer
+        )
+        logger.info(f"Partitioned {count} rows into {len(partitions)} partitions")
+        
+        forest = UnionFind(count)
+        for pairs in _match_partitions(partitions, settings, workers):
+            for first, other in pairs:
+                forest.union(first, other)
+    
+    stats = _write_clusters(input_path, output_path, fmt, forest, keep_all)
+    stats.elapsed = time.perf_counter() - start
+    logger.info(
+        f"✓ {stats.clusters} clusters from {stats.leads} rows "
+        f"({stats.merged_clusters} merged, largest {stats.largest_cluster}) "
+        f"with {workers} workers in {stats.elapsed:.1f}s"
+    )
+    return stats
+
+
+def _partition(input_path: str, fmt: str, directory: Path, count: int,
+               normalizer: Normalizer) -> Tuple[List[Path], int]:
+    """Spill the match fields of every row to the partition file of each routing key."""
+    paths = [directory / f"partition-{index:04d}.csv" for index in range(count)]
+    buffers: List[List[list]] = [[] for _ in range(count)]
+    buffered = 0
+    rows = 0
+    
+    for row_id, (_, lead) in enumerate(read_rows(input_path, fmt)):
+        values = [lead.get(field) for field in MATCH_FIELDS]
+        for key in routing_keys(lead, normalizer):
+            # crc32 rather than hash(): string hashes differ between processes
+            buffers[zlib.crc32(key.encode('utf-8')) % count].append([key, row_id] + values)
+            buffered += 1
+        if buffered >= PARTITION_BUFFER_ROWS:
+            _flush_partitions(paths, buffers)
+            buffered = 0
+        rows = row_id + 1
+    
+    # Also creates the partitions that got no rows
+    _flush_partitions(paths, buffers)
+    return paths, rows
+
+
+def _flush_partitions(paths: List[Path], buffers: List[List[list]]):
+    """Append buffered rows to their partition files, opening one file at a time."""
+    for path, buffer in zip(paths, buffers):
+        if not buffer and path.exists():
+            continue
+        with open(path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(buffer)
+        buffer.clear()
+
+
+def _match_partitions(paths: List[Path], settings: Dict, workers: int) -> Iterator[List[Tuple[int, int]]]:
+    """Match every partition, in a process pool unless workers is 1."""
+    if workers == 1:
+        _init_worker(settings)
+        for path in paths:
+            yield _match_partition(str(path))
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(settings,)) as executor:
+        futures = [executor.submit(_match_partition, str(path)) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _init_worker(settings: Dict):
+    """Build the Deduplicator of a worker process."""
+    global _worker_deduplicator
+    _worker_deduplicator = Deduplicator(SimpleNamespace(deduplication=settings))
+
+
+def _match_partition(path: str) -> List[Tuple[int, int]]:
+    """
+    Find the duplicate pairs inside one partition file.
+    
+    Args:
+        path: Partition file written by _partition()
+    
+    Returns:
+        (first row id, duplicate row id) pairs
+    """
+    blocks: Dict[str, List[Tuple[int, Dict]]] = defaultdict(list)
+    with open(path, newline='', encoding='utf-8') as f:
+        for key, row_id, *values in csv.reader(f):
+            lead = dict(zip(MATCH_FIELDS, values))
+            lead['latitude'] = _to_float(lead['latitude'])
+            lead['longitude'] = _to_float(lead['longitude'])
+            blocks[key].append((int(row_id), lead))
+    
+    pairs = []
+    for rows in blocks.values():
+        if len(rows) < 2:
+            continue
+        for members in _worker_deduplicator.groups([lead for _, lead in rows]):
+            first = rows[members[0]][0]
+            pairs.extend((first, rows[member][0]) for member in members[1:])
+    
+    return pairs
+
+
+def _to_float(value) -> Optional[float]:
+    """Parse a coordinate, treating blanks and junk as missing."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _write_clusters(input_path: str, output_path: str, fmt: str, forest: UnionFind,
+                    keep_all: bool) -> ClusterStats:
+    """Stream the input again and write it out with cluster_id and cluster_size columns."""
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    stats = ClusterStats(leads=len(forest.parent))
+    # Root -> row id of the cluster's first row
+    cluster_ids: Dict[int, int] = {}
+    
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = None
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            with open(input_path, newline='', encoding='utf-8') as source:
+                writer.writerow(next(csv.reader(source), []) + ['cluster_id', 'cluster_size'])
+        
+        for row_id, (raw, _) in enumerate(read_rows(input_path, fmt)):
+            root = forest.find(row_id)
+            size = forest.size[root]
+            first = root not in cluster_ids
+            if first:
+                cluster_ids[root] = row_id
+                stats.clusters += 1
+                if size > 1:
+                    stats.merged_clusters += 1
+                stats.largest_cluster = max(stats.largest_cluster, size)
+            elif not keep_all:
+                continue
+            
+            if writer is not None:
+                writer.writerow(raw + [cluster_ids[root], size])
+            else:
+                raw['cluster_id'] = cluster_ids[root]
+                raw['cluster_size'] = size
+                f.write(json.dumps(raw, ensure_ascii=False) + '\n')
+    
+    return stats
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help='CSV or JSONL file of leads')
+    parser.add_argument('--output', '-o', required=True, help='Output file (same format as the input)')
+    parser.add_argument('--workers', '-w', type=int, default=None, help='Worker processes (default: one per CPU)')
+    parser.add_argument('--all', action='store_true', help='Write every row tagged with its cluster')
+    parser.add_argument('--config', '-c', default='config.yaml', help='Configuration file')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    try:
+        dedupe_file(args.input, args.output, Config(args.config), args.workers, args.all)
+    except (OSError, ValueError) as e:
+        logging.getLogger(__name__).error(str(e))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
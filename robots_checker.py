@@ -5,13 +5,227 @@ This module handles fetching and parsing robots.txt files to ensure
 compliant scraping behavior.
 """
 
+import atexit
+import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from urllib.parse import urlparse, urljoin
-from urllib.robotparser import RobotFileParser
 import requests
-from typing import Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import time
 
+from robots_matcher import CompiledRobots
+
+
+@dataclass
+class RobotsEntry:
+    """Cached robots.txt rules for one site (lines is None for a negative result)."""
+    
+    lines: Optional[List[str]]
+    expires_at: float
+    matcher: Optional[CompiledRobots] = None
+    
+    def get_matcher(self) -> Optional[CompiledRobots]:
+        """Return the compiled rules, compiling the stored lines on first use."""
+        if self.matcher is None and self.lines is not None:
+            self.matcher = CompiledRobots.parse(self.lines)
+        return self.matcher
+
+
+class RobotsCache:
+    """
+    Thread-safe LRU cache of robots.txt rules persisted to a JSON file.
+    
+    Entries expire individually, so successful fetches and negative results
+    (404s, timeouts) can carry different TTLs. The raw rule lines are what
+    gets persisted; matchers are recompiled lazily after a reload. New
+    entries are written to disk by save(), which runs after each prefetch
+    batch and at exit, not on every insert.
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1000):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: JSON file to persist entries to (None for memory only)
+            max_entries: Maximum number of sites kept before LRU eviction
+        """
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        self._entries: 'OrderedDict[str, RobotsEntry]' = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._load()
+        if self.path:
+            atexit.register(self.save)
+    
+    def __contains__(self, robots_url: str) -> bool:
+        return self.get(robots_url) is not None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, robots_url: str) -> Optional[RobotsEntry]:
+        """
+        Return the unexpired entry for a robots.txt URL and mark it recently used.
+        
+        Args:
+            robots_url: URL of robots.txt file
+        
+        Returns:
+            Cached entry or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(robots_url)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[robots_url]
+                return None
+            self._entries.move_to_end(robots_url)
+            return entry
+    
+    def put(self, robots_url: str, lines: Optional[List[str]], ttl: float) -> RobotsEntry:
+        """
+        Store rules for a robots.txt URL, evicting the least recently used sites.
+        
+        Args:
+            robots_url: URL of robots.txt file
+            lines: robots.txt lines, or None for a negative result
+            ttl: Seconds until the entry expires
+        
+        Returns:
+            The stored entry
+        """
+        entry = RobotsEntry(lines=lines, expires_at=time.time() + ttl)
+        with self._lock:
+            self._entries[robots_url] = entry
+            self._entries.move_to_end(robots_url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+        return entry
+    
+    def get_or_fetch(self, robots_url: str,
+                     fetch: Callable[[], Tuple[Optional[List[str]], float]]) -> RobotsEntry:
+        """
+        Return the entry for a robots.txt URL, fetching it on a miss.
+        
+        Concurrent misses for the same URL share one fetch: the first caller
+        runs fetch() and the others wait for its result.
+        
+        Args:
+            robots_url: URL of robots.txt file
+            fetch: Returns (lines, ttl) as passed to put()
+        
+        Returns:
+            Cached or freshly fetched entry
+        """
+        with self._lock:
+            entry = self.get(robots_url)
+            if entry is not None:
+                return entry
+            future = self._in_flight.get(robots_url)
+            if future is not None:
+                owner = False
+            else:
+                owner = True
+                future = self._in_flight[robots_url] = Future()
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            entry = self.put(robots_url, *fetch())
+            future.set_result(entry)
+            return entry
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[robots_url]
+    
+    def save(self):
+        """Write the entries to disk if any were added since the last save."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+    
+    def _load(self):
+        """Load unexpired entries from disk."""
+        if not self.path or not self.path.exists():
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load robots.txt cache: {e}")
+            return
+        
+        now = time.time()
+        for robots_url, item in stored.items():
+            if item.get('expires_at', 0) > now:
+                self._entries[robots_url] = RobotsEntry(item.get('lines'), item['expires_at'])
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _save(self):
+        """Write entries to disk atomically (caller holds the lock)."""
+        if not self.path:
+            return
+        
+        stored = {
+            robots_url: {'lines': entry.lines, 'expires_at': entry.expires_at}
+            for robots_url, entry in self._entries.items()
+        }
+        
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save robots.txt cache: {e}")
+
+
+_shared_caches: Dict[str, RobotsCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_cache(config) -> RobotsCache:
+    """
+    Return the process-wide robots.txt cache for the configured cache file.
+    
+    Args:
+        config: Configuration object
+    
+    Returns:
+        RobotsCache shared by every RobotsChecker using the same file
+    """
+    cache_file = config.robots.get('cache_file', './data/robots_cache.json')
+    key = str(Path(cache_file).resolve()) if cache_file else ''
+    
+    with _shared_caches_lock:
+        if key not in _shared_caches:
+            _shared_caches[key] = RobotsCache(
+                cache_file or None,
+                max_entries=config.robots.get('cache_max_entries', 1000)
+            )
+        return _shared_caches[key]
+
 
 class RobotsChecker:
     """
@@ -19,8 +233,8 @@ class RobotsChecker:
     
     This class:
     - Fetches robots.txt from target domains
-    - Parses disallow rules
-    - Caches robots.txt files
+    - Compiles allow/disallow rules and Crawl-delay per user agent
+    - Caches robots.txt files in a process-wide, disk-persisted LRU cache
     - Determines if scraping is allowed for specific paths
     """
     
@@ -33,8 +247,10 @@ class RobotsChecker:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.cache = {}
+        self.cache_enabled = config.robots.get('cache_enabled', True)
+        self.cache = get_shared_cache(config) if self.cache_enabled else RobotsCache()
         self.cache_duration = config.robots.get('cache_duration', 3600)
+        self.negative_cache_duration = config.robots.get('negative_cache_duration', 300)
     
     def can_fetch(self, url: str, user_agent: str = '*') -> bool:
         """
@@ -50,35 +266,102 @@ class RobotsChecker:
         if not self.config.robots.get('enabled', True):
             return True
         
-        parsed_url = urlparse(url)
-        domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        robots_url = urljoin(domain, '/robots.txt')
-        
-        # Check cache
-        if robots_url in self.cache:
-            parser, timestamp = self.cache[robots_url]
-            if time.time() - timestamp < self.cache_duration:
-                return parser.can_fetch(user_agent, url)
+        matcher = self._get_entry(self._robots_url(url)).get_matcher()
         
-        # Fetch and parse robots.txt
-        parser = self._fetch_robots(robots_url)
-        
-        if parser:
-            self.cache[robots_url] = (parser, time.time())
-            return parser.can_fetch(user_agent, url)
+        if matcher:
+            return matcher.can_fetch(user_agent, url)
         
         # If robots.txt not found, allow by default
         return True
     
-    def _fetch_robots(self, robots_url: str) -> Optional[RobotFileParser]:
+    def crawl_delay(self, url: str, user_agent: str = '*') -> Optional[float]:
+        """
+        Return the Crawl-delay robots.txt asks for on the URL's site.
+        
+        Args:
+            url: Any URL on the site
+            user_agent: User agent string (default: '*')
+        
+        Returns:
+            Delay in seconds, or None if robots.txt sets none
+        """
+        if not self.config.robots.get('enabled', True):
+            return None
+        
+        matcher = self._get_entry(self._robots_url(url)).get_matcher()
+        return matcher.crawl_delay(user_agent) if matcher else None
+    
+    def prefetch(self, urls: Iterable[str], max_workers: int = 8) -> List[Future]:
+        """
+        Fetch robots.txt for the sites of the given URLs in the background.
+        
+        Call this with a batch of URLs before enrichment starts so later
+        can_fetch() calls are served from the cache (or wait for the fetch
+        already running for their site). The cache is saved to disk once
+        the whole batch is done.
+        
+        Args:
+            urls: URLs whose sites should be prefetched
+            max_workers: Number of concurrent fetches
+        
+        Returns:
+            Futures that complete when each site's rules are cached
+        """
+        robots_urls = {
+            self._robots_url(url) for url in urls
+            if url and urlparse(url).netloc
+        }
+        pending = [robots_url for robots_url in robots_urls if robots_url not in self.cache]
+        
+        if not pending:
+            return []
+        
+        self.logger.debug(f"Prefetching robots.txt for {len(pending)} sites")
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending))))
+        futures = [executor.submit(self._get_entry, robots_url) for robots_url in pending]
+        executor.shutdown(wait=False)
+        
+        remaining = [len(futures)]
+        remaining_lock = threading.Lock()
+        
+        def batch_done(_future):
+            with remaining_lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self.cache.save()
+        
+        for future in futures:
+            future.add_done_callback(batch_done)
+        return futures
+    
+    def close(self):
+        """Save the robots.txt cache to disk."""
+        self.cache.save()
+    
+    def _robots_url(self, url: str) -> str:
+        """Return the robots.txt URL for the site of a URL."""
+        parsed_url = urlparse(url)
+        domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        return urljoin(domain, '/robots.txt')
+    
+    def _get_entry(self, robots_url: str) -> RobotsEntry:
+        """Return cached rules for a site, fetching them if missing or expired."""
+        def fetch():
+            lines = self._fetch_robots(robots_url)
+            return lines, self.cache_duration if lines is not None else self.negative_cache_duration
+        
+        return self.cache.get_or_fetch(robots_url, fetch)
+    
+    def _fetch_robots(self, robots_url: str) -> Optional[List[str]]:
         """
-        Fetch and parse robots.txt file.
+        Fetch robots.txt file.
         
         Args:
             robots_url: URL of robots.txt file
             
         Returns:
-            RobotFileParser object or None if fetch fails
+            robots.txt lines or None if fetch fails
         """
         try:
             self.logger.debug(f"Fetching robots.txt from {robots_url}")
@@ -90,10 +373,9 @@ class RobotsChecker:
             )
             
             if response.status_code == 200:
-                parser = RobotFileParser()
-                parser.parse(response.text.splitlines())
-                self.logger.debug(f"✓ Successfully parsed robots.txt")
-                return parser
+                lines = response.text.splitlines()
+                self.logger.debug(f"✓ Successfully fetched robots.txt")
+                return lines
             
             elif response.status_code == 404:
                 self.logger.debug("robots.txt not found (404) - allowing by default")
@@ -107,5 +389,5 @@ class RobotsChecker:
             self.logger.warning(f"Failed to fetch robots.txt: {e}")
             return None
         except Exception as e:
-            self.logger.error(f"Error parsing robots.txt: {e}")
+            self.logger.error(f"Error fetching robots.txt: {e}")
             return None
@@ -0,0 +1,230 @@
+"""
+Compiled robots.txt rule matcher.
+
+``RobotFileParser.can_fetch`` re-scans every rule line on each call. This
+module parses a robots.txt once into per-user-agent rule tables so path
+checks cost a handful of dict lookups:
+
+- Plain rules live in prefix tables keyed by length, so every matching
+  prefix is found by slicing the path at each distinct rule length.
+- Rules with ``*`` or a trailing ``$`` are compiled to regexes and only tried
+  when they come before the first matching plain rule.
+
+Answers match ``RobotFileParser.can_fetch``: the first rule in file order
+that matches the path wins, and the first group naming the agent (a
+substring of its name) is used, else the first ``*`` group. The one
+extension is wildcards, which urllib compares literally and so never
+matches; here ``*`` matches any run of characters and ``$`` anchors the end.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlparse, urlunparse
+
+
+PATH_SAFE_CHARS = "/*$?=&;:@+,!~'()"
+
+
+def normalize_path(path: str) -> str:
+    """
+    Normalize a rule path or request path so both compare consistently.
+    
+    Args:
+        path: Path (optionally with query string), already unquoted
+    
+    Returns:
+        Percent-encoded path, '/' if empty
+    """
+    return quote(path, safe=PATH_SAFE_CHARS) or '/'
+
+
+class CompiledRules:
+    """Allow/Disallow rules of one user-agent group, compiled for fast lookup."""
+    
+    def __init__(self, rules: List[Tuple[bool, str]], crawl_delay: Optional[float] = None):
+        """
+        Compile a group's rules.
+        
+        Args:
+            rules: (allowance, path) tuples in file order
+            crawl_delay: Crawl-delay of the group in seconds, if any
+        """
+        self.crawl_delay = crawl_delay
+        self._rule_count = len(rules)
+        # length -> {path prefix: (position in the file, allowance)}
+        self._prefixes: Dict[int, Dict[str, Tuple[int, bool]]] = {}
+        self._patterns: List[Tuple[int, bool, 're.Pattern']] = []
+        
+        for index, (allowance, path) in enumerate(rules):
+            if not path:
+                # An empty Disallow/Allow allows everything (as in RobotFileParser)
+                self._prefixes.setdefault(0, {}).setdefault('', (index, True))
+                continue
+            path = normalize_path(urlunparse(urlparse(path)))
+            
+            if '*' in path or path.endswith('$'):
+                anchored = path.endswith('$')
+                body = path[:-1] if anchored else path
+                regex = '.*'.join(re.escape(part) for part in body.split('*'))
+                self._patterns.append((index, allowance, re.compile(regex + ('$' if anchored else ''))))
+            else:
+                # Only the first occurrence of a path can ever match first
+                self._prefixes.setdefault(len(path), {}).setdefault(path, (index, allowance))
+        
+        self._lengths = sorted(self._prefixes)
+    
+    def allowed(self, path: str) -> bool:
+        """
+        Check a normalized request path against the rules.
+        
+        Args:
+            path: Path as returned by normalize_path
+        
+        Returns:
+            True if the path may be fetched
+        """
+        best_index = self._rule_count
+        best_allow = True
+        
+        for length in self._lengths:
+            if length > len(path):
+                break
+            hit = self._prefixes[length].get(path[:length])
+            if hit is not None and hit[0] < best_index:
+                best_index, best_allow = hit
+        
+        for index, allowance, pattern in self._patterns:
+            if index > best_index:
+                break
+            if pattern.match(path):
+                return allowance
+        
+        return best_allow
+
+
+class CompiledRobots:
+    """A whole robots.txt file compiled into per-user-agent rule tables."""
+    
+    def __init__(self, groups: List[Tuple[List[str], List[Tuple[bool, str]], Optional[float]]]):
+        """
+        Build the matcher from parsed groups.
+        
+        Args:
+            groups: (agents, rules, crawl_delay) tuples in file order
+        """
+        self._groups = groups
+        self._by_agent: Dict[str, CompiledRules] = {}
+        
+        # Like RobotFileParser: the first '*' group is the fallback and any
+        # later one is ignored
+        self._default = next((g for g in groups if '*' in g[0]), None)
+        self._entries = [g for g in groups if '*' not in g[0]]
+    
+    @classmethod
+    def parse(cls, lines: List[str]) -> 'CompiledRobots':
+        """
+        Parse robots.txt lines the way RobotFileParser.parse does.
+        
+        A blank line or a User-agent line after rules ends a group; rules
+        before any User-agent line are ignored.
+        
+        Args:
+            lines: robots.txt content split into lines
+        
+        Returns:
+            CompiledRobots instance
+        """
+        groups = []
+        agents: List[str] = []
+        rules: List[Tuple[bool, str]] = []
+        crawl_delay: Optional[float] = None
+        in_rules = False
+        
+        for line in lines:
+            if not line and agents:
+                if in_rules:
+                    groups.append((agents, rules, crawl_delay))
+                agents, rules, crawl_delay, in_rules = [], [], None, False
+            
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            
+            field, value = line.split(':', 1)
+            field = field.strip().lower()
+            value = unquote(value.strip())
+            
+            if field == 'user-agent':
+                if in_rules:
+                    groups.append((agents, rules, crawl_delay))
+                    agents, rules, crawl_delay, in_rules = [], [], None, False
+                agents.append(value.lower())
+            elif field in ('allow', 'disallow') and agents:
+                rules.append((field == 'allow', value))
+                in_rules = True
+            elif field == 'crawl-delay' and agents:
+                try:
+                    crawl_delay = float(value)
+                except ValueError:
+                    pass
+                in_rules = True
+            elif field == 'request-rate' and agents:
+                in_rules = True
+        
+        if in_rules:
+            groups.append((agents, rules, crawl_delay))
+        
+        return cls(groups)
+    
+    def rules_for(self, user_agent: str) -> CompiledRules:
+        """
+        Return the compiled rules that apply to a user agent.
+        
+        The first group with an agent contained in the user agent's name
+        wins, then the first '*' group; no rules if neither exists.
+        
+        Args:
+            user_agent: User agent string
+        
+        Returns:
+            CompiledRules for the agent
+        """
+        name = user_agent.split('/')[0].lower()
+        compiled = self._by_agent.get(name)
+        if compiled is not None:
+            return compiled
+        
+        group = next((g for g in self._entries if any(a in name for a in g[0])), self._default)
+        compiled = CompiledRules(group[1], crawl_delay=group[2]) if group else CompiledRules([])
+        
+        self._by_agent[name] = compiled
+        return compiled
+    
+    def can_fetch(self, user_agent: str, url: str) -> bool:
+        """
+        Check whether a URL may be fetched (same signature as RobotFileParser).
+        
+        Args:
+            user_agent: User agent string
+            url: Absolute or site-relative URL
+        
+        Returns:
+            True if fetching is allowed
+        """
+        parsed = urlparse(unquote(url))
+        path = urlunparse(('', '', parsed.path, parsed.params, parsed.query, parsed.fragment))
+        return self.rules_for(user_agent).allowed(normalize_path(path))
+    
+    def crawl_delay(self, user_agent: str) -> Optional[float]:
+        """
+        Return the Crawl-delay that applies to a user agent.
+        
+        Unlike RobotFileParser, fractional delays ("0.5") are kept.
+        
+        Args:
+            user_agent: User agent string
+        
+        Returns:
+            Delay in seconds, or None if not specified
+        """
+        return self.rules_for(user_agent).crawl_delay
@@ -422,8 +422,35 @@ class SeleniumScraper:
             # Restore original robots.txt setting
             self.config.robots['enabled'] = original_robots_enabled
         
+        self._enrich_from_websites(all_leads)
         return all_leads
     
+    def _enrich_from_websites(self, leads: List[Dict]):
+        """Visit each lead's website for an email and social media links."""
+        websites = [lead['website'] for lead in leads if lead.get('website')]
+        if not websites:
+            return
+        
+        if self.config.robots['enabled']:
+            # Fetch the robots.txt of every site at once instead of one per visit
+            self.robots_checker.prefetch(websites)
+        
+        for lead in leads:
+            if not lead.get('website'):
+                continue
+            try:
+                site_details = self._extract_website_details(lead['website'])
+            except Exception as e:
+                self.logger.warning(f"Error scraping website details: {e}")
+                continue
+            
+            if not lead.get('email') and site_details.get('email'):
+                lead['email'] = site_details['email']
+            for k, v in site_details.get('social_media', {}).items():
+                if v:
+                    lead[k] = v
+            lead['whatsapp_status'] = "Available" if lead.get('whatsapp') else "Not Detected"
+    
     def _get_mock_data(self, query: str, location: str, max_results: int) -> List[Dict]:
         """Generate mock data for testing when WebDriver is not available."""
         self.logger.info(f"Generating {max_results} mock leads for {query} in {location}")
@@ -861,7 +888,7 @@ class SeleniumScraper:
                 self._safe_extract(By.CSS_SELECTOR, 'a[aria-label*="website"]', 'href')
             )
             
-            # Website Details (Email + Social Media)
+            # Email (+ social media links from the website, see _enrich_from_websites)
             email = None
             social_links = {
                 'facebook': None, 'instagram': None, 'twitter': None, 
@@ -888,21 +915,6 @@ class SeleniumScraper:
             except:
                 pass
             
-            # If website exists, visit it for more details
-            if website:
-                try:
-                    site_details = self._extract_website_details(website)
-                    if site_details:
-                        if not email and site_details.get('email'):
-                            email = site_details['email']
-                        
-                        # Update social links
-                        for k, v in site_details.get('social_media', {}).items():
-                            if v:
-                                social_links[k] = v
-                except Exception as e:
-                    self.logger.warning(f"Error scraping website details: {e}")
-            
             # Extract category
             category = self._safe_extract(By.CSS_SELECTOR, 'button[jsaction*="category"]', 'text')
             
@@ -991,6 +1003,9 @@ class SeleniumScraper:
             }
         }
         
+        if not self._check_robots_txt(website_url):
+            return details
+        
         try:
             import requests
             from requests.exceptions import RequestException
@@ -1192,6 +1207,7 @@ class SeleniumScraper:
     
     def close(self):
         """Close browser."""
+        self.robots_checker.close()
         if self.driver:
             self.logger.info("Closing browser...")
             try:
@@ -0,0 +1,141 @@
+"""
+Batched string similarity backends for fuzzy deduplication.
+
+Deduplicator scores names and addresses with difflib's SequenceMatcher ratio,
+one Python object per pair. The backends here score one string against a
+whole candidate block in a single call and return an upper bound of that
+ratio:
+
+- RapidFuzzBackend: rapidfuzz's Indel ratio, 2 * LCS / total length. The
+  blocks SequenceMatcher matches form a common subsequence, so this is never
+  below the difflib ratio.
+- NumpyBackend: the character-histogram bound difflib calls quick_ratio,
+  computed for the whole block with one np.minimum over count vectors.
+
+Because the bounds never undershoot, a candidate whose bounded lead score is
+below fuzzy_threshold cannot be a duplicate. Deduplicator skips those and
+confirms the rest with SequenceMatcher, so the threshold keeps its meaning
+and results match the plain difflib path.
+"""
+
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import Indel
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Characters are hashed into this many histogram bins. Collisions only merge
+# counts, which can raise the bound but never push it below the true ratio.
+HISTOGRAM_BINS = 128
+
+
+class SimilarityBackend:
+    """Reference backend: exact SequenceMatcher ratios, one pair at a time."""
+    
+    name = 'difflib'
+    # True when scores are the exact difflib ratio rather than an upper bound
+    exact = True
+    
+    def ratios(self, query: str, choices: List[str]) -> List[float]:
+        """
+        Score one string against many.
+        
+        Args:
+            query: String to compare
+            choices: Strings to compare against
+        
+        Returns:
+            One score between 0.0 and 1.0 per choice
+        """
+        return [SequenceMatcher(None, query, choice).ratio() for choice in choices]
+
+
+class RapidFuzzBackend(SimilarityBackend):
+    """Indel ratio for a whole block via rapidfuzz.process.cdist."""
+    
+    name = 'rapidfuzz'
+    exact = False
+    
+    def ratios(self, query: str, choices: List[str]) -> List[float]:
+        if not choices:
+            return []
+        scores = rapidfuzz_process.cdist(
+            [query], choices, scorer=Indel.normalized_similarity, workers=1
+        )
+        return scores[0].tolist()
+
+
+class NumpyBackend(SimilarityBackend):
+    """Character-histogram bound for a whole block via NumPy."""
+    
+    name = 'numpy'
+    exact = False
+    
+    def ratios(self, query: str, choices: List[str]) -> List[float]:
+        if not choices:
+            return []
+        query_counts = _histogram(query)
+        counts = np.stack([_histogram(choice) for choice in choices])
+        matches = np.minimum(counts, query_counts).sum(axis=1)
+        lengths = counts.sum(axis=1) + len(query)
+        return (2.0 * matches / np.maximum(lengths, 1)).tolist()
+
+
+@lru_cache(maxsize=65536)
+def _histogram(text: str):
+    """Return the binned character counts of a string (cached, read-only)."""
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    counts = np.bincount(codes % HISTOGRAM_BINS, minlength=HISTOGRAM_BINS)
+    counts.flags.writeable = False
+    return counts
+
+
+BACKENDS = {
+    'rapidfuzz': RapidFuzzBackend,
+    'numpy': NumpyBackend,
+    'difflib': SimilarityBackend,
+}
+
+
+def get_backend(name: Optional[str] = 'auto') -> SimilarityBackend:
+    """
+    Return a similarity backend by name.
+    
+    Args:
+        name: 'rapidfuzz', 'numpy', 'difflib' or 'auto' (best installed)
+    
+    Returns:
+        SimilarityBackend instance
+    
+    Raises:
+        ValueError: If the name is unknown or its library is not installed
+    """
+    name = (name or 'auto').lower()
+    
+    if name == 'auto':
+        if RAPIDFUZZ_AVAILABLE:
+            return RapidFuzzBackend()
+        if NUMPY_AVAILABLE:
+            return NumpyBackend()
+        return SimilarityBackend()
+    
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown similarity backend: {name}")
+    if name == 'rapidfuzz' and not RAPIDFUZZ_AVAILABLE:
+        raise ValueError("similarity backend 'rapidfuzz' requires the rapidfuzz package")
+    if name == 'numpy' and not NUMPY_AVAILABLE:
+        raise ValueError("similarity backend 'numpy' requires the numpy package")
+    
+    return BACKENDS[name]()
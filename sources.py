@@ -0,0 +1,212 @@
+"""
+Lead source registry for multi-source collection.
+
+Wraps the Google Maps, Yelp and Yellow Pages scrapers behind a common
+interface and runs them concurrently, streaming each source's results into
+a shared deduplicator as soon as that source finishes.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Protocol, Tuple
+
+
+class LeadSource(Protocol):
+    """Common interface implemented by every lead source."""
+    
+    name: str
+    
+    def scrape(self, query: str, location: str, max_results: int) -> List[Dict]:
+        """Collect up to max_results leads for the query in the location."""
+        ...
+    
+    def close(self) -> None:
+        """Release browsers, sessions and other resources."""
+        ...
+
+
+class GoogleMapsSource:
+    """Google Maps leads through the Selenium scraper."""
+    
+    name = 'maps'
+    
+    def __init__(self, config, headless=False, guest_mode=True, profile=None,
+                 delay=1.5, tile_mode=False, tile_size=0.1):
+        from selenium_scraper import SeleniumScraper
+        
+        self.tile_mode = tile_mode
+        self.tile_size = tile_size
+        self.scraper = SeleniumScraper(
+            config=config,
+            headless=headless,
+            guest_mode=guest_mode,
+            profile=profile,
+            delay=delay
+        )
+    
+    def scrape(self, query: str, location: str, max_results: int) -> List[Dict]:
+        return self.scraper.scrape_google_maps(
+            query=query,
+            location=location,
+            max_results=max_results,
+            tile_mode=self.tile_mode,
+            tile_size=self.tile_size
+        )
+    
+    def close(self) -> None:
+        self.scraper.close()
+
+
+class YelpSource:
+    """Yelp leads through the HTTP engine (default) or the Selenium scraper."""
+    
+    name = 'yelp'
+    
+    def __init__(self, config, engine='http', headless=True):
+        if engine == 'selenium':
+            from yelp_scraper import YelpScraper
+            self.scraper = YelpScraper(config, headless=headless)
+        else:
+            from yelp_http_scraper import YelpHttpScraper
+            self.scraper = YelpHttpScraper(config)
+    
+    def scrape(self, query: str, location: str, max_results: int) -> List[Dict]:
+        return self.scraper.scrape_yelp(query, location, max_results)
+    
+    def close(self) -> None:
+        self.scraper.close()
+
+
+class YellowPagesSource:
+    """Yellow Pages leads through the HTTP engine (default) or the Selenium scraper."""
+    
+    name = 'yellowpages'
+    
+    def __init__(self, config, engine='http', headless=True):
+        if engine == 'selenium':
+            from yellow_pages_scraper import YellowPagesScraper
+            self.scraper = YellowPagesScraper(config, headless=headless)
+        else:
+            from yellow_pages_http_scraper import YellowPagesHttpScraper
+            self.scraper = YellowPagesHttpScraper(config)
+    
+    def scrape(self, query: str, location: str, max_results: int) -> List[Dict]:
+        return self.scraper.scrape_yellow_pages(query, location, max_results)
+    
+    def close(self) -> None:
+        self.scraper.close()
+
+
+SOURCE_TYPES = {
+    GoogleMapsSource.name: GoogleMapsSource,
+    YelpSource.name: YelpSource,
+    YellowPagesSource.name: YellowPagesSource,
+}
+
+
+@dataclass
+class SourceStats:
+    """Timing and yield of a single source run."""
+    
+    name: str
+    leads: int = 0
+    unique: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+def _run_source(factory: Callable[[], LeadSource], query: str, location: str,
+                max_results: int) -> Tuple[List[Dict], float]:
+    """Build, run and close one source inside a worker thread."""
+    start = time.perf_counter()
+    source = factory()
+    try:
+        leads = source.scrape(query, location, max_results)
+    finally:
+        source.close()
+    return leads or [], time.perf_counter() - start
+
+
+def collect_from_sources(
+    factories: Dict[str, Callable[[], LeadSource]],
+    query: str,
+    location: str,
+    max_results: int,
+    deduplicator,
+    on_lead: Optional[Callable[[Dict], None]] = None
+) -> Tuple[List[Dict], List[SourceStats]]:
+    """
+    Run several lead sources concurrently and deduplicate as results arrive.
+    
+    Each source is built and run in its own worker, so the total time is
+    bounded by the slowest source rather than the sum of all of them. In
+    cluster mode the leads are collected first and clustered once all
+    sources have finished.
+    
+    Args:
+        factories: Mapping of source name to a callable that builds the source
+        query: Business type to search for
+        location: Geographic location
+        max_results: Maximum number of leads per source
+        deduplicator: Deduplicator shared by all sources
+        on_lead: Called with each unique lead as soon as it is kept (in
+            cluster mode, with each merged lead at the end)
+    
+    Returns:
+        Tuple of (unique leads, per-source statistics)
+    """
+    logger = logging.getLogger(__name__)
+    deduplicator.reset()
+    stats = {name: SourceStats(name) for name in factories}
+    clustering = deduplicator.mode == 'cluster'
+    collected: List[Dict] = []
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(factories))) as executor:
+        futures = {
+            executor.submit(_run_source, factory, query, location, max_results): name
+            for name, factory in factories.items()
+        }
+        
+        for future in as_completed(futures):
+            name = futures[future]
+            source_stats = stats[name]
+            
+            try:
+                leads, source_stats.elapsed = future.result()
+            except Exception as e:
+                source_stats.error = str(e)
+                logger.error(f"Source {name} failed: {e}")
+                continue
+            
+            source_stats.leads = len(leads)
+            for lead in leads:
+                lead.setdefault('source', name)
+                lead.setdefault('query', query)
+                lead.setdefault('location', location)
+                if clustering:
+                    collected.append(lead)
+                elif deduplicator.add(lead):
+                    source_stats.unique += 1
+                    if on_lead is not None:
+                        on_lead(lead)
+            
+            logger.info(
+                f"✓ {name}: {source_stats.leads} leads, {source_stats.unique} new "
+                f"in {source_stats.elapsed:.1f}s"
+            )
+    
+    if clustering:
+        merged = deduplicator.cluster(collected)
+        for name, source_stats in stats.items():
+            source_stats.unique = sum(
+                1 for lead in merged if name in str(lead.get('source', '')).split(', ')
+            )
+        if on_lead is not None:
+            for lead in merged:
+                on_lead(lead)
+        return merged, list(stats.values())
+    
+    deduplicator.flush()
+    return deduplicator.unique_leads, list(stats.values())
@@ -0,0 +1,209 @@
+"""
+Append-capable streaming writers for leads.
+
+DataExporter.export() writes a finished list in one go. For long scraping
+sessions the writers here take leads one at a time (or from any iterator)
+and keep memory constant: rows are buffered and written every batch_size
+leads, and the file is fsynced every fsync_every leads so a crash loses at
+most one checkpoint of results. Re-opening an existing file appends to it
+after dropping a partial last line left by a crash; CSV keeps the existing
+header. With a codec (see compressed_files.py) rows go through the
+compressor, and appending adds a new gzip member or zstd frame; a member
+or frame cut off by a crash is repaired first, which rewrites the file
+(one pass over it).
+
+CSV cells are converted like DataExporter's CSV (see LeadTable): lists and
+dicts are written as JSON. The repair is line-based, so a CSV whose cut-off
+last row had a quoted field with a line break keeps the start of that row.
+"""
+
+import csv
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from compressed_files import open_text, repair_compressed
+from json_io import dumps
+from lead_table import LeadTable
+
+
+# Column order of lead CSV files
+LEAD_COLUMNS = [
+    'place_id', 'name', 'address', 'phone', 'email', 'website',
+    'opening_hours', 'price_level',
+    'facebook', 'instagram', 'twitter', 'linkedin', 'youtube', 'tiktok', 'whatsapp_status',
+    'category', 'rating', 'reviews', 'latitude', 'longitude',
+    'maps_url', 'source_url', 'timestamp', 'labels'
+]
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FSYNC_EVERY = 5000
+
+
+class StreamWriter:
+    """Buffered writer that flushes in batches and fsyncs at checkpoints."""
+    
+    extension = ''
+    
+    def __init__(self, path, batch_size: int = DEFAULT_BATCH_SIZE,
+                 fsync_every: int = DEFAULT_FSYNC_EVERY, append: bool = True,
+                 codec: str = 'none', level: Optional[int] = None):
+        """
+        Open (or create) the output file.
+        
+        Args:
+            path: Output file path
+            batch_size: Leads buffered before they are written and flushed
+            fsync_every: Leads written between fsyncs (0: only on close)
+            append: Append to an existing file instead of replacing it
+            codec: Compression codec ('none', 'gzip' or 'zstd')
+            level: Compression level (codec default if None)
+        """
+        self.path = Path(path)
+        self.codec = codec
+        self.level = level
+        self.batch_size = max(1, batch_size)
+        self.fsync_every = fsync_every
+        self.rows = 0
+        self._buffer: List[Dict] = []
+        self._unsynced = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        existing = append and self.path.exists() and self.path.stat().st_size > 0
+        if existing:
+            self._repair()
+        self._open(existing)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def write(self, lead: Dict):
+        """Buffer one lead, writing the batch once it is full."""
+        self._buffer.append(lead)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+    
+    def write_many(self, leads: Iterable[Dict]) -> int:
+        """
+        Write every lead of an iterable.
+        
+        Args:
+            leads: Leads (any iterator; consumed lazily)
+        
+        Returns:
+            Number of leads written
+        """
+        count = 0
+        for lead in leads:
+            self.write(lead)
+            count += 1
+        return count
+    
+    def flush(self):
+        """Write buffered leads and flush them to the OS, fsyncing at checkpoints."""
+        self._drain()
+        if self.fsync_every and self._unsynced >= self.fsync_every:
+            self.checkpoint()
+    
+    def checkpoint(self):
+        """Write buffered leads and fsync the file to disk."""
+        self._drain()
+        os.fsync(self.file.fileno())
+        self._unsynced = 0
+    
+    def close(self):
+        """Checkpoint and close the file."""
+        if self.file.closed:
+            return
+        self.checkpoint()
+        self.file.close()
+    
+    def _drain(self):
+        if not self._buffer:
+            return
+        self._write_rows(self._buffer)
+        self.file.flush()
+        self.rows += len(self._buffer)
+        self._unsynced += len(self._buffer)
+        self._buffer = []
+    
+    def _open_file(self, mode: str, newline: Optional[str] = None):
+        return open_text(self.path, mode, self.codec, self.level, newline)
+    
+    def _repair(self):
+        """Cut an existing file back to its last complete line before appending."""
+        if self.codec == 'none':
+            drop_partial_line(self.path)
+        else:
+            repair_compressed(self.path, self.codec, self.level)
+    
+    def _open(self, existing: bool):
+        raise NotImplementedError
+    
+    def _write_rows(self, rows: List[Dict]):
+        raise NotImplementedError
+
+
+class CSVStreamWriter(StreamWriter):
+    """CSV with the LEAD_COLUMNS (or an existing file's) header."""
+    
+    extension = 'csv'
+    
+    def _open(self, existing: bool):
+        header = None
+        if existing:
+            with self._open_file('r', newline='') as f:
+                header = next(csv.reader(f), None)
+        # A file left without a complete header line is started over
+        self.columns = header or LEAD_COLUMNS
+        
+        self.file = self._open_file('a' if header else 'w', newline='')
+        self.writer = csv.writer(self.file)
+        if not header:
+            self.writer.writerow(self.columns)
+    
+    def _write_rows(self, rows: List[Dict]):
+        self.writer.writerows(LeadTable(rows).rows(self.columns))
+
+
+class JSONLStreamWriter(StreamWriter):
+    """Newline-delimited JSON, one lead per line."""
+    
+    extension = 'jsonl'
+    
+    def _open(self, existing: bool):
+        self.file = self._open_file('a' if existing else 'w')
+    
+    def _write_rows(self, rows: List[Dict]):
+        self.file.write(b''.join(dumps(row) + b'\n' for row in rows).decode('utf-8'))
+
+
+def drop_partial_line(path):
+    """Truncate a last line of a non-empty file that was cut off mid-write."""
+    with open(path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+        
+        position = size
+        while position > 0:
+            step = min(4096, position)
+            f.seek(position - step)
+            chunk = f.read(step)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                f.truncate(position - step + newline + 1)
+                return
+            position -= step
+        f.truncate(0)
+
+
+STREAM_WRITERS = {
+    'csv': CSVStreamWriter,
+    'jsonl': JSONLStreamWriter,
+}
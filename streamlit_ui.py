@@ -4,7 +4,6 @@ import requests
 import json
 import os
 import shutil
-import tempfile
 import time
 import random
 from datetime import datetime
@@ -20,6 +19,7 @@ from config import Config
 from utils import setup_logging
 from selenium_scraper import SeleniumScraper
 from exporter import DataExporter
+from compressed_files import CODEC_MIME_TYPES, ZSTD_AVAILABLE, codec_of
 from dedupe import Deduplicator
 from robots_checker import RobotsChecker
 from yelp_scraper import YelpScraper
@@ -1238,6 +1238,11 @@ def google_maps_scraping():
         default=["excel"],
         help="Select output formats. Excel includes CRM tracking columns."
     )
+    compression = st.selectbox(
+        "Compression",
+        ["none", "gzip"] + (["zstd"] if ZSTD_AVAILABLE else []),
+        help="Compress CSV and JSON downloads (.csv.gz, .json.zst); roughly 10x smaller for slow links."
+    )
     
     if st.button("🚀 Start Lead Generation", key="google_maps_start", use_container_width=True):
         if not query or not location:
@@ -1253,6 +1258,7 @@ def google_maps_scraping():
             config._config['robots']['enabled'] = False
             config._config['scraping']['default_delay'] = delay
             config._config['scraping']['max_leads_per_session'] = max_leads
+            config._config['export']['compression'] = compression
             
             logger = setup_logging(config)
             
@@ -1292,55 +1298,80 @@ def google_maps_scraping():
             status_text.markdown("### 💾 Preparing Download...")
             progress_bar.progress(90)
             
-            # Use temporary directory for export to avoid disk usage issues on Cloud
-            with tempfile.TemporaryDirectory() as temp_dir:
-                exporter = DataExporter(config, output_dir=temp_dir)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                
-                clean_query = "".join(x for x in query if x.isalnum() or x in " -_").strip().replace(" ", "_")
-                clean_loc = "".join(x for x in location if x.isalnum() or x in " -_").strip().replace(" ", "_")
-                base_filename = f"Leads_{clean_query}_{clean_loc}_{timestamp}"
-                
-                exported_files = exporter.export(
-                    data=unique_leads,
-                    formats=formats,
-                    filename=base_filename
-                )
-                
-                progress_bar.progress(100)
-                status_text.markdown("### ✅ Generation Complete!")
-                
-                st.success(f"Successfully generated {len(unique_leads)} unique leads (Raw: {len(leads)})")
-                
-                if unique_leads:
-                    df = pd.DataFrame(unique_leads)
-                    # Show preview (limit columns for UI)
-                    preview_cols = ['name', 'phone', 'email', 'website', 'address']
-                    st.dataframe(df[ [c for c in preview_cols if c in df.columns] ])
-                    
-                    # Download buttons - Read into memory immediately
-                    st.markdown("### 📥 Download Results" )
-                    cols = st.columns(len(exported_files))
-                    for idx, file_path in enumerate(exported_files):
-                        with cols[idx]:
-                            path_obj = Path(file_path)
-                            with open(file_path, 'rb') as f:
-                                file_data = f.read()
-                                
-                            st.download_button(
-                                label=f"Download {path_obj.suffix[1:].upper()}",
-                                data=file_data,
-                                file_name=path_obj.name,
-                                mime="application/octet-stream" if path_obj.suffix != '.xlsx' else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                                key=f"dl_{idx}"
-                            )
-                
-            # Temp dir is automatically cleaned up here
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            
+            clean_query = "".join(x for x in query if x.isalnum() or x in " -_").strip().replace(" ", "_")
+            clean_loc = "".join(x for x in location if x.isalnum() or x in " -_").strip().replace(" ", "_")
+            base_filename = f"Leads_{clean_query}_{clean_loc}_{timestamp}"
+            
+            # Nothing is written to disk: each format is built in memory when it is first downloaded
+            exporter = DataExporter(config)
+            st.session_state['google_maps_results'] = {
+                'export': exporter.export_memory(unique_leads, formats, base_filename),
+                'raw_count': len(leads),
+            }
+            
+            progress_bar.progress(100)
+            status_text.markdown("### ✅ Generation Complete!")
         
         except Exception as e:
             st.error(f"System Error: {str(e)}")
             import traceback
             st.code(traceback.format_exc())
+    
+    # Kept in the session so that choosing a format or downloading (both rerun the app) keeps the results
+    results = st.session_state.get('google_maps_results')
+    if results:
+        show_download_results(results['export'], results['raw_count'])
+
+def download_mime(file_name):
+    """MIME type of a download, by its suffixes."""
+    codec = codec_of(file_name)
+    if codec != 'none':
+        return CODEC_MIME_TYPES[codec]
+    if Path(file_name).suffix == '.xlsx':
+        return "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    return "application/octet-stream"
+
+def show_download_results(memory_export, raw_count):
+    """Show generated leads and a download button for the chosen format, built on first request."""
+    leads = memory_export.table.leads
+    st.success(f"Successfully generated {len(leads)} unique leads (Raw: {raw_count})")
+    if not leads or not memory_export.formats:
+        return
+    
+    df = pd.DataFrame(leads)
+    # Show preview (limit columns for UI)
+    preview_cols = ['name', 'phone', 'email', 'website', 'address']
+    st.dataframe(df[ [c for c in preview_cols if c in df.columns] ])
+    
+    st.markdown("### 📥 Download Results")
+    fmt = st.radio(
+        "Download Format",
+        memory_export.formats,
+        format_func=str.upper,
+        horizontal=True,
+        key="google_maps_download_format"
+    )
+    
+    # Only the chosen format is built (once; later reruns reuse it)
+    try:
+        exported = memory_export.file(fmt)
+    except Exception as e:
+        st.error(f"{fmt.upper()} export failed: {str(e)}")
+        return
+    if exported is None:
+        st.warning(f"{fmt.upper()} export is not available")
+        return
+    
+    file_name, file_data = exported
+    st.download_button(
+        label=f"Download {''.join(Path(file_name).suffixes)[1:].upper()}",
+        data=file_data,
+        file_name=file_name,
+        mime=download_mime(file_name),
+        key="dl_google_maps"
+    )
 
 def main():
     init_db()
@@ -0,0 +1,256 @@
+"""
+Yellow Pages HTTP Scraper Module
+Scrapes business data from Yellow Pages result listings with requests and lxml
+"""
+
+import time
+import logging
+import re
+from typing import List, Dict, Optional
+from urllib.parse import urlencode, urljoin
+
+import lxml.html
+
+from robots_checker import RobotsChecker
+from http_engine import HostRateLimiter, build_session, fetch_pages
+
+
+YELLOW_PAGES_BASE_URL = 'https://www.yellowpages.com'
+RESULTS_PER_PAGE = 30
+
+CONTAINER_SELECTORS = [
+    '.search-results .result',
+    '.container .result',
+    '.search-results li',
+    '.result'
+]
+
+LINK_SELECTORS = [
+    'a.business-name',
+    '.business-name',
+    'a[href*="/business/"]',
+    'a[href*="/ypgseo"]'
+]
+
+RATING_WORDS = {
+    'one': 1.0, 'two': 2.0, 'three': 3.0, 'four': 4.0, 'five': 5.0
+}
+
+
+class YellowPagesHttpScraper:
+    """HTTP-based scraper for extracting business leads from Yellow Pages.
+    
+    Yellow Pages result listings are server-rendered, so the result pages are
+    fetched in parallel with a per-host rate limit and parsed with lxml.
+    Produces the same lead dicts as ``YellowPagesScraper``.
+    """
+    
+    def __init__(self, config, delay=None, max_workers=None):
+        """Initialize the Yellow Pages HTTP scraper."""
+        self.config = config
+        self.delay = delay if delay is not None else config.scraping.get('http_host_interval', 0.5)
+        self.max_workers = max_workers or config.scraping.get('http_workers', 4)
+        self.timeout = config.scraping.get('request_timeout', 30)
+        self.logger = logging.getLogger(__name__)
+        self.session = build_session(config, pool_size=self.max_workers)
+        self.rate_limiter = HostRateLimiter(self.delay)
+        self.robots_checker = RobotsChecker(config)
+    
+    def scrape_yellow_pages(
+        self,
+        query: str,
+        location: str,
+        max_results: int = 50
+    ) -> List[Dict]:
+        """Scrape business leads from Yellow Pages result pages."""
+        page_urls = self._build_search_urls(query, location, max_results)
+        self.rate_limiter.respect_crawl_delay(self.robots_checker, YELLOW_PAGES_BASE_URL)
+        self.logger.info(
+            f"Fetching {len(page_urls)} Yellow Pages result pages for: {query} in {location}"
+        )
+        
+        pages = fetch_pages(
+            self.session,
+            page_urls,
+            timeout=self.timeout,
+            max_workers=self.max_workers,
+            rate_limiter=self.rate_limiter
+        )
+        
+        leads = []
+        processed_names = set()
+        
+        for page_url, html in zip(page_urls, pages):
+            if not html:
+                continue
+            
+            for business_data in self._parse_results_page(html, page_url):
+                if len(leads) >= max_results:
+                    break
+                
+                name = business_data['name']
+                if name not in processed_names:
+                    leads.append(business_data)
+                    processed_names.add(name)
+                    self.logger.debug(f"✓ Extracted: {name}")
+        
+        self.logger.info(f"✓ Extracted {len(leads)} businesses from Yellow Pages")
+        
+        return leads
+    
+    def _build_search_urls(self, query: str, location: str, max_results: int) -> List[str]:
+        """Build the paginated search URLs needed to cover max_results."""
+        page_count = max(1, -(-max_results // RESULTS_PER_PAGE))
+        
+        return [
+            f"{YELLOW_PAGES_BASE_URL}/search?" + urlencode({
+                'search_terms': query,
+                'geo_location_terms': location,
+                'page': page
+            })
+            for page in range(1, page_count + 1)
+        ]
+    
+    def _parse_results_page(self, html: str, page_url: str) -> List[Dict]:
+        """Parse all result containers on a single listing page."""
+        tree = lxml.html.fromstring(html)
+        
+        containers = []
+        for selector in CONTAINER_SELECTORS:
+            containers = tree.cssselect(selector)
+            if containers:
+                self.logger.debug(f"Found {len(containers)} result containers with {selector}")
+                break
+        
+        if not containers:
+            containers = tree.cssselect('div[data-track-component]')
+        
+        results = []
+        for idx, container in enumerate(containers):
+            try:
+                business_data = self._extract_business_from_container(container, page_url)
+                if business_data and business_data.get('name'):
+                    results.append(business_data)
+            except Exception as e:
+                self.logger.debug(f"Error processing container {idx}: {e}")
+                continue
+        
+        return results
+    
+    def _extract_business_from_container(self, container, page_url: str) -> Optional[Dict]:
+        """Extract business details from a single result container."""
+        link_element = None
+        for selector in LINK_SELECTORS:
+            matches = container.cssselect(selector)
+            if matches:
+                link_element = matches[0]
+                break
+        
+        if link_element is None:
+            return None
+        
+        name = _text(link_element) or link_element.get('title')
+        if not name:
+            return None
+        
+        href = link_element.get('href')
+        
+        return {
+            'name': name,
+            'address': extract_address(container),
+            'phone': extract_phone(container),
+            'rating': extract_rating(container),
+            'reviews': extract_review_count(container),
+            'category': extract_category(container),
+            'website': extract_website(container),
+            'yellow_pages_url': urljoin(YELLOW_PAGES_BASE_URL, href) if href else None,
+            'source_url': page_url,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'latitude': None,
+            'longitude': None,
+            'email': None,  # Yellow Pages doesn't typically show emails
+            'labels': 'Yellow Pages'
+        }
+    
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
+
+
+def extract_address(container) -> Optional[str]:
+    """Extract address from a result container (see YellowPagesScraper._extract_address)."""
+    for selector in ['.adr', '.street-address', '.address', '[data-automation="address"]']:
+        for element in container.cssselect(selector):
+            address = _text(element)
+            if address:
+                return address
+    return None
+
+
+def extract_phone(container) -> Optional[str]:
+    """Extract phone from a result container (see YellowPagesScraper._extract_phone)."""
+    for selector in ['.phone', '[data-automation="phone"]', '.tel']:
+        for element in container.cssselect(selector):
+            phone = _text(element)
+            if phone and phone.startswith('('):
+                return phone
+    return None
+
+
+def extract_rating(container) -> Optional[float]:
+    """Extract rating from a result container (see YellowPagesScraper._extract_rating).
+    
+    Falls back to the word-based rating classes (``result-rating four half``)
+    used by the server-rendered listing markup.
+    """
+    for selector in ['.rating', '.star', '[data-automation*="rating"]']:
+        for element in container.cssselect(selector):
+            aria_label = element.get('aria-label')
+            if aria_label and 'star' in aria_label.lower():
+                rating_match = re.search(r'(\d+\.?\d*)', aria_label)
+                if rating_match:
+                    return float(rating_match.group(1))
+    
+    for element in container.cssselect('.result-rating'):
+        classes = element.get('class', '').split()
+        for word, value in RATING_WORDS.items():
+            if word in classes:
+                return value + 0.5 if 'half' in classes else value
+    return None
+
+
+def extract_review_count(container) -> Optional[int]:
+    """Extract review count from a result container."""
+    for selector in ['.count', '[data-automation*="review"]']:
+        for element in container.cssselect(selector):
+            text = _text(element)
+            if 'review' in text.lower():
+                count_match = re.search(r'(\d+)', text)
+                if count_match:
+                    return int(count_match.group(1))
+    return None
+
+
+def extract_category(container) -> Optional[str]:
+    """Extract business category from a result container."""
+    for selector in ['.categories', '.categories a', '[data-automation="categories"]']:
+        for element in container.cssselect(selector):
+            category = _text(element)
+            if category and len(category) < 100:  # Filter out overly long text
+                return category
+    return None
+
+
+def extract_website(container) -> Optional[str]:
+    """Extract website from a result container."""
+    for selector in ['.website-link', 'a.track-visit-website', 'a[href*="redirect"]', '[data-automation="website"]']:
+        for element in container.cssselect(selector):
+            website = element.get('href')
+            if website:
+                return website
+    return None
+
+
+def _text(element) -> str:
+    """Return the whitespace-normalized text content of an element."""
+    return ' '.join(element.text_content().split())
@@ -0,0 +1,288 @@
+"""
+Yelp HTTP Scraper Module
+Scrapes business data from Yelp search result pages without a browser
+"""
+
+import time
+import logging
+import re
+from typing import List, Dict, Optional
+from urllib.parse import urlencode, urljoin
+
+from bs4 import BeautifulSoup
+
+from robots_checker import RobotsChecker
+from http_engine import HTML_PARSER, HostRateLimiter, build_session, fetch_pages
+
+
+YELP_BASE_URL = 'https://www.yelp.com'
+RESULTS_PER_PAGE = 10
+
+LISTING_SELECTORS = [
+    '[data-testid^="list-item"]',
+    '.search-result',
+    'li[data-testid*="list-item"]',
+    'div[class*="card"]'
+]
+
+LINK_SELECTORS = [
+    'a[href*="/biz/"]',
+    '.css-166la90',
+    '.lemon--a__373c0__IEZFH',
+    'a[class*="business"]'
+]
+
+NAME_SELECTORS = [
+    '.css-117cl8u',
+    '.lemon--h3__373c0__5QNBI',
+    'h3',
+    '.css-1eehyxz'
+]
+
+ADDRESS_SELECTORS = [
+    '[class*="display-address"]',
+    '.css-1ernp56',
+    '.lemon--span__373c0__3997G'
+]
+
+PHONE_SELECTORS = [
+    '[class*="phone"]'
+]
+
+PHONE_PATTERN = re.compile(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+
+
+class YelpHttpScraper:
+    """HTTP-based scraper for extracting business leads from Yelp search pages.
+    
+    Builds the paginated search URLs directly and fetches them concurrently
+    through a pooled session, so no browser is needed. Produces the same lead
+    dicts as ``YelpScraper`` and can be used in its place.
+    """
+    
+    def __init__(self, config, delay=None, max_workers=None, fetch_details=False):
+        """Initialize the Yelp HTTP scraper."""
+        self.config = config
+        self.delay = delay if delay is not None else config.scraping.get('http_host_interval', 0.5)
+        self.max_workers = max_workers or config.scraping.get('http_workers', 4)
+        self.fetch_details = fetch_details
+        self.timeout = config.scraping.get('request_timeout', 30)
+        self.logger = logging.getLogger(__name__)
+        self.session = build_session(config, pool_size=self.max_workers)
+        self.rate_limiter = HostRateLimiter(self.delay)
+        self.robots_checker = RobotsChecker(config)
+    
+    def scrape_yelp(
+        self,
+        query: str,
+        location: str,
+        max_results: int = 50
+    ) -> List[Dict]:
+        """Scrape business leads from Yelp search result pages."""
+        page_urls = self._build_search_urls(query, location, max_results)
+        self.rate_limiter.respect_crawl_delay(self.robots_checker, YELP_BASE_URL)
+        self.logger.info(
+            f"Fetching {len(page_urls)} Yelp result pages for: {query} in {location}"
+        )
+        
+        pages = fetch_pages(
+            self.session,
+            page_urls,
+            timeout=self.timeout,
+            max_workers=self.max_workers,
+            rate_limiter=self.rate_limiter
+        )
+        
+        leads = []
+        processed_names = set()
+        
+        for page_url, html in zip(page_urls, pages):
+            if not html:
+                continue
+            
+            for business_data in self._parse_results_page(html, page_url):
+                if len(leads) >= max_results:
+                    break
+                
+                name = business_data['name']
+                if name not in processed_names:
+                    leads.append(business_data)
+                    processed_names.add(name)
+                    self.logger.debug(f"✓ Extracted: {name}")
+        
+        if self.fetch_details:
+            self._fill_from_business_pages(leads)
+        
+        self.logger.info(f"✓ Extracted {len(leads)} businesses from Yelp")
+        
+        return leads
+    
+    def _build_search_urls(self, query: str, location: str, max_results: int) -> List[str]:
+        """Build the paginated search URLs needed to cover max_results."""
+        page_count = max(1, -(-max_results // RESULTS_PER_PAGE))
+        
+        return [
+            f"{YELP_BASE_URL}/search?" + urlencode({
+                'find_desc': query,
+                'find_loc': location,
+                'start': page * RESULTS_PER_PAGE
+            })
+            for page in range(page_count)
+        ]
+    
+    def _parse_results_page(self, html: str, page_url: str) -> List[Dict]:
+        """Parse all business cards on a single search result page."""
+        soup = BeautifulSoup(html, HTML_PARSER)
+        
+        cards = []
+        for selector in LISTING_SELECTORS:
+            cards = soup.select(selector)
+            if cards:
+                self.logger.debug(f"Found {len(cards)} listings with {selector}")
+                break
+        
+        results = []
+        for idx, card in enumerate(cards):
+            try:
+                business_data = self._extract_business_from_card(card, page_url)
+                if business_data and business_data.get('name'):
+                    results.append(business_data)
+            except Exception as e:
+                self.logger.debug(f"Error processing card {idx}: {e}")
+                continue
+        
+        return results
+    
+    def _extract_business_from_card(self, card, page_url: str) -> Optional[Dict]:
+        """Extract business details from a single result card."""
+        link_element = _select_first(card, LINK_SELECTORS)
+        if link_element is None:
+            return None
+        
+        name = None
+        name_elem = _select_first(link_element, NAME_SELECTORS)
+        if name_elem is not None:
+            name = name_elem.get_text(strip=True)
+        
+        if not name:
+            name = (
+                link_element.get('aria-label')
+                or link_element.get('title')
+                or link_element.get_text(strip=True)
+            )
+        
+        if not name:
+            return None
+        
+        href = link_element.get('href')
+        
+        return {
+            'name': name,
+            'address': _select_text(card, ADDRESS_SELECTORS),
+            'phone': _select_text(card, PHONE_SELECTORS) or self._extract_phone_from_text(card),
+            'rating': self._extract_rating(card),
+            'reviews': self._extract_review_count(card),
+            'category': self._extract_category(card),
+            'website': None,
+            'yelp_url': urljoin(YELP_BASE_URL, href) if href else None,
+            'source_url': page_url,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'latitude': None,
+            'longitude': None,
+            'email': None,  # Yelp doesn't typically show emails
+            'labels': 'Yelp'
+        }
+    
+    def _fill_from_business_pages(self, leads: List[Dict]):
+        """Fetch business pages concurrently to fill missing address/phone/website."""
+        pending = [
+            lead for lead in leads
+            if lead.get('yelp_url') and not (lead['address'] and lead['phone'] and lead['website'])
+        ]
+        if not pending:
+            return
+        
+        self.logger.info(f"Fetching {len(pending)} Yelp business pages for missing details...")
+        pages = fetch_pages(
+            self.session,
+            [lead['yelp_url'] for lead in pending],
+            timeout=self.timeout,
+            max_workers=self.max_workers,
+            rate_limiter=self.rate_limiter
+        )
+        
+        for lead, html in zip(pending, pages):
+            if not html:
+                continue
+            soup = BeautifulSoup(html, HTML_PARSER)
+            lead['address'] = lead['address'] or _select_text(soup, [
+                '[class*="display-address"]',
+                '.css-1ernp56'
+            ])
+            lead['phone'] = lead['phone'] or _select_text(soup, [
+                '[class*="phone"]',
+                '[data-font-weight="bold"]'
+            ])
+            lead['website'] = lead['website'] or _select_text(soup, [
+                'a[href*="biz_redir"]',
+                'a[target="_blank"][rel="noopener nofollow"]'
+            ])
+    
+    def _extract_phone_from_text(self, card) -> Optional[str]:
+        """Find a phone number in the card text when no phone element exists."""
+        match = PHONE_PATTERN.search(card.get_text(' ', strip=True))
+        return match.group(0) if match else None
+    
+    def _extract_rating(self, card) -> Optional[float]:
+        """Extract rating from card."""
+        for selector in ['[class*="star-rating"]', '[aria-label*="star"]', '.css-1umhvfw']:
+            for rating_elem in card.select(selector):
+                aria_label = rating_elem.get('aria-label')
+                if aria_label and 'star' in aria_label.lower():
+                    rating_match = re.search(r'(\d+\.?\d*)', aria_label)
+                    if rating_match:
+                        return float(rating_match.group(1))
+        return None
+    
+    def _extract_review_count(self, card) -> Optional[int]:
+        """Extract review count from card."""
+        for selector in ['[class*="review-count"]', 'span', '.css-1eehyxz']:
+            for review_elem in card.select(selector):
+                text = review_elem.get_text(strip=True)
+                if 'review' in text.lower():
+                    count_match = re.search(r'(\d[\d,]*)', text)
+                    if count_match:
+                        return int(count_match.group(1).replace(',', ''))
+        return None
+    
+    def _extract_category(self, card) -> Optional[str]:
+        """Extract business category from card."""
+        for selector in ['[class*="price-category"]', '[class*="category"]', '.css-1vmcuad']:
+            text = _select_text(card, [selector])
+            if text and len(text) < 100:  # Filter out overly long text
+                return text
+        return None
+    
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
+
+
+def _select_first(element, selectors):
+    """Return the first element matching any of the selectors."""
+    for selector in selectors:
+        match = element.select_one(selector)
+        if match is not None:
+            return match
+    return None
+
+
+def _select_text(element, selectors) -> Optional[str]:
+    """Return the first non-empty text matching any of the selectors."""
+    for selector in selectors:
+        match = element.select_one(selector)
+        if match is not None:
+            text = match.get_text(' ', strip=True)
+            if text:
+                return text
+    return None